@@ -1,22 +1,50 @@
-import pyautogui
-import keyboard
 import time
+# Açılış süresi modülün yüklenmeye başladığı andan itibaren ölçülür
+MODULE_STARTED = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk, Frame, messagebox, simpledialog, filedialog
 import sys
 import threading
-import json
 import os
-from dataclasses import dataclass
+import queue
+from dataclasses import replace
 from typing import Optional
 
-@dataclass
-class Point:
-    x: int
-    y: int
+from autosave import AutosaveService, load_project_with_journal
+from engine import ExecutionEngine, ExecutionQueue, compile_plan
+from display import anchor_code, display_config_from_tk, settings_transform
+from hotkeys import HotkeyRegistry
+from input_backends import BACKEND_NAMES, create_backend, format_input_stats
+from models import ANCHORS, TEXT_MODES, Point, append_slots, new_set_data, parse_region
+from recorder import MACRO_EXTENSION, MacroRecorder, recording_to_set, save_recording
+from screen import (CONDITION_COLOR, CONDITION_HASH, DEFAULT_CAPTURE_AGE_MS, DEFAULT_POLL_MS,
+                    ScreenCapture, ScreenCondition, clip_region, format_capture_stats, region_hash)
+from startup import STARTUP_BUDGET_MS, LazyModule, StartupTimer
+from telemetry import TELEMETRY_FORMATS, format_telemetry_summary
+
+# Ağır giriş modülleri pencere açıldıktan sonra, ilk kullanımda yüklenir
+pyautogui = LazyModule('pyautogui')
+keyboard = LazyModule('keyboard')
+
+# Koordinat listesinde aynı anda çizilen satır sayısı; widget'lar bu havuzdan yeniden kullanılır
+VISIBLE_COORDINATE_ROWS = 20
+# Değişikliklerin arka planda günlüğe yazılma aralığı
+AUTOSAVE_INTERVAL_MS = 2000
+# Çalışmayı UI thread'ini beklemeden durduran tuş
+EMERGENCY_STOP_KEY = 'esc'
+# Gecikme butonlarının adımı ve en küçük gecikme (ms)
+DELAY_STEP_MS = 100
+# Durdurulan motorun thread'inin bitmesi için beklenen en uzun süre (sn)
+ENGINE_STOP_TIMEOUT = 1.0
 
 class AutoClickerApp:
-    def __init__(self):
+    def __init__(self, startup=None, on_first_paint=None):
+        # Açılış ölçümü: içe aktarma, arayüz kurulumu ve ilk çizim
+        self.startup = startup if startup is not None else StartupTimer(MODULE_STARTED)
+        self.startup.mark('import')
+        self.on_first_paint = on_first_paint
+        
         # Renkler
         self.colors = {
             'bg': '#F5F7FA',  # Açık gri arka plan
@@ -93,6 +121,11 @@ class AutoClickerApp:
         self.set_buttons = []
         self.text_entries = []  # Metin girişi için yeni liste
         
+        # Sanal koordinat listesi: satır havuzu, ilk görünen indeks ve satırların son çizilen durumu
+        self.coordinate_rows = []
+        self.coordinates_offset = 0
+        self.row_cache = []
+        
         # Varsayılan değerler
         self.delay_times = ['0.5'] * 20
         
@@ -100,26 +133,53 @@ class AutoClickerApp:
         self.running = False
         self.paused = False
         self.recording_mode = False
-        self.current_queue_index = 0
-        self.execution_queue = []
+        self.macro_recorder = None  # Makro kaydı sürerken MacroRecorder
+        self.current_entry = None
+        self.execution_queue = ExecutionQueue()
+        self.queue_items = {}  # entry_id -> kuyruk elemanı widget'ı
         self.update_mode = None
         self.current_loop = 0
         self.current_coord = 0
+        self.engine = None
+        self.stopping_engine = None  # Durdurulan ama thread'i henüz bitmemiş motor
+        self.engine_status = queue.Queue()
+        self.engine_poll_job = None
+        self.last_telemetry = None  # Son çalışmanın adım ölçümleri (telemetry.StepTelemetry)
+        
+        # Projeye özel çalışma ayarları
+        self.project_settings = {
+            'fast_input': False,  # pyautogui PAUSE/FAILSAFE yükünü atla
+            'input_pause': 0.0,  # Hızlı modda her giriş işleminden sonraki bekleme (sn)
+            'input_backend': 'pyautogui',  # Giriş arka ucu (pyautogui, xtest, recording, null)
+            'text_mode': 'type',  # Metin yazma modu (type, paste, batch); adımda değiştirilebilir
+            'text_interval': 0.0,  # Toplu yazmada karakterler arası bekleme (sn)
+            'wait_poll': DEFAULT_POLL_MS / 1000,  # Bekleme koşullarının yoklama aralığı (sn)
+            'capture_max_age': DEFAULT_CAPTURE_AGE_MS / 1000,  # Paylaşılan ekran görüntüsünün en büyük yaşı (sn)
+            'reference_screen': None  # Koordinatların kaydedildiği ekran (display.DisplayConfig.to_value)
+        }
         
         # İlk seti oluştur
-        self.sets[1] = {
-            'name': "Set 1",
-            'coordinates': [None] * 20,
-            'names': [f"K {i+1}" for i in range(20)],
-            'clicks': ['left'] * 20,
-            'delays': [f"{0.5:.1f}"] * 20,  # Varsayılan gecikme süresi float formatında
-            'order': list(range(20)),
-            'loop_count': 1,
-            'texts': [''] * 20
-        }
+        self.sets[1] = new_set_data("Set 1")
+        
+        # Global kısayollar: modlara göre gruplar halinde bağlanır
+        self.hotkeys = HotkeyRegistry(keyboard)
+        
+        # Otomatik kayıt: çalışma sırasında yalnızca günlüğe yazar
+        self.autosave = AutosaveService(is_busy=lambda: self.running)
         
         # UI kurulumu
+        self.startup.mark('init')
         self.setup_ui()
+        self.startup.mark('setup_ui')
+        self.root.after_idle(self.first_paint_done)
+        self.root.after(AUTOSAVE_INTERVAL_MS, self.autosave_tick)
+
+    def first_paint_done(self):
+        """Pencere ilk kez çizildiğinde açılış ölçümünü tamamlar"""
+        self.root.update_idletasks()
+        self.startup.mark('first_paint')
+        if self.on_first_paint is not None:
+            self.on_first_paint(self)
 
     def setup_ui(self):
         # Menü çubuğu
@@ -133,6 +193,7 @@ class AutoClickerApp:
         file_menu.add_command(label="Aç...", command=self.open_file)
         file_menu.add_command(label="Kaydet", command=self.save_file)
         file_menu.add_command(label="Farklı Kaydet...", command=self.save_as_file)
+        file_menu.add_command(label="Adım Ölçümlerini Dışa Aktar...", command=self.export_telemetry)
         file_menu.add_separator()
         file_menu.add_command(label="Çıkış", command=self.root.quit)
         
@@ -190,6 +251,21 @@ class AutoClickerApp:
         )
         self.coordinate_mode_button.pack(side=tk.LEFT, padx=self.styles['spacing'])
         
+        # Makro kaydı: tıklamalar ve yazılan metinler yeni bir sete çevrilir
+        self.macro_button = tk.Button(
+            top_frame,
+            text="⏺ Makro Kaydı",
+            command=self.toggle_macro_recording,
+            bg=self.colors['bg'],
+            fg=self.colors['text'],
+            font=(self.styles['font_family'], self.styles['button_font_size'], 'bold'),
+            width=16,
+            relief=tk.RAISED,
+            bd=1,
+            cursor='hand2'
+        )
+        self.macro_button.pack(side=tk.LEFT, padx=self.styles['spacing'])
+        
         # Döngü sayısı için frame
         loop_frame = ttk.Frame(top_frame)
         loop_frame.pack(side=tk.LEFT, padx=30)
@@ -205,139 +281,52 @@ class AutoClickerApp:
         self.loop_count_entry.bind('<FocusOut>', lambda e: (self.save_loop_count(), self.root.focus()))
         self.loop_count_entry.bind('<Return>', lambda e: (self.save_loop_count(), self.root.focus()))
         
-        # Koordinat listesi için frame
-        coordinates_list_frame = ttk.Frame(coordinates_frame)
-        coordinates_list_frame.grid(row=1, column=0, sticky="nsew")
-        
-        # Sol ve sağ sütunlar için ayrı frame'ler oluştur
-        left_column = ttk.Frame(coordinates_list_frame)
-        right_column = ttk.Frame(coordinates_list_frame)
-        left_column.grid(row=0, column=0, sticky="nsew", padx=5)
-        right_column.grid(row=0, column=1, sticky="nsew", padx=5)
-        
-        # Grid ağırlıklarını ayarla
-        coordinates_list_frame.grid_columnconfigure(0, weight=1)
-        coordinates_list_frame.grid_columnconfigure(1, weight=1)
+        # Koordinat ekleme butonu
+        add_coord_btn = tk.Button(
+            top_frame,
+            text="+ 10 Koordinat",
+            command=lambda: self.add_coordinate_slots(10),
+            bg=self.colors['success'],
+            fg='white',
+            font=(self.styles['font_family'], self.styles['button_font_size']),
+            relief=tk.RAISED,
+            bd=1,
+            cursor='hand2'
+        )
+        add_coord_btn.pack(side=tk.LEFT, padx=self.styles['spacing'])
+        
+        # Koordinat listesi: sabit sayıda satır, kaydırıldıkça farklı koordinatlara bağlanır
+        list_container = ttk.Frame(coordinates_frame)
+        list_container.grid(row=1, column=0, sticky="nsew")
+        list_container.grid_rowconfigure(0, weight=1)
+        list_container.grid_columnconfigure(0, weight=1)
+        
+        self.coordinates_list_frame = ttk.Frame(list_container)
+        self.coordinates_list_frame.grid(row=0, column=0, sticky="nsew")
+        self.coordinates_scrollbar = ttk.Scrollbar(
+            list_container,
+            orient=tk.VERTICAL,
+            command=self.scroll_coordinates
+        )
+        self.coordinates_scrollbar.grid(row=0, column=1, sticky="ns")
+        self.bind_coordinates_wheel(self.coordinates_list_frame)
         
         # Başlık satırı
         headers = ["Koordinat", "Tıklama", "Metin", "Gecikme", "Sıra", "Git", "Güncelle"]
         header_widths = [20, 8, 15, 8, 5, 5, 8]  # Tıklama sütunu için genişliği azalttık
         
-        # Her sütun için başlıkları ekle
-        for col in [left_column, right_column]:
-            for i, (header, width) in enumerate(zip(headers, header_widths)):
-                header_label = ttk.Label(
-                    col, 
-                    text=header, 
-                    width=width,
-                    font=(self.styles['font_family'], self.styles['header_font_size'], 'bold')
-                )
-                header_label.grid(row=0, column=i, padx=2, pady=(0, 10))
-        
-        # Koordinat listesi
-        for i in range(20):
-            # Hangi sütunda olacağını belirle
-            current_frame = left_column if i < 10 else right_column
-            row = (i % 10) + 1
-            
-            # Koordinat etiketi
-            coord_label = ttk.Label(current_frame, text=f"K {i+1}: ", width=15)
-            coord_label.grid(row=row, column=0, padx=2, pady=2, sticky="w")
-            coord_label.bind('<Double-Button-1>', lambda e, idx=i: self.start_edit_label(e, idx))
-            self.coordinates_labels.append(coord_label)
-            
-            # Tıklama butonları için frame
-            click_frame = ttk.Frame(current_frame)
-            click_frame.grid(row=row, column=1, padx=2, pady=2)
-            
-            # Sol tık butonu
-            left_btn = tk.Button(
-                click_frame,
-                text="◀",  # Sol ok işareti
-                command=lambda x=i: self.toggle_click_type(x, 'left'),
-                width=2,
-                bg=self.colors['primary'],
-                fg='white',
-                font=(self.styles['font_family'], 8),
-                relief=tk.FLAT,
-                cursor='hand2'
-            )
-            left_btn.pack(side=tk.LEFT, padx=1)
-            self.left_buttons.append(left_btn)
-            
-            # Sağ tık butonu
-            right_btn = tk.Button(
-                click_frame,
-                text="▶",  # Sağ ok işareti
-                command=lambda x=i: self.toggle_click_type(x, 'right'),
-                width=2,
-                bg=self.colors['bg'],
-                fg=self.colors['text'],
-                font=(self.styles['font_family'], 8),
-                relief=tk.RAISED,
-                cursor='hand2'
+        for i, (header, width) in enumerate(zip(headers, header_widths)):
+            header_label = ttk.Label(
+                self.coordinates_list_frame, 
+                text=header, 
+                width=width,
+                font=(self.styles['font_family'], self.styles['header_font_size'], 'bold')
             )
-            right_btn.pack(side=tk.LEFT, padx=1)
-            self.right_buttons.append(right_btn)
-            
-            # Double click butonu
-            double_btn = tk.Button(
-                click_frame,
-                text="⚡",  # Yıldırım işareti
-                command=lambda x=i: self.toggle_click_type(x, 'double'),
-                width=2,
-                bg=self.colors['bg'],
-                fg=self.colors['text'],
-                font=(self.styles['font_family'], 8),
-                relief=tk.RAISED,
-                cursor='hand2'
-            )
-            double_btn.pack(side=tk.LEFT, padx=1)
-            self.double_buttons.append(double_btn)
-            
-            # Metin girişi alanı
-            text_entry = ttk.Entry(current_frame, width=15)
-            text_entry.grid(row=row, column=2, padx=2, pady=2)
-            text_entry.bind('<Return>', self.clear_focus)
-            self.text_entries.append(text_entry)
-            
-            # Gecikme süresi girişi
-            delay_entry = ttk.Entry(current_frame, width=8)
-            delay_entry.insert(0, "0.5")
-            delay_entry.grid(row=row, column=3, padx=2, pady=2)
-            delay_entry.bind('<Return>', self.clear_focus)
-            self.delay_entries.append(delay_entry)
-            
-            # Sıra numarası girişi
-            order_entry = ttk.Entry(current_frame, width=5)
-            order_entry.insert(0, str(i))
-            order_entry.grid(row=row, column=4, padx=2, pady=2)
-            order_entry.bind('<Return>', self.clear_focus)
-            self.order_entries.append(order_entry)
-            
-            # Git butonu
-            goto_btn = tk.Button(
-                current_frame,
-                text="Git",
-                command=lambda x=i: self.goto_coordinate(x),
-                width=5,
-                relief=tk.FLAT,
-                cursor='hand2'
-            )
-            goto_btn.grid(row=row, column=5, padx=2, pady=2)
-            self.goto_buttons.append(goto_btn)
-            
-            # Güncelle butonu
-            update_btn = tk.Button(
-                current_frame,
-                text="Güncelle",
-                command=lambda x=i: self.update_coordinate(x),
-                width=8,
-                relief=tk.FLAT,
-                cursor='hand2'
-            )
-            update_btn.grid(row=row, column=6, padx=2, pady=2)
-            self.update_buttons.append(update_btn)
+            header_label.grid(row=0, column=i, padx=2, pady=(0, 10))
+        
+        # Satır havuzunu oluştur
+        for r in range(VISIBLE_COORDINATE_ROWS):
+            self.create_coordinate_row(r)
         
         # Kontrol paneli
         control_panel = ttk.LabelFrame(main_frame, text="Kontrol Paneli", padding="15")
@@ -374,6 +363,66 @@ class AutoClickerApp:
             cursor='hand2'
         )
         self.pause_button.grid(row=0, column=4, padx=self.styles['spacing'])
+        
+        # Hızlı giriş modu
+        self.fast_input_var = tk.BooleanVar(value=self.project_settings['fast_input'])
+        fast_input_check = ttk.Checkbutton(
+            control_panel,
+            text="⚡ Hızlı Giriş",
+            variable=self.fast_input_var,
+            command=self.save_input_settings
+        )
+        fast_input_check.grid(row=0, column=5, padx=self.styles['spacing'])
+        
+        # Hızlı modda giriş işlemleri arası bekleme
+        ttk.Label(control_panel, text="Giriş Aralığı (sn):").grid(row=0, column=6, padx=(0, 5))
+        self.input_pause_entry = ttk.Entry(control_panel, width=6)
+        self.input_pause_entry.insert(0, str(self.project_settings['input_pause']))
+        self.input_pause_entry.grid(row=0, column=7)
+        self.input_pause_entry.bind('<FocusOut>', lambda e: self.save_input_settings())
+        self.input_pause_entry.bind('<Return>', lambda e: (self.save_input_settings(), self.root.focus()))
+        
+        # Giriş arka ucu seçimi
+        ttk.Label(control_panel, text="Giriş:").grid(row=0, column=8, padx=(self.styles['spacing'], 5))
+        self.input_backend_var = tk.StringVar(value=self.project_settings['input_backend'])
+        input_backend_combo = ttk.Combobox(
+            control_panel,
+            textvariable=self.input_backend_var,
+            values=BACKEND_NAMES,
+            state='readonly',
+            width=10
+        )
+        input_backend_combo.grid(row=0, column=9)
+        input_backend_combo.bind('<<ComboboxSelected>>', lambda e: self.save_input_settings())
+        
+        # Metin yazma modu (adımlarda sağ tıkla değiştirilebilir)
+        ttk.Label(control_panel, text="Metin:").grid(row=1, column=5, padx=(self.styles['spacing'], 5))
+        self.text_mode_var = tk.StringVar(value=self.project_settings['text_mode'])
+        text_mode_combo = ttk.Combobox(
+            control_panel,
+            textvariable=self.text_mode_var,
+            values=TEXT_MODES,
+            state='readonly',
+            width=8
+        )
+        text_mode_combo.grid(row=1, column=6, pady=(5, 0))
+        text_mode_combo.bind('<<ComboboxSelected>>', lambda e: self.save_input_settings())
+        
+        # Toplu yazmada karakterler arası bekleme
+        ttk.Label(control_panel, text="Karakter Aralığı (sn):").grid(row=1, column=7, padx=(self.styles['spacing'], 5))
+        self.text_interval_entry = ttk.Entry(control_panel, width=6)
+        self.text_interval_entry.insert(0, str(self.project_settings['text_interval']))
+        self.text_interval_entry.grid(row=1, column=8, pady=(5, 0))
+        self.text_interval_entry.bind('<FocusOut>', lambda e: self.save_input_settings())
+        self.text_interval_entry.bind('<Return>', lambda e: (self.save_input_settings(), self.root.focus()))
+
+        # Bekleme koşullarının yoklama aralığı
+        ttk.Label(control_panel, text="Yoklama (sn):").grid(row=1, column=9, padx=(self.styles['spacing'], 5))
+        self.wait_poll_entry = ttk.Entry(control_panel, width=6)
+        self.wait_poll_entry.insert(0, str(self.project_settings['wait_poll']))
+        self.wait_poll_entry.grid(row=1, column=10, pady=(5, 0))
+        self.wait_poll_entry.bind('<FocusOut>', lambda e: self.save_input_settings())
+        self.wait_poll_entry.bind('<Return>', lambda e: (self.save_input_settings(), self.root.focus()))
 
         # İşlem Kuyruğu Frame'i
         queue_frame = ttk.LabelFrame(main_frame, text="İşlem Kuyruğu", padding="20")
@@ -409,6 +458,470 @@ class AutoClickerApp:
         # Root frame'e click event ekle
         self.root.bind('<Button-1>', self.clear_focus)
 
+    def create_coordinate_row(self, r):
+        """Satır havuzuna r. satırın widget'larını ekler
+
+        Satır sabit bir koordinata ait değildir; komutlar o an bağlı olan
+        koordinatın indeksini coordinates_offset + r ile bulur.
+        """
+        current_frame = self.coordinates_list_frame
+        row = r + 1
+        
+        # Koordinat etiketi
+        coord_label = ttk.Label(current_frame, text="", width=15)
+        coord_label.grid(row=row, column=0, padx=2, pady=2, sticky="w")
+        coord_label.bind('<Double-Button-1>', lambda e, r=r: self.start_edit_label(e, self.coordinates_offset + r))
+        coord_label.bind('<Button-3>', lambda e, r=r: self.show_anchor_menu(e, r))
+        self.coordinates_labels.append(coord_label)
+        
+        # Tıklama butonları için frame
+        click_frame = ttk.Frame(current_frame)
+        click_frame.grid(row=row, column=1, padx=2, pady=2)
+        
+        # Sol tık butonu
+        left_btn = tk.Button(
+            click_frame,
+            text="◀",  # Sol ok işareti
+            command=lambda r=r: self.toggle_click_type(self.coordinates_offset + r, 'left'),
+            width=2,
+            bg=self.colors['primary'],
+            fg='white',
+            font=(self.styles['font_family'], 8),
+            relief=tk.FLAT,
+            cursor='hand2'
+        )
+        left_btn.pack(side=tk.LEFT, padx=1)
+        self.left_buttons.append(left_btn)
+        
+        # Sağ tık butonu
+        right_btn = tk.Button(
+            click_frame,
+            text="▶",  # Sağ ok işareti
+            command=lambda r=r: self.toggle_click_type(self.coordinates_offset + r, 'right'),
+            width=2,
+            bg=self.colors['bg'],
+            fg=self.colors['text'],
+            font=(self.styles['font_family'], 8),
+            relief=tk.RAISED,
+            cursor='hand2'
+        )
+        right_btn.pack(side=tk.LEFT, padx=1)
+        self.right_buttons.append(right_btn)
+        
+        # Double click butonu
+        double_btn = tk.Button(
+            click_frame,
+            text="⚡",  # Yıldırım işareti
+            command=lambda r=r: self.toggle_click_type(self.coordinates_offset + r, 'double'),
+            width=2,
+            bg=self.colors['bg'],
+            fg=self.colors['text'],
+            font=(self.styles['font_family'], 8),
+            relief=tk.RAISED,
+            cursor='hand2'
+        )
+        double_btn.pack(side=tk.LEFT, padx=1)
+        self.double_buttons.append(double_btn)
+        
+        # Metin girişi alanı
+        text_entry = ttk.Entry(current_frame, width=15)
+        text_entry.grid(row=row, column=2, padx=2, pady=2)
+        self.text_entries.append(text_entry)
+        
+        # Gecikme süresi girişi
+        delay_entry = ttk.Entry(current_frame, width=8)
+        delay_entry.grid(row=row, column=3, padx=2, pady=2)
+        self.delay_entries.append(delay_entry)
+        
+        # Sıra numarası girişi
+        order_entry = ttk.Entry(current_frame, width=5)
+        order_entry.grid(row=row, column=4, padx=2, pady=2)
+        self.order_entries.append(order_entry)
+        
+        # Sağ tık: adıma özel metin modu
+        text_entry.bind('<Button-3>', lambda e, r=r: self.show_text_mode_menu(e, r))
+        
+        # Girişler odak kaybında/Enter'da doğrudan set verisine yazılır
+        for entry in (text_entry, delay_entry, order_entry):
+            entry.bind('<Return>', lambda e, r=r: (self.commit_row_entries(r), self.clear_focus(e)))
+            entry.bind('<FocusOut>', lambda e, r=r: self.commit_row_entries(r))
+        
+        # Git butonu
+        goto_btn = tk.Button(
+            current_frame,
+            text="Git",
+            command=lambda r=r: self.goto_coordinate(self.coordinates_offset + r),
+            width=5,
+            relief=tk.FLAT,
+            cursor='hand2'
+        )
+        goto_btn.grid(row=row, column=5, padx=2, pady=2)
+        self.goto_buttons.append(goto_btn)
+        
+        # Güncelle butonu
+        update_btn = tk.Button(
+            current_frame,
+            text="Güncelle",
+            command=lambda r=r: self.update_coordinate(self.coordinates_offset + r),
+            width=8,
+            relief=tk.FLAT,
+            cursor='hand2'
+        )
+        update_btn.grid(row=row, column=6, padx=2, pady=2)
+        self.update_buttons.append(update_btn)
+        
+        widgets = (coord_label, click_frame, text_entry, delay_entry, order_entry, goto_btn, update_btn)
+        for widget in widgets + (left_btn, right_btn, double_btn):
+            self.bind_coordinates_wheel(widget)
+        # Satır bir koordinata bağlanana kadar gizli kalır
+        for widget in widgets:
+            widget.grid_remove()
+        self.coordinate_rows.append(widgets)
+        self.row_cache.append(None)
+
+    def bind_coordinates_wheel(self, widget):
+        """Fare tekerleğini koordinat listesini kaydıracak şekilde bağlar"""
+        widget.bind('<MouseWheel>', self.on_coordinates_wheel)  # Windows/macOS
+        widget.bind('<Button-4>', self.on_coordinates_wheel)  # X11 yukarı
+        widget.bind('<Button-5>', self.on_coordinates_wheel)  # X11 aşağı
+
+    def on_coordinates_wheel(self, event):
+        """Tekerlek hareketinde listeyi 3 satır kaydırır"""
+        step = -3 if getattr(event, 'num', 0) == 4 or getattr(event, 'delta', 0) > 0 else 3
+        self.set_coordinates_offset(self.coordinates_offset + step)
+        return "break"
+
+    def scroll_coordinates(self, *args):
+        """Kaydırma çubuğu komutlarını işler (moveto/scroll)"""
+        size = len(self.sets[self.active_set]['coordinates'])
+        if args[0] == 'moveto':
+            offset = int(float(args[1]) * size)
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            if args[2] == 'pages':
+                amount *= VISIBLE_COORDINATE_ROWS
+            offset = self.coordinates_offset + amount
+        else:
+            return
+        self.set_coordinates_offset(offset)
+
+    def set_coordinates_offset(self, offset):
+        """Listenin ilk görünen koordinatını değiştirir"""
+        size = len(self.sets[self.active_set]['coordinates'])
+        offset = max(0, min(offset, size - VISIBLE_COORDINATE_ROWS))
+        if offset == self.coordinates_offset:
+            return
+        # Kaydırmadan önce düzenlenen girişleri kaybetme
+        self.store_active_set_entries()
+        self.coordinates_offset = offset
+        self.render_coordinate_rows()
+
+    def scroll_to_coordinate(self, index):
+        """Koordinat görünmüyorsa listeyi ona kaydırır"""
+        if not self.coordinates_offset <= index < self.coordinates_offset + VISIBLE_COORDINATE_ROWS:
+            self.set_coordinates_offset(index - VISIBLE_COORDINATE_ROWS + 1)
+
+    def render_coordinate_rows(self):
+        """Görünen satırları aktif setin verisine bağlar"""
+        size = len(self.sets[self.active_set]['coordinates'])
+        self.coordinates_offset = max(0, min(self.coordinates_offset, size - VISIBLE_COORDINATE_ROWS))
+        
+        for r in range(VISIBLE_COORDINATE_ROWS):
+            index = self.coordinates_offset + r
+            if index < size:
+                self.render_coordinate_row(r, index)
+            elif self.row_cache[r] is not None:
+                # Set, havuzdan kısaysa artan satırları gizle
+                for widget in self.coordinate_rows[r]:
+                    widget.grid_remove()
+                self.row_cache[r] = None
+        
+        if size > VISIBLE_COORDINATE_ROWS:
+            self.coordinates_scrollbar.set(
+                self.coordinates_offset / size,
+                (self.coordinates_offset + VISIBLE_COORDINATE_ROWS) / size
+            )
+        else:
+            self.coordinates_scrollbar.set(0, 1)
+
+    def render_coordinate_row(self, r, index):
+        """r. satırı index. koordinata bağlar; yalnızca değişen widget'lar güncellenir"""
+        set_data = self.sets[self.active_set]
+        coord = set_data['coordinates'][index]
+        name = set_data['names'][index]
+        anchor = set_data.anchor(index)
+        tags = "".join(f" [{tag}]" for tag in (anchor, set_data.template(index) and "şablon",
+                                               set_data.wait(index) and "bekle") if tag)
+        state = (
+            f"{name}: ({coord.x}, {coord.y}){tags}" if coord else f"{name}: ",
+            set_data['clicks'][index],
+            set_data['texts'][index] or '',
+            str(set_data['delays'][index]),
+            str(set_data['order'][index]),
+            self.update_mode == index
+        )
+        old = self.row_cache[r]
+        if old == state:
+            return
+        if old is None:
+            for widget in self.coordinate_rows[r]:
+                widget.grid()
+            old = (None,) * len(state)
+        
+        if old[0] != state[0]:
+            self.coordinates_labels[r].config(text=state[0])
+        
+        if old[1] != state[1]:
+            # Önce tüm butonları pasif yap, sonra aktif olanı vurgula
+            for click_type, button in (('left', self.left_buttons[r]),
+                                       ('right', self.right_buttons[r]),
+                                       ('double', self.double_buttons[r])):
+                if click_type == state[1]:
+                    button.configure(bg=self.colors['primary'], fg='white')
+                else:
+                    button.configure(bg=self.colors['bg'], fg=self.colors['text'])
+        
+        for position, entries in ((2, self.text_entries), (3, self.delay_entries), (4, self.order_entries)):
+            if old[position] != state[position]:
+                entries[r].delete(0, tk.END)
+                entries[r].insert(0, state[position])
+        
+        if old[5] != state[5]:
+            if state[5]:
+                self.update_buttons[r].configure(bg=self.colors['primary'], fg='white')
+            else:
+                self.update_buttons[r].configure(bg=self.colors['bg'], fg=self.colors['text'])
+        
+        self.row_cache[r] = state
+
+    def refresh_coordinate(self, index):
+        """Koordinat değiştiğinde çağrılır; görünüyorsa satırını yeniden çizer"""
+        self.autosave.mark_dirty(self.active_set)
+        r = index - self.coordinates_offset
+        if 0 <= r < VISIBLE_COORDINATE_ROWS and index < len(self.sets[self.active_set]['coordinates']):
+            self.render_coordinate_row(r, index)
+
+    def commit_row_entries(self, r):
+        """r. satırdaki metin, gecikme ve sıra girişlerini set verisine yazar"""
+        set_data = self.sets[self.active_set]
+        index = self.coordinates_offset + r
+        if self.row_cache[r] is None or index >= len(set_data['coordinates']):
+            return
+        
+        before = (set_data.text(index), set_data.delays_ms[index], set_data.order[index])
+        set_data['texts'][index] = self.text_entries[r].get()
+        try:
+            # Gecikme milisaniye hassasiyetiyle saklanır (ör. kayıttan gelen 0.137)
+            set_data.set_delay(index, self.delay_entries[r].get())
+        except (ValueError, OverflowError):
+            pass  # Geçersiz veya çok büyük değer: render eski değeri geri yazar
+        try:
+            set_data['order'][index] = int(self.order_entries[r].get())
+        except ValueError:
+            pass
+        # Kaydırma ve set değişiminde de çağrılır; yalnızca gerçek değişiklik günlüğe gider
+        if before != (set_data.text(index), set_data.delays_ms[index], set_data.order[index]):
+            self.autosave.mark_dirty(self.active_set)
+        
+        # Girişlerin gösterimini kaydedilen değerle eşitle
+        self.row_cache[r] = self.row_cache[r][:2] + (None, None, None) + self.row_cache[r][5:]
+        self.render_coordinate_row(r, index)
+
+    def show_text_mode_menu(self, event, r):
+        """r. satırın metin modunu seçmek için menü açar"""
+        set_data = self.sets[self.active_set]
+        index = self.coordinates_offset + r
+        if self.row_cache[r] is None or index >= len(set_data):
+            return
+        mode_var = tk.StringVar(value=set_data.text_mode(index))
+        menu = tk.Menu(self.root, tearoff=0)
+        menu.add_radiobutton(label=f"Proje varsayılanı ({self.project_settings['text_mode']})",
+                             variable=mode_var, value='',
+                             command=lambda: self.set_text_mode(index, ''))
+        for mode in TEXT_MODES:
+            menu.add_radiobutton(label=mode, variable=mode_var, value=mode,
+                                 command=lambda mode=mode: self.set_text_mode(index, mode))
+        menu.tk_popup(event.x_root, event.y_root)
+        menu.grab_release()
+
+    def set_text_mode(self, index, mode):
+        """Aktif setteki bir adımın metin modunu değiştirir"""
+        self.sets[self.active_set].set_text_mode(index, mode)
+        self.autosave.mark_dirty(self.active_set)
+
+    def show_anchor_menu(self, event, r):
+        """r. satırdaki koordinatın çapasını ve şablon görüntüsünü seçmek için menü açar"""
+        set_data = self.sets[self.active_set]
+        index = self.coordinates_offset + r
+        if self.row_cache[r] is None or index >= len(set_data):
+            return
+        anchor_var = tk.StringVar(value=set_data.anchor(index) or ANCHORS[0])
+        menu = tk.Menu(self.root, tearoff=0)
+        for anchor in ANCHORS:
+            menu.add_radiobutton(label=anchor, variable=anchor_var, value=anchor,
+                                 command=lambda anchor=anchor: self.set_anchor(index, anchor))
+        menu.add_separator()
+        menu.add_command(label="Şablon görüntü seç…", command=lambda: self.choose_template(index))
+        if set_data.template(index):
+            menu.add_command(label="Şablon arama alanı…", command=lambda: self.choose_search_region(index))
+            if set_data.search_region(index):
+                menu.add_command(label="Arama alanını kaldır (tüm ekran)",
+                                 command=lambda: self.set_search_region(index, ''))
+            menu.add_command(label="Şablonu kaldır", command=lambda: self.set_template(index, ''))
+        menu.add_separator()
+        for kind, label in (('change', "Bölge değişene kadar bekle…"),
+                            ('color', "Piksel renge gelene kadar bekle…"),
+                            ('hash', "Bölge bu hale gelene kadar bekle…")):
+            menu.add_command(label=label, command=lambda kind=kind: self.choose_wait(index, kind))
+        if set_data.wait(index):
+            menu.add_command(label="Bekleme koşulunu kaldır", command=lambda: self.set_wait(index, ''))
+        menu.tk_popup(event.x_root, event.y_root)
+        menu.grab_release()
+
+    def set_anchor(self, index, anchor):
+        """Koordinatın çapasını değiştirir; ekrandaki konumu korunur"""
+        set_data = self.sets[self.active_set]
+        coord = set_data.coordinate(index)
+        transform = self.display_transform()
+        if coord and transform is not None:
+            # Nokta bu ekranda aynı yerde kalsın, referans koordinatı yeni çapaya göre yeniden hesapla
+            x, y = transform.to_device(coord.x, coord.y, anchor_code(set_data.anchor(index)))
+            set_data.set_anchor(index, anchor)
+            set_data.set_coordinate(index, transform.to_reference(x, y, anchor_code(anchor)))
+        else:
+            set_data.set_anchor(index, anchor)
+        self.refresh_coordinate(index)
+
+    def choose_template(self, index):
+        """Adım için şablon görüntü dosyası seçtirir"""
+        path = filedialog.askopenfilename(
+            filetypes=[("Görüntü dosyaları", "*.png *.bmp *.jpg *.jpeg"), ("Tüm dosyalar", "*.*")])
+        if path:
+            self.set_template(index, path)
+
+    def set_template(self, index, path):
+        """Adımın şablon görüntüsünü değiştirir; koordinat aramanın başlangıç noktası olur"""
+        set_data = self.sets[self.active_set]
+        set_data.set_template(index, path)
+        if not path:
+            set_data.set_search_region(index, '')
+        self.refresh_coordinate(index)
+
+    def choose_search_region(self, index):
+        """Şablon yakınında bulunamazsa aranacak alanı ekran koordinatlarıyla sorar"""
+        set_data = self.sets[self.active_set]
+        anchor = anchor_code(set_data.anchor(index))
+        transform = self.display_transform()
+        screen_bounds = (0, 0, self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+        initial = set_data.search_region(index)
+        if initial and transform is not None:
+            ref_left, ref_top, width, height = parse_region(initial)
+            left, top = transform.to_device(ref_left, ref_top, anchor)
+            right, bottom = transform.to_device(ref_left + width, ref_top + height, anchor)
+            initial = f"{left},{top},{right - left},{bottom - top}"
+        elif not initial:
+            initial = ",".join(map(str, screen_bounds))
+        value = simpledialog.askstring("Şablon Arama Alanı", "Ekran koordinatları: x,y,genişlik,yükseklik",
+                                       initialvalue=initial, parent=self.root)
+        if not value:
+            return
+        try:
+            region = clip_region(parse_region(value), screen_bounds)
+            if region is None:
+                raise ValueError("alan ekranın dışında")
+        except ValueError as e:
+            messagebox.showerror("Hata", f"Arama alanı ayarlanamadı: {e}")
+            return
+        left, top, width, height = region
+        if transform is not None:
+            # Koordinatlar gibi referans ekranın piksellerinde saklanır
+            left, top = transform.to_reference(region[0], region[1], anchor)
+            right, bottom = transform.to_reference(region[0] + region[2], region[1] + region[3], anchor)
+            width, height = max(1, right - left), max(1, bottom - top)
+        self.set_search_region(index, f"{left},{top},{width},{height}")
+
+    def set_search_region(self, index, region):
+        """Şablonun geniş arama alanını değiştirir; '' tüm ekran demektir"""
+        self.sets[self.active_set].set_search_region(index, region)
+        self.refresh_coordinate(index)
+
+    def choose_wait(self, index, kind):
+        """Adımdan sonraki bekleme koşulunu ekran koordinatlarıyla sorar
+
+        Koşul sağlanana kadar (en fazla adımın gecikmesi kadar) beklenir.
+        'hash' koşulunun değeri bölgenin şu anki görüntüsünden alınır.
+        """
+        set_data = self.sets[self.active_set]
+        anchor = anchor_code(set_data.anchor(index))
+        transform = self.display_transform()
+        x, y = 0, 0
+        coord = set_data.coordinate(index)
+        if coord:
+            x, y = transform.to_device(coord.x, coord.y, anchor) if transform else (coord.x, coord.y)
+        try:
+            capture = None
+            if kind == CONDITION_COLOR:
+                capture = ScreenCapture()
+                r, g, b = (int(c) for c in capture.grab_rgb(x, y, 1, 1)[0, 0])
+                prompt, initial = "x,y #rrggbb [tolerans]", f"{x},{y} #{r:02x}{g:02x}{b:02x}"
+            elif kind == CONDITION_HASH:
+                prompt, initial = "x,y,genişlik,yükseklik", f"{x - 8},{y - 8},16,16"
+            else:
+                prompt, initial = "x,y,genişlik,yükseklik [tolerans]", f"{x - 8},{y - 8},16,16"
+            value = simpledialog.askstring("Bekleme Koşulu", f"Ekran koordinatları: {prompt}",
+                                           initialvalue=initial, parent=self.root)
+            if not value:
+                return
+            condition = ScreenCondition.parse(f"{kind} {value} 0" if kind == CONDITION_HASH
+                                              else f"{kind} {value}")
+            # Ekran kenarındaki adımlarda varsayılan bölge ekranın dışına taşabilir
+            condition = condition.clipped((0, 0, self.root.winfo_screenwidth(),
+                                           self.root.winfo_screenheight()))
+            if condition is None:
+                raise ValueError("bölge ekranın dışında")
+            if kind == CONDITION_HASH:
+                capture = capture or ScreenCapture()
+                condition = replace(condition, value=region_hash(capture.grab_rgb(*condition.region())))
+        except (ValueError, ImportError, OSError) as e:
+            messagebox.showerror("Hata", f"Bekleme koşulu ayarlanamadı: {e}")
+            return
+        if transform is not None:
+            # Koordinatlar gibi referans ekranın piksellerinde saklanır
+            condition = condition.mapped(lambda cx, cy: transform.to_reference(cx, cy, anchor))
+        self.set_wait(index, str(condition))
+
+    def set_wait(self, index, condition):
+        """Adımın bekleme koşulunu değiştirir"""
+        self.sets[self.active_set].set_wait(index, condition)
+        self.refresh_coordinate(index)
+
+    def display_transform(self):
+        """Projenin referans ekranından bu ekrana dönüşüm; gerekmiyorsa None"""
+        return settings_transform(self.project_settings, display_config_from_tk(self.root))
+
+    def to_reference_point(self, set_data, index, x, y):
+        """Ekrandaki pikseli setin referans ekranındaki koordinatına çevirir"""
+        if self.project_settings.get('reference_screen') is None:
+            # İlk kaydedilen koordinat referans ekranı belirler
+            self.project_settings['reference_screen'] = display_config_from_tk(self.root).to_value()
+            return Point(x, y)
+        transform = self.display_transform()
+        if transform is None:
+            return Point(x, y)
+        return Point(*transform.to_reference(x, y, anchor_code(set_data.anchor(index))))
+
+    def add_coordinate_slots(self, count):
+        """Aktif sete boş koordinat slotları ekler"""
+        self.store_active_set_entries()
+        append_slots(self.sets[self.active_set], count)
+        self.autosave.mark_dirty(self.active_set)
+        self.render_coordinate_rows()
+
+    def store_active_set_entries(self):
+        """Görünen satırlardaki düzenlenmiş girişleri aktif setin verisine yazar"""
+        for r in range(VISIBLE_COORDINATE_ROWS):
+            self.commit_row_entries(r)
+
     def create_set_button(self, set_id):
         """Set butonu oluşturur"""
         # Her set için bir frame oluştur
@@ -514,8 +1027,8 @@ class AutoClickerApp:
             self.pause_button.config(state=tk.NORMAL)
             
             # Kuyruğu işlemeye başla
-            self.current_queue_index = 0
-            self.process_queue()
+            self.current_entry = None
+            self.start_engine()
             
         else:
             # Durdurma işlemi
@@ -524,97 +1037,56 @@ class AutoClickerApp:
             self.start_stop_button.config(text="Başlat", bg=self.colors['success'])
             self.pause_button.config(text="Duraklat", state=tk.DISABLED)
 
-    def process_queue(self):
-        """İşlem kuyruğunu işler"""
-        if not self.running or self.paused:
-            return
-        
+    def poll_engine_status(self):
+        """Motordan gelen durum mesajlarını UI thread'inde işler"""
+        finished = False
         try:
-            # Kuyrukta set var mı kontrol et
-            if not self.execution_queue:
+            while True:
+                message = self.engine_status.get_nowait()
+                kind = message[0]
+                if kind == 'step':
+                    # Sadece en son imleç konumu önemli
+                    entry, self.current_loop, self.current_coord = message[1:]
+                    if entry != self.current_entry:
+                        self.highlight_queue_entry(entry)
+                elif kind in ('paused', 'resumed'):
+                    self.paused = kind == 'paused'
+                    self._update_pause_button()
+                elif kind == 'error':
+                    print(f"İşlem hatası: {message[1]}")
+                elif kind == 'match':
+                    entry, coord, found = message[1:4]
+                    if not found:
+                        set_data = self.sets.get(self.execution_queue.set_id(entry))
+                        if set_data is not None:
+                            print(f"Şablon bulunamadı, adım atlandı: {set_data['names'][coord]}")
+                elif kind == 'input_stats':
+                    for action, stats in message[1].items():
+                        print(format_input_stats(action, stats))
+                elif kind == 'capture_stats':
+                    print(format_capture_stats(message[1]))
+                elif kind == 'telemetry':
+                    self.last_telemetry = message[1]
+                    if self.last_telemetry.count:
+                        print(format_telemetry_summary(self.last_telemetry.summary()))
+                elif kind == 'stats':
+                    stats = message[1]
+                    print(f"Zamanlama sapması: ort {stats['mean_us']:.0f} µs, "
+                          f"maks {stats['max_us']:.0f} µs ({stats['count']} adım)")
+                elif kind == 'finished':
+                    finished = True
+        except queue.Empty:
+            pass
+        
+        self.engine_poll_job = None
+        if finished:
+            if self.running:
                 self.toggle_automation()
-                return
-            
-            # Aktif seti al
-            current_set_id = self.execution_queue[self.current_queue_index]
-            current_set = self.sets[current_set_id]
-            
-            # Setin döngü sayısını al
-            loop_count = current_set['loop_count']
-            
-            # Koordinatları işle
-            coordinates = current_set['coordinates']
-            clicks = current_set['clicks']
-            
-            # Tüm döngüler tamamlandı mı kontrol et
-            if self.current_loop >= loop_count:
-                self.current_queue_index += 1
-                self.current_loop = 0
-                self.current_coord = 0
-                
-                if self.current_queue_index >= len(self.execution_queue):
-                    self.current_queue_index = 0
-                    self.running = False
-                    self.automation_button.config(
-                        text="▶️ Otomasyonu Başlat",
-                        bg=self.colors['success']
-                    )
-                    self.pause_button.config(
-                        text="⏸️ Duraklat",
-                        bg=self.colors['bg'],
-                        state=tk.DISABLED
-                    )
-                    return
-                else:
-                    self.root.after(100, self.process_queue)
-                return
-            
-            # Tüm koordinatlar tamamlandı mı kontrol et
-            if self.current_coord >= len(coordinates):
-                self.current_loop += 1
-                self.current_coord = 0
-                self.root.after(100, self.process_queue)
-                return
-            
-            # Mevcut koordinatı işle
-            coord = coordinates[self.current_coord]
-            if coord:
-                # Tıklama tipine göre işlem yap
-                if clicks[self.current_coord] == 'left':
-                    pyautogui.click(coord.x, coord.y, button='left')
-                elif clicks[self.current_coord] == 'right':
-                    pyautogui.click(coord.x, coord.y, button='right')
-                elif clicks[self.current_coord] == 'double':
-                    pyautogui.doubleClick(coord.x, coord.y)
-                
-                # Metin varsa yaz
-                text = current_set['texts'][self.current_coord]
-                if text and text.strip():
-                    time.sleep(0.1)
-                    pyautogui.write(text)
-                
-                # Gecikme süresini uygula - Düzeltilmiş kısım
-                try:
-                    delay = float(current_set['delays'][self.current_coord])
-                    if delay < 0.1:  # Minimum gecikme kontrolü
-                        delay = 0.1
-                except (ValueError, IndexError):
-                    delay = 0.5
-                
-                # Sonraki koordinata geç
-                self.current_coord += 1
-                
-                # Bir sonraki işlemi planla
-                time.sleep(delay)  # time.sleep kullanarak gerçek bekleme ekledik
-                self.root.after(10, self.process_queue)  # Minimum gecikme ile devam et
-            else:
-                # Boş koordinatı atla
-                self.current_coord += 1
-                self.root.after(10, self.process_queue)
-                
-        except Exception as e:
-            print(f"İşlem hatası: {e}")
-            self.toggle_automation()
+            return
+        
+        if self.running:
+            # ~60 fps
+            self.engine_poll_job = self.root.after(16, self.poll_engine_status)
 
     def process_set(self, set_data):
         """Bir seti işler"""
@@ -718,25 +1190,17 @@ class AutoClickerApp:
         if self.update_mode == index:  # Zaten bu koordinat için güncelleme modundaysa
             # Güncelleme modunu kapat
             self.update_mode = None
-            self.update_buttons[index].configure(
-                bg=self.colors['bg'],
-                fg=self.colors['text']
-            )
+            self.refresh_coordinate(index)
             self.root.unbind('c')
         else:
             # Varsa önceki güncelleme modunu kapat
-            if self.update_mode is not None:
-                self.update_buttons[self.update_mode].configure(
-                    bg=self.colors['bg'],
-                    fg=self.colors['text']
-                )
+            previous = self.update_mode
             
             # Yeni güncelleme modunu aç
             self.update_mode = index
-            self.update_buttons[index].configure(
-                bg=self.colors['primary'],
-                fg='white'
-            )
+            if previous is not None:
+                self.refresh_coordinate(previous)
+            self.refresh_coordinate(index)
             self.root.bind('c', lambda e: self.save_updated_coordinate(index))
 
     def save_updated_coordinate(self, index, event=None):
@@ -747,19 +1211,12 @@ class AutoClickerApp:
             y = self.root.winfo_pointery()
             
             # Koordinatı güncelle
-            self.sets[self.active_set]['coordinates'][index] = Point(x, y)
-            
-            # UI'ı güncelle
-            self.coordinates_labels[index].config(
-                text=f"K {index+1}: ({x}, {y})"
-            )
+            set_data = self.sets[self.active_set]
+            set_data['coordinates'][index] = self.to_reference_point(set_data, index, x, y)
             
-            # Güncelleme modunu kapat
+            # Güncelleme modunu kapat ve satırı yeniden çiz
             self.update_mode = None
-            self.update_buttons[index].configure(
-                bg=self.colors['bg'],
-                fg=self.colors['text']
-            )
+            self.refresh_coordinate(index)
             self.root.unbind('c')
 
     def save_specific_coordinate(self):
@@ -859,19 +1316,18 @@ class AutoClickerApp:
 
     def setup_keyboard_listener(self):
         """Klavye dinleyicisini ayarla"""
-        def on_key_event(e):
-            if e.name == 'c':
-                self.save_specific_coordinate()
-            elif e.name == 'f':
-                self.root.quit()
-            elif e.name == 'esc':
-                self.is_started = False
-                self.start_stop_button.config(text="Başlat", bg=self.colors['success'])
-                print("İşlem durduruldu.")
-            elif e.name == 'p':
-                self.toggle_pause()
-        
-        keyboard.on_press(on_key_event)
+        def stop_loop(e):
+            self.is_started = False
+            self.start_stop_button.config(text="Başlat", bg=self.colors['success'])
+            print("İşlem durduruldu.")
+        
+        # Her tuş için ayrı, filtrelenmiş bağlantı; diğer tuşlar geri çağrılarımıza ulaşmaz
+        self.hotkeys.rebind_group('listener', [
+            ('c', lambda e: self.save_specific_coordinate()),
+            ('f', lambda e: self.root.quit()),
+            ('esc', stop_loop),
+            ('p', lambda e: self.toggle_pause()),
+        ])
 
     def setup_styles(self):
         style = ttk.Style()
@@ -901,7 +1357,8 @@ class AutoClickerApp:
 
     def start_edit_label(self, event, index):
         """Etiket düzenleme modunu başlatır"""
-        label = self.coordinates_labels[index]
+        r = index - self.coordinates_offset
+        label = self.coordinates_labels[r]
         current_name = self.sets[self.active_set]['names'][index]  # Mevcut ismi al
         
         # Düzenleme için Entry widget'ı oluştur
@@ -910,7 +1367,7 @@ class AutoClickerApp:
         edit_entry.select_range(0, tk.END)  # Metni seç
         
         # Entry'yi yerleştir
-        edit_entry.grid(row=(index % 10) + 1, column=0, padx=2, pady=2, sticky="w")
+        edit_entry.grid(row=r + 1, column=0, padx=2, pady=2, sticky="w")
         label.grid_remove()  # Etiketi geçici olarak gizle
         edit_entry.focus()
         
@@ -923,16 +1380,10 @@ class AutoClickerApp:
             # İsmi güncelle
             self.sets[self.active_set]['names'][index] = new_text
             
-            # Koordinat değerini al
-            coord = self.sets[self.active_set]['coordinates'][index]
-            if coord:
-                label.configure(text=f"{new_text}: ({coord.x}, {coord.y})")
-            else:
-                label.configure(text=f"{new_text}: ")
-            
             # Düzenleme modundan çık
             edit_entry.destroy()
             label.grid()
+            self.refresh_coordinate(index)
         
         def cancel_edit(event=None):
             """Düzenlemeyi iptal et"""
@@ -946,8 +1397,12 @@ class AutoClickerApp:
 
     def goto_coordinate(self, index):
         """Mouse'u kaydedilen koordinata götürür"""
-        coord = self.sets[self.active_set]['coordinates'][index]
+        set_data = self.sets[self.active_set]
+        coord = set_data['coordinates'][index]
         if coord:
+            transform = self.display_transform()
+            if transform is not None:
+                coord = Point(*transform.to_device(coord.x, coord.y, anchor_code(set_data.anchor(index))))
             pyautogui.moveTo(coord.x, coord.y)
 
     def change_set_name(self, set_number):
@@ -964,18 +1419,18 @@ class AutoClickerApp:
             self.set_names[set_number] = new_name
             self.set_labels[set_number-1].config(text=new_name)
 
-    def switch_set(self, set_id):
+    def switch_set(self, set_id, store_current=True):
         """Seçilen sete geçiş yapar"""
         if set_id not in self.sets:
             return
         
-        # Mevcut setin verilerini kaydet
-        self.sets[self.active_set]['texts'] = [entry.get() for entry in self.text_entries]
-        # Gecikme sürelerini float formatında kaydet
-        self.sets[self.active_set]['delays'] = [f"{float(entry.get()):.1f}" for entry in self.delay_entries]
+        # Mevcut setin verilerini kaydet (dosya açılırken/yeni dosyada eski girişler yazılmamalı)
+        if store_current and self.active_set in self.sets:
+            self.store_active_set_entries()
         
         # Aktif seti güncelle
         self.active_set = set_id
+        self.coordinates_offset = 0
         
         # Set butonlarının renklerini güncelle
         for i, btn in enumerate(self.set_buttons):
@@ -984,52 +1439,12 @@ class AutoClickerApp:
             else:
                 btn.configure(bg=self.colors['bg'], fg=self.colors['text'])
         
-        # Koordinatları güncelle
-        for i, coord in enumerate(self.sets[set_id]['coordinates']):
-            coord_name = self.sets[set_id]['names'][i]
-            if coord:
-                self.coordinates_labels[i].config(
-                    text=f"{coord_name}: ({coord.x}, {coord.y})"
-                )
-            else:
-                self.coordinates_labels[i].config(
-                    text=f"{coord_name}: "
-                )
-        
-        # Tıklama tiplerini güncelle
-        for i, click_type in enumerate(self.sets[set_id]['clicks']):
-            # Önce tüm butonları pasif yap
-            self.left_buttons[i].configure(bg=self.colors['bg'], fg=self.colors['text'])
-            self.right_buttons[i].configure(bg=self.colors['bg'], fg=self.colors['text'])
-            self.double_buttons[i].configure(bg=self.colors['bg'], fg=self.colors['text'])
-            
-            # Aktif olan butonu vurgula
-            if click_type == 'left':
-                self.left_buttons[i].configure(bg=self.colors['primary'], fg='white')
-            elif click_type == 'right':
-                self.right_buttons[i].configure(bg=self.colors['primary'], fg='white')
-            elif click_type == 'double':
-                self.double_buttons[i].configure(bg=self.colors['primary'], fg='white')
-        
-        # Gecikme sürelerini güncelle - float formatında göster
-        for i, delay in enumerate(self.sets[set_id]['delays']):
-            self.delay_entries[i].delete(0, tk.END)
-            self.delay_entries[i].insert(0, f"{float(delay):.1f}")
-        
-        # Sıra numaralarını güncelle
-        for i, order in enumerate(self.sets[set_id]['order']):
-            self.order_entries[i].delete(0, tk.END)
-            self.order_entries[i].insert(0, str(order))
+        # Yalnızca görünen satırları yeni sete bağla
+        self.render_coordinate_rows()
         
         # Döngü sayısını güncelle
         self.loop_count_entry.delete(0, tk.END)
         self.loop_count_entry.insert(0, str(self.sets[set_id]['loop_count']))
-        
-        # Metin girişlerini güncelle
-        for i, text in enumerate(self.sets[set_id]['texts']):
-            self.text_entries[i].delete(0, tk.END)
-            if text:  # None veya boş string kontrolü
-                self.text_entries[i].insert(0, text)
 
     def update_coordinates_ui(self, set_data):
         """Set verilerine göre UI'ı günceller"""
@@ -1064,14 +1479,9 @@ class AutoClickerApp:
         if not self.running:
             return
         
-        self.paused = not self.paused
-        
-        # UI güncellemesini ana thread'de yap
-        self.root.after(0, self._update_pause_button)
-        
-        if not self.paused:
-            # Devam ettirme
-            self.root.after(100, self.process_queue)
+        # Durum değişikliği motorda yapılır, buton poll_engine_status ile güncellenir
+        if self.engine is not None:
+            self.engine.toggle_pause()
 
     def _update_pause_button(self):
         """Duraklat butonunun görünümünü günceller"""
@@ -1116,33 +1526,24 @@ class AutoClickerApp:
 
     def increase_delay(self, index):
         """Bekleme süresini 0.1 saniye artırır"""
+        delays_ms = self.sets[self.active_set].delays_ms
         try:
-            current = float(self.delay_entries[index].get())
-            new_value = round(current + 0.1, 1)
-            self.delay_entries[index].delete(0, tk.END)
-            self.delay_entries[index].insert(0, str(new_value))
-        except ValueError:
-            # Geçersiz değer varsa varsayılan değere dön
-            self.delay_entries[index].delete(0, tk.END)
-            self.delay_entries[index].insert(0, "0.5")
+            delays_ms[index] += DELAY_STEP_MS
+        except OverflowError:
+            return  # Zaten en büyük değerde
+        self.refresh_coordinate(index)
 
     def decrease_delay(self, index):
         """Bekleme süresini 0.1 saniye azaltır"""
-        try:
-            current = float(self.delay_entries[index].get())
-            new_value = max(0.1, round(current - 0.1, 1))  # En az 0.1 saniye
-            self.delay_entries[index].delete(0, tk.END)
-            self.delay_entries[index].insert(0, str(new_value))
-        except ValueError:
-            # Geçersiz değer varsa varsayılan değere dön
-            self.delay_entries[index].delete(0, tk.END)
-            self.delay_entries[index].insert(0, "0.5")
+        delays_ms = self.sets[self.active_set].delays_ms
+        delays_ms[index] = max(DELAY_STEP_MS, delays_ms[index] - DELAY_STEP_MS)  # En az 0.1 saniye
+        self.refresh_coordinate(index)
 
     def update_order(self, event, index):
         """Sıra numarası değiştiğinde çalışır"""
         try:
             new_order = int(self.order_entries[index].get()) - 1  # 0-based index
-            if 0 <= new_order < 20:
+            if 0 <= new_order < len(self.sets[self.active_set]['coordinates']):
                 # Eski ve yeni sırayı al
                 old_order = self.coordinate_order.index(index)
                 
@@ -1176,8 +1577,8 @@ class AutoClickerApp:
             self.toggle_automation()
         
         try:
-            self.execution_queue = []
-            self.current_queue_index = 0
+            self.execution_queue.clear()
+            self.current_entry = None
             
             # UI'ı güncelle
             self.update_queue_ui()
@@ -1187,64 +1588,112 @@ class AutoClickerApp:
             messagebox.showerror("Hata", f"Kuyruk temizleme işlemi başarısız: {str(e)}")
 
     def add_to_queue(self, set_id):
-        """Seti kuyruğa ekler"""
-        self.execution_queue.append(set_id)
-        self.update_queue_ui()
+        """Seti kuyruğa ekler (çalışma sırasında da eklenebilir)"""
+        entry_id = self.execution_queue.append(set_id)
+        self.create_queue_item(entry_id, set_id)
 
-    def update_queue_ui(self):
-        """Kuyruk UI'ını günceller"""
-        # Kuyruk listesindeki tüm widget'ları temizle
-        for widget in self.queue_list_frame.winfo_children():
-            widget.destroy()
-        
-        # Tüm kuyruğu yeniden oluştur
-        for i, current_set_id in enumerate(self.execution_queue):
-            # Yeni frame oluştur
-            queue_item = ttk.Frame(self.queue_list_frame)
-            queue_item.grid(row=0, column=i, sticky="ew", padx=2)
-            
-            # Set ismini al
-            set_name = self.sets[current_set_id]['name']
-            
-            # Set etiketi
-            set_label = ttk.Label(queue_item, text=set_name)
-            set_label.grid(row=0, column=0, padx=(5, 10))
-            
-            # Kaldır butonu için özel bir fonksiyon oluştur
-            def create_remove_command(sid):
-                return lambda: self.remove_from_queue(sid)
-            
-            # Kaldır butonu
-            remove_btn = tk.Button(
+    def create_queue_item(self, entry_id, set_id):
+        """Kuyruk elemanı için widget oluşturur ve sona ekler"""
+        queue_item = ttk.Frame(self.queue_list_frame)
+        queue_item.pack(side=tk.LEFT, padx=2)
+        
+        # Set etiketi
+        set_label = ttk.Label(queue_item, text=self.sets[set_id]['name'])
+        set_label.grid(row=0, column=1, padx=(5, 10))
+        queue_item.set_label = set_label
+        queue_item.set_id = set_id
+        
+        # Taşıma ve kaldırma butonları
+        buttons = (
+            (0, "◀", self.colors['text'], lambda: self.move_queue_entry(entry_id, -1)),
+            (2, "▶", self.colors['text'], lambda: self.move_queue_entry(entry_id, 1)),
+            (3, "❌", self.colors['danger'], lambda: self.remove_from_queue(entry_id)),
+        )
+        for column, text, fg, command in buttons:
+            tk.Button(
                 queue_item,
-                text="❌",
-                command=create_remove_command(current_set_id),
+                text=text,
+                command=command,
                 bg=self.colors['bg'],
-                fg=self.colors['danger'],
+                fg=fg,
                 font=('Segoe UI', 9),
                 relief=tk.FLAT,
                 bd=0
-            )
-            remove_btn.grid(row=0, column=1)
+            ).grid(row=0, column=column)
+        
+        self.queue_items[entry_id] = queue_item
+
+    def update_queue_ui(self):
+        """Kuyruk UI'ını modelle eşitler (yalnızca değişen elemanlara dokunur)"""
+        entries = self.execution_queue.entries()
+        alive = {entry_id for entry_id, _ in entries}
+        
+        # Kuyrukta olmayan elemanları kaldır
+        for entry_id in [e for e in self.queue_items if e not in alive]:
+            self.queue_items.pop(entry_id).destroy()
+        
+        # Eksik elemanları ekle ve sırayı eşitle
+        previous = None
+        for entry_id, set_id in entries:
+            queue_item = self.queue_items.get(entry_id)
+            if queue_item is None:
+                self.create_queue_item(entry_id, set_id)
+                queue_item = self.queue_items[entry_id]
+            if previous is not None:
+                queue_item.pack(side=tk.LEFT, padx=2, after=previous)
+            previous = queue_item
+        
+        self.highlight_queue_entry(self.current_entry if self.running else None)
 
-    def remove_from_queue(self, set_id):
-        """Seti kuyruktan kaldırır"""
+    def move_queue_entry(self, entry_id, direction):
+        """Kuyruk elemanını bir sola (-1) veya sağa (1) taşır"""
+        queue = self.execution_queue
+        if direction < 0:
+            before_id = queue.previous_of(entry_id)
+            if before_id is None:
+                return
+        else:
+            next_id = queue.next_of(entry_id)
+            if next_id is None:
+                return
+            before_id = queue.next_of(next_id)
+        if not queue.move(entry_id, before_id):
+            return
+        
+        # Sadece taşınan widget'ı yeniden yerleştir
+        queue_item = self.queue_items[entry_id]
+        if before_id is None:
+            queue_item.pack_forget()
+            queue_item.pack(side=tk.LEFT, padx=2)
+        else:
+            queue_item.pack(side=tk.LEFT, padx=2, before=self.queue_items[before_id])
+
+    def remove_from_queue(self, entry_id):
+        """Elemanı kuyruktan kaldırır
+
+        Çalışan eleman kaldırılırsa motor o anki adımdan sonra kuyruğun
+        kalanıyla devam eder.
+        """
         try:
-            if set_id in self.execution_queue:
-                # Çalışan otomasyonu durdur
-                if self.running and len(self.execution_queue) > 0 and self.execution_queue[0] == set_id:
-                    self.toggle_automation()
-                
-                # Seti kuyruktan kaldır
-                self.execution_queue.remove(set_id)
-                
-                # UI'ı güncelle
-                self.update_queue_ui()
+            if self.execution_queue.remove(entry_id):
+                queue_item = self.queue_items.pop(entry_id, None)
+                if queue_item is not None:
+                    queue_item.destroy()
                     
         except Exception as e:
             print(f"Kuyruktan set kaldırma hatası: {e}")
             messagebox.showerror("Hata", f"Set kaldırma işlemi başarısız: {str(e)}")
 
+    def highlight_queue_entry(self, entry_id):
+        """Çalışan kuyruk elemanının etiketini vurgular"""
+        previous = self.queue_items.get(self.current_entry)
+        if previous is not None:
+            previous.set_label.config(foreground='')
+        self.current_entry = entry_id
+        current = self.queue_items.get(entry_id)
+        if current is not None:
+            current.set_label.config(foreground=self.colors['primary'])
+
     def toggle_coordinate_mode(self):
         """Koordinat Kaydetme Modunu Açar/Kapatır"""
         if not hasattr(self, 'recording_mode'):
@@ -1258,7 +1707,7 @@ class AutoClickerApp:
                 bg=self.colors['danger'],
                 fg='white'
             )
-            keyboard.on_press_key('c', self.on_coordinate_click)  # Global hotkey olarak C tuşunu ekle
+            self.hotkeys.rebind_group('coordinate', [('c', self.on_coordinate_click)])  # Global hotkey olarak C tuşunu ekle
             self.root.attributes('-alpha', 0.95)
             
         else:
@@ -1269,9 +1718,58 @@ class AutoClickerApp:
                 bg=self.colors['bg'],
                 fg=self.colors['text']
             )
-            keyboard.unhook_all()  # Tüm global hotkey'leri kaldır
+            self.hotkeys.unbind_group('coordinate')  # Sadece bu modun kısayolunu kaldır
             self.root.attributes('-alpha', 1.0)
 
+    def toggle_macro_recording(self):
+        """Makro kaydını başlatır; durdurulunca kaydı yeni bir sete çevirir"""
+        if self.macro_recorder is None:
+            recorder = MacroRecorder()
+            try:
+                recorder.start()
+            except ImportError:
+                messagebox.showerror("Hata", "Makro kaydı için pynput paketi gerekli (pip install pynput)")
+                return
+            self.macro_recorder = recorder
+            self.macro_button.config(text="⏹ Kaydı Bitir", bg=self.colors['danger'], fg='white')
+            return
+        
+        recording = self.macro_recorder.stop()
+        stats = self.macro_recorder.stats()
+        self.macro_recorder = None
+        self.macro_button.config(text="⏺ Makro Kaydı", bg=self.colors['bg'], fg=self.colors['text'])
+        print(f"Makro kaydı: {stats['events']} olay, {stats['duration_s']:.1f} sn "
+              f"({stats['events_per_sec']:.0f} olay/sn, {stats['dropped']} olay kayıp)")
+        
+        # Uygulama penceresindeki tıklamalar (ör. bu buton) sete alınmaz
+        x0, y0 = self.root.winfo_rootx(), self.root.winfo_rooty()
+        exclude = (x0, y0, x0 + self.root.winfo_width(), y0 + self.root.winfo_height())
+        self.current_set_id += 1
+        set_data = recording_to_set(recording, f"Makro {self.current_set_id}", exclude)
+        if not any(set_data.has_coordinate(i) for i in range(len(set_data))):
+            self.current_set_id -= 1
+            messagebox.showinfo("Makro Kaydı", "Kayıtta tıklama bulunamadı.")
+            return
+        for i in range(len(set_data)):
+            coord = set_data.coordinate(i)
+            if coord:
+                set_data.set_coordinate(i, self.to_reference_point(set_data, i, coord.x, coord.y))
+        self.sets[self.current_set_id] = set_data
+        self.autosave.mark_dirty(self.current_set_id)
+        self.create_set_button(self.current_set_id)
+        
+        # Ham kayıt runner.py ile oynatılmak üzere ayrıca saklanabilir
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=MACRO_EXTENSION,
+            filetypes=[("Makro kaydı", f"*{MACRO_EXTENSION}")],
+            title="Makro Kaydını Kaydet (isteğe bağlı)"
+        )
+        if file_path:
+            try:
+                save_recording(file_path, recording)
+            except OSError as e:
+                messagebox.showerror("Hata", f"Makro kaydedilemedi: {str(e)}")
+
     def toggle_automation(self):
         """Otomasyonu başlatır/durdurur"""
         if not self.running:
@@ -1279,24 +1777,28 @@ class AutoClickerApp:
             if not self.execution_queue:
                 messagebox.showwarning("Uyarı", "İşlem kuyruğu boş!")
                 return
+            # Önceki motor bitmeden yenisi başlatılmaz: ikisi aynı anda giriş gönderirdi
+            if not self.join_stopping_engine():
+                messagebox.showwarning("Uyarı", "Önceki çalışma henüz durmadı, biraz sonra tekrar deneyin.")
+                return
                 
-            # Başlamadan önce TÜM setlerin metin ve gecikme verilerini kaydet
-            for set_id in self.sets:
-                if set_id == self.active_set:
-                    self.sets[set_id]['texts'] = [entry.get() for entry in self.text_entries]
-                    self.sets[set_id]['delays'] = [f"{float(entry.get()):.1f}" for entry in self.delay_entries]
+            # Başlamadan önce aktif setin metin ve gecikme verilerini kaydet
+            self.store_active_set_entries()
             
             # Otomasyonu başlat
             self.running = True
             self.paused = False
             
             # Yeni başlatma ise sayaçları sıfırla
+            self.current_entry = None
             self.current_loop = 0
             self.current_coord = 0
             
-            # P tuşunu bağla
-            keyboard.unhook_all()  # Önce tüm bağlantıları temizle
-            keyboard.on_press_key('p', self.handle_pause_key)
+            # P tuşunu ve acil durdurma tuşunu bağla
+            self.hotkeys.rebind_group('run', [
+                ('p', self.handle_pause_key),
+                (EMERGENCY_STOP_KEY, self.handle_emergency_stop),
+            ])
             
             self.automation_button.config(
                 text="⏹️ Otomasyonu Durdur",
@@ -1309,14 +1811,25 @@ class AutoClickerApp:
             )
             
             # İşlem kuyruğunu başlat
-            self.process_queue()
+            self.start_engine()
         else:
             # Otomasyonu durdur
             self.running = False
             self.paused = False
-            
-            # P tuşu bağlantısını kaldır
-            keyboard.unhook_all()
+            if self.engine is not None:
+                self.engine.stop()
+                self.stopping_engine = self.engine
+                self.engine = None
+                if self.join_stopping_engine():
+                    # Motorun son mesajlarını (istatistikler, 'finished') işle
+                    self.poll_engine_status()
+            self.highlight_queue_entry(None)
+            
+            # Çalışma kısayollarını kaldır
+            self.hotkeys.unbind_group('run')
+            for name, stats in self.hotkeys.callback_stats.summary().items():
+                print(f"Kısayol süresi ({name}): ort {stats['mean_ms'] * 1000:.0f} µs, "
+                      f"maks {stats['max_ms'] * 1000:.0f} µs ({stats['count']} çağrı)")
             
             self.automation_button.config(
                 text="▶️ Otomasyonu Başlat",
@@ -1328,6 +1841,93 @@ class AutoClickerApp:
                 state=tk.DISABLED
             )
 
+    def save_input_settings(self):
+        """Hızlı giriş ayarlarını projeye kaydeder"""
+        self.project_settings['fast_input'] = self.fast_input_var.get()
+        self.project_settings['input_backend'] = self.input_backend_var.get()
+        try:
+            pause = float(self.input_pause_entry.get())
+            if pause < 0:
+                raise ValueError
+            self.project_settings['input_pause'] = pause
+        except ValueError:
+            # Geçersiz değer girilirse eski değere dön
+            self.input_pause_entry.delete(0, tk.END)
+            self.input_pause_entry.insert(0, str(self.project_settings['input_pause']))
+        self.project_settings['text_mode'] = self.text_mode_var.get()
+        try:
+            interval = float(self.text_interval_entry.get())
+            if not 0 <= interval < 10:
+                raise ValueError
+            self.project_settings['text_interval'] = interval
+        except ValueError:
+            self.text_interval_entry.delete(0, tk.END)
+            self.text_interval_entry.insert(0, str(self.project_settings['text_interval']))
+        try:
+            poll = float(self.wait_poll_entry.get())
+            if not 0.001 <= poll <= 1:
+                raise ValueError
+            self.project_settings['wait_poll'] = poll
+        except ValueError:
+            self.wait_poll_entry.delete(0, tk.END)
+            self.wait_poll_entry.insert(0, str(self.project_settings['wait_poll']))
+
+    def update_input_settings_ui(self):
+        """Hızlı giriş ayarlarını UI'a yansıtır"""
+        self.fast_input_var.set(self.project_settings['fast_input'])
+        self.input_backend_var.set(self.project_settings['input_backend'])
+        self.input_pause_entry.delete(0, tk.END)
+        self.input_pause_entry.insert(0, str(self.project_settings['input_pause']))
+        self.text_mode_var.set(self.project_settings['text_mode'])
+        self.text_interval_entry.delete(0, tk.END)
+        self.text_interval_entry.insert(0, str(self.project_settings['text_interval']))
+        self.wait_poll_entry.delete(0, tk.END)
+        self.wait_poll_entry.insert(0, str(self.project_settings['wait_poll']))
+
+    def join_stopping_engine(self):
+        """Durdurulan motorun bitmesini kısa süre bekler; bittiyse (veya yoksa) True"""
+        engine = self.stopping_engine
+        if engine is None:
+            return True
+        engine.join(ENGINE_STOP_TIMEOUT)
+        if engine.is_alive():
+            return False
+        self.stopping_engine = None
+        return True
+
+    def start_engine(self):
+        """Çalıştırma motorunu başlatır ve durum takibini kurar"""
+        # Önceki çalışmadan kalan mesajları at
+        self.engine_status = queue.Queue()
+        # Setler bir kez derlenir; çalışma sırasında sözlük/metin işlemi yapılmaz
+        # Koordinatlar bu ekranın piksellerine derleme sırasında bir kez çözülür
+        try:
+            plan = compile_plan(self.sets, self.execution_queue, self.project_settings['text_mode'],
+                                self.display_transform())
+        except (KeyError, ValueError) as e:
+            # Kuyrukta olmayan set veya geçersiz bekleme koşulu
+            messagebox.showerror("Hata", f"Kuyruk derlenemedi: {e}")
+            self.toggle_automation()
+            return
+        try:
+            backend = create_backend(self.project_settings)
+        except Exception as e:
+            messagebox.showerror("Hata", f"Giriş arka ucu başlatılamadı: {str(e)}")
+            self.toggle_automation()
+            return
+        # Kendi köşe kontrolü olmayan arka uçlarda izleyici thread kullanılır
+        # Kuyruk canlı paylaşılır; çalışma sırasında eklenen setler motorda derlenir
+        self.engine = ExecutionEngine(plan, backend, self.engine_status,
+                                      failsafe=not backend.builtin_failsafe,
+                                      queue=self.execution_queue, sets=self.sets,
+                                      text_interval=self.project_settings['text_interval'],
+                                      poll_interval=self.project_settings['wait_poll'],
+                                      capture_max_age=self.project_settings['capture_max_age'])
+        self.engine.start()
+        if self.engine_poll_job is not None:
+            self.root.after_cancel(self.engine_poll_job)
+        self.engine_poll_job = self.root.after(16, self.poll_engine_status)
+
     def on_coordinate_click(self, event=None):
         """Koordinat kaydetme işlemini yapar"""
         if not self.recording_mode:
@@ -1338,34 +1938,31 @@ class AutoClickerApp:
         y = self.root.winfo_pointery()
         
         # Boş koordinat bul
-        for i, coord in enumerate(self.sets[self.active_set]['coordinates']):
+        set_data = self.sets[self.active_set]
+        for i, coord in enumerate(set_data['coordinates']):
             if coord is None:
                 # Yeni koordinatı kaydet
-                self.sets[self.active_set]['coordinates'][i] = Point(x, y)
-                
-                # UI'ı güncelle
-                self.coordinates_labels[i].config(
-                    text=f"K {i+1}: ({x}, {y})"
-                )
+                set_data['coordinates'][i] = self.to_reference_point(set_data, i, x, y)
                 
                 # İlk boş koordinatı bulduk, döngüden çık
                 break
+        else:
+            # Set doluysa yeni slot açıp oraya kaydet
+            i = len(set_data['coordinates'])
+            self.add_coordinate_slots(1)
+            set_data['coordinates'][i] = self.to_reference_point(set_data, i, x, y)
+        
+        # UI'ı güncelle
+        self.scroll_to_coordinate(i)
+        self.refresh_coordinate(i)
 
     def add_new_set(self):
         """Yeni set ekler"""
         self.current_set_id += 1
         
         # Yeni set için veri yapısı oluştur
-        self.sets[self.current_set_id] = {
-            'name': f"Set {self.current_set_id}",
-            'coordinates': [None] * 20,
-            'names': [f"K {i+1}" for i in range(20)],
-            'clicks': ['left'] * 20,
-            'delays': [f"{0.5:.1f}"] * 20,  # Varsayılan gecikme süresi float formatında
-            'order': list(range(20)),
-            'loop_count': 1,
-            'texts': [''] * 20
-        }
+        self.sets[self.current_set_id] = new_set_data(f"Set {self.current_set_id}")
+        self.autosave.mark_dirty(self.current_set_id)
         
         # Set butonunu oluştur
         self.create_set_button(self.current_set_id)
@@ -1380,12 +1977,18 @@ class AutoClickerApp:
         if new_name:
             # Set ismini güncelle
             self.sets[set_id]['name'] = new_name
+            self.autosave.mark_dirty(set_id)
             
             # Set butonunun textini güncelle
             for i, btn in enumerate(self.set_buttons):
                 if i+1 == set_id:  # Buton sırası set_id'yi belirliyor
                     btn.config(text=new_name)
                     break
+            
+            # Kuyruktaki etiketlerini güncelle
+            for queue_item in self.queue_items.values():
+                if queue_item.set_id == set_id:
+                    queue_item.set_label.config(text=new_name)
 
     def save_loop_count(self, event=None):
         """Döngü sayısını kaydeder"""
@@ -1396,6 +1999,7 @@ class AutoClickerApp:
                 self.loop_count_entry.delete(0, tk.END)
                 self.loop_count_entry.insert(0, "1")
             self.sets[self.active_set]['loop_count'] = count
+            self.autosave.mark_dirty(self.active_set)
         except ValueError:
             # Geçersiz değer girilirse varsayılan değere dön
             self.loop_count_entry.delete(0, tk.END)
@@ -1409,61 +2013,41 @@ class AutoClickerApp:
 
     def toggle_click_type(self, index, click_type):
         """Tıklama tipini değiştirir"""
-        # Tüm butonları pasif renge çevir
-        self.left_buttons[index].configure(bg=self.colors['bg'], fg=self.colors['text'])
-        self.right_buttons[index].configure(bg=self.colors['bg'], fg=self.colors['text'])
-        self.double_buttons[index].configure(bg=self.colors['bg'], fg=self.colors['text'])
-        
-        # Seçilen butonu aktif yap
-        if click_type == 'left':
-            self.left_buttons[index].configure(bg=self.colors['primary'], fg='white')
-            self.sets[self.active_set]['clicks'][index] = 'left'
-        elif click_type == 'right':
-            self.right_buttons[index].configure(bg=self.colors['primary'], fg='white')
-            self.sets[self.active_set]['clicks'][index] = 'right'
-        elif click_type == 'double':
-            self.double_buttons[index].configure(bg=self.colors['primary'], fg='white')
-            self.sets[self.active_set]['clicks'][index] = 'double'
+        if click_type in ('left', 'right', 'double'):
+            self.sets[self.active_set]['clicks'][index] = click_type
+            self.refresh_coordinate(index)
 
     def handle_pause_key(self, event):
         """P tuşuna basıldığında çağrılır"""
-        if self.running:
-            self.paused = not self.paused
-            
-            if self.paused:
-                # Duraklatıldı
-                self.pause_button.config(
-                    text="▶️ Devam Et",
-                    bg=self.colors['success'],
-                    fg='white'
-                )
-            else:
-                # Devam ediyor
-                self.pause_button.config(
-                    text="⏸️ Duraklat",
-                    bg=self.colors['bg'],
-                    fg=self.colors['text']
-                )
-                # Devam ettirme
-                self.root.after(100, self.process_queue)
+        # keyboard thread'inden çağrılır; Tk'ya dokunmadan sadece motora iletilir
+        engine = self.engine
+        if self.running and engine is not None:
+            engine.toggle_pause()
+
+    def handle_emergency_stop(self, event=None):
+        """Acil durdurma tuşuna basıldığında çağrılır"""
+        # keyboard thread'inden çağrılır; UI meşgul olsa bile motor hemen durur.
+        # UI, motorun 'finished' mesajıyla kendini günceller.
+        engine = self.engine
+        if engine is not None:
+            engine.stop()
+            print("Acil durdurma tuşuna basıldı, otomasyon durduruldu.")
 
     def new_file(self):
         """Yeni dosya oluşturur"""
         if messagebox.askokcancel("Yeni", "Tüm setler silinecek. Emin misiniz?"):
+            # Eski projenin bekleyen değişikliklerini yaz ve dosyadan ayrıl
+            self.autosave.flush(self.project_snapshot())
+            self.autosave.detach()
+            if hasattr(self, 'current_file'):
+                del self.current_file
+            self.root.title("Otomasyon")
+            
             # Setleri temizle
             self.sets.clear()
             
             # İlk seti oluştur
-            self.sets[1] = {
-                'name': "Set 1",
-                'coordinates': [None] * 20,
-                'names': [f"K {i+1}" for i in range(20)],
-                'clicks': ['left'] * 20,
-                'delays': [f"{0.5:.1f}"] * 20,  # Varsayılan gecikme süresi float formatında
-                'order': list(range(20)),
-                'loop_count': 1,
-                'texts': [''] * 20
-            }
+            self.sets[1] = new_set_data("Set 1")
             
             # Set butonlarını temizle
             for btn in self.set_buttons:
@@ -1477,43 +2061,69 @@ class AutoClickerApp:
             self.active_set = 1
             self.current_set_id = 1
             
+            # Proje ayarlarını varsayılana döndür
+            self.project_settings.update({'fast_input': False, 'input_pause': 0.0, 'input_backend': 'pyautogui',
+                                          'text_mode': 'type', 'text_interval': 0.0,
+                                          'wait_poll': DEFAULT_POLL_MS / 1000,
+                                          'capture_max_age': DEFAULT_CAPTURE_AGE_MS / 1000,
+                                          'reference_screen': None})
+            self.update_input_settings_ui()
+            
             # UI'ı güncelle
-            self.switch_set(1)
+            self.switch_set(1, store_current=False)
+
+    def project_snapshot(self):
+        """Kaydedilecek proje verisini döndürür"""
+        return {
+            'sets': self.sets,
+            'active_set': self.active_set,
+            'current_set_id': self.current_set_id,
+            'execution_queue': self.execution_queue.set_ids(),
+            'settings': self.project_settings
+        }
+
+    def autosave_tick(self):
+        """Değişen setleri periyodik olarak arka plan kaydına gönderir"""
+        try:
+            self.autosave.flush(self.project_snapshot())
+        except Exception as e:
+            print(f"Otomatik kayıt hatası: {e}")
+        self.root.after(AUTOSAVE_INTERVAL_MS, self.autosave_tick)
+
+    def export_telemetry(self):
+        """Son çalışmanın adım ölçümlerini CSV, JSON veya Prometheus dosyasına yazar"""
+        telemetry = self.last_telemetry
+        if telemetry is None or not telemetry.count:
+            messagebox.showinfo("Bilgi", "Henüz ölçüm yok, önce kuyruğu çalıştırın.")
+            return
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV (adımlar)", "*.csv"), ("JSON (histogramlar ve adımlar)", "*.json"),
+                       ("Prometheus metin biçimi", "*.prom")],
+            title="Adım Ölçümlerini Dışa Aktar"
+        )
+        if not file_path:
+            return
+        telemetry.set_names = {set_id: self.sets[set_id].name
+                               for set_id in telemetry.by_set if set_id in self.sets}
+        try:
+            telemetry.export(file_path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Hata", f"Ölçümler yazılamadı: {e}\n"
+                                         f"Desteklenen uzantılar: {', '.join(TELEMETRY_FORMATS)}")
 
     def save_file(self):
-        """Mevcut dosyaya kaydeder"""
+        """Mevcut dosyaya kaydeder (yazma arka planda yapılır)"""
         if not hasattr(self, 'current_file'):
             return self.save_as_file()
         
         try:
-            # Mevcut setin metin verilerini kaydet
-            self.sets[self.active_set]['texts'] = [entry.get() for entry in self.text_entries]
-            
-            data = {
-                'sets': {},
-                'active_set': self.active_set,
-                'current_set_id': self.current_set_id,
-                'execution_queue': self.execution_queue
-            }
-            
-            # Her seti kaydet
-            for set_id, set_data in self.sets.items():
-                data['sets'][str(set_id)] = {
-                    'name': set_data['name'],
-                    'coordinates': [(coord.x, coord.y) if coord else None 
-                                  for coord in set_data['coordinates']],
-                    'names': set_data['names'],
-                    'clicks': set_data['clicks'],
-                    'delays': set_data['delays'],
-                    'order': set_data['order'],
-                    'loop_count': set_data['loop_count'],
-                    'texts': set_data['texts']  # Metin verilerini kaydet
-                }
-            
-            with open(self.current_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # Mevcut setin metin ve gecikme verilerini kaydet
+            self.store_active_set_entries()
             
-            messagebox.showinfo("Başarılı", "Dosya kaydedildi!")
+            # Değişiklikleri günlüğe yaz ve ana dosyayı yeniden oluştur
+            self.autosave.flush(self.project_snapshot(), compact_now=True)
+            self.root.title(f"Otomasyon - {os.path.basename(self.current_file)}")
             
         except Exception as e:
             messagebox.showerror("Hata", f"Kaydetme hatası: {str(e)}")
@@ -1522,19 +2132,22 @@ class AutoClickerApp:
         """Farklı dosyaya kaydeder"""
         file_path = filedialog.asksaveasfilename(
             defaultextension=".json",
-            filetypes=[("JSON dosyaları", "*.json"), ("Tüm dosyalar", "*.*")],
+            filetypes=[("JSON dosyaları", "*.json"), ("İkili proje", "*.acp"), ("Tüm dosyalar", "*.*")],
             title="Farklı Kaydet"
         )
         
         if file_path:
             self.current_file = file_path
+            # Yeni dosyaya tüm setler yazılır
+            self.autosave.attach(file_path)
+            self.autosave.mark_all_dirty(self.sets)
             return self.save_file()
 
     def open_file(self):
         """Dosyadan yükler"""
         file_path = filedialog.askopenfilename(
             defaultextension=".json",
-            filetypes=[("JSON dosyaları", "*.json"), ("Tüm dosyalar", "*.*")],
+            filetypes=[("JSON dosyaları", "*.json"), ("İkili proje", "*.acp"), ("Tüm dosyalar", "*.*")],
             title="Dosya Aç"
         )
         
@@ -1546,54 +2159,49 @@ class AutoClickerApp:
             if self.running:
                 self.toggle_automation()
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Eski projenin bekleyen değişikliklerini yaz
+            self.autosave.flush(self.project_snapshot())
             
-            # Mevcut setleri temizle
-            self.sets.clear()
+            # Önceki oturumdan kalan günlük kayıtları da uygulanır
+            project = load_project_with_journal(file_path)
+            
+            # Mevcut set butonlarını temizle
             for btn in self.set_buttons:
                 btn.destroy()
             self.set_buttons.clear()
             
-            # Setleri yükle
-            for set_id, set_data in data['sets'].items():
-                set_id = int(set_id)
-                self.sets[set_id] = {
-                    'name': set_data['name'],
-                    'coordinates': [Point(x, y) if coords else None 
-                                  for coords in set_data['coordinates']
-                                  for x, y in ([coords] if coords else [(None, None)])],
-                    'names': set_data['names'],
-                    'clicks': set_data['clicks'],
-                    'delays': set_data['delays'],
-                    'order': set_data['order'],
-                    'loop_count': set_data['loop_count'],
-                    'texts': set_data.get('texts', [''] * 20)
-                }
-                
+            # Setleri yükle (ikili dosyada setler ilk erişimde çözülür)
+            self.sets = project['sets']
+            for set_id in self.sets:
                 # Set butonlarını oluştur
                 self.create_set_button(set_id)
             
             # Diğer verileri yükle
-            self.active_set = data['active_set']
-            self.current_set_id = data['current_set_id']
-            self.execution_queue = data.get('execution_queue', [])
+            self.active_set = project['active_set']
+            self.current_set_id = project['current_set_id']
+            self.execution_queue = ExecutionQueue(project['execution_queue'])
+            # Referans ekranı olmayan eski projelerin koordinatları ekran pikselidir
+            self.project_settings['reference_screen'] = None
+            self.project_settings.update(project['settings'])
+            self.update_input_settings_ui()
             
             # Çalışma durumu değişkenlerini sıfırla
             self.running = False
             self.paused = False
             self.current_loop = 0
             self.current_coord = 0
-            self.current_queue_index = 0
+            self.current_entry = None
             
-            # P tuşu bağlantısını temizle
-            keyboard.unhook_all()
+            # Çalışma kısayollarını temizle
+            self.hotkeys.unbind_group('run')
             
             # Dosya yolunu kaydet
             self.current_file = file_path
+            self.autosave.attach(file_path, self.sets)
+            self.root.title(f"Otomasyon - {os.path.basename(file_path)}")
             
             # UI'ı güncelle
-            self.switch_set(self.active_set)
+            self.switch_set(self.active_set, store_current=False)
             self.update_queue_ui()
             
             messagebox.showinfo("Başarılı", "Dosya yüklendi!")
@@ -1605,8 +2213,15 @@ class AutoClickerApp:
         """Pencere kapatıldığında çağrılır"""
         if messagebox.askokcancel("Çıkış", "Değişiklikleri kaydetmek ister misiniz?"):
             self.save_file()
+        else:
+            # Kaydedilmeyen değişikliklerin günlüğünü at
+            self.autosave.discard()
         
         if messagebox.askokcancel("Çıkış", "Programdan çıkmak istiyor musunuz?"):
+            if self.macro_recorder is not None:
+                self.macro_recorder.stop()
+            # Bekleyen yazmaların bitmesini bekle
+            self.autosave.close()
             self.root.destroy()
 
     def rename_coordinate(self, index):
@@ -1624,19 +2239,27 @@ class AutoClickerApp:
             self.sets[self.active_set]['names'][index] = new_name
             
             # Etiketi güncelle
-            coord = self.sets[self.active_set]['coordinates'][index]
-            if coord:
-                self.coordinates_labels[index].config(
-                    text=f"{new_name}: ({coord.x}, {coord.y})"
-                )
-            else:
-                self.coordinates_labels[index].config(
-                    text=f"{new_name}: "
-                )
+            self.refresh_coordinate(index)
 
     # [Diğer metodlar buraya eklenecek]
 
+def report_startup(app, budget_ms=STARTUP_BUDGET_MS, exit_after=False):
+    """Açılış raporunu yazar; exit_after ise bütçeye göre çıkış koduyla kapanır"""
+    text, within = app.startup.report(budget_ms)
+    print(text)
+    if exit_after:
+        app.exit_code = 0 if within else 1
+        app.root.destroy()
+
+
 if __name__ == "__main__":
+    # --startup-report: açılış sürelerini yazar ve bütçe aşıldıysa 1 ile çıkar
+    if '--startup-report' in sys.argv:
+        app = AutoClickerApp(on_first_paint=lambda app: report_startup(app, exit_after=True))
+        app.exit_code = 0
+        app.root.mainloop()
+        sys.exit(app.exit_code)
+    
     app = AutoClickerApp()
     app.root.mainloop()
 
@@ -0,0 +1,308 @@
+"""Arka planda, artımlı ve atomik proje kaydı
+
+Değişen setler UI thread'inde ikili bölüm olarak kopyalanır (ucuz bir anlık
+görüntü) ve ayrı bir thread'de projenin yanındaki ekleme-yalnız günlük
+dosyasına (<proje>.journal) yazılır. Günlük belirli bir boyutu geçince
+günlükle birleştirilmiş proje yan dosyaya (<proje>.autosave.<uzantı>)
+yazılır ve günlük silinir; kullanıcının proje dosyasına yalnızca elle
+kaydedilince yazılır, böylece "kaydetme" denirse yan dosya ve günlük
+silinerek değişiklikler gerçekten atılır. Dosyalar geçici bir dosyaya
+yazılıp os.replace ile yerine konur; yarıda kalan bir yazma bozuk dosya
+bırakmaz. Otomasyon çalışırken yalnızca günlüğe eklenir, dosyaların
+yeniden yazılması çalışma bitene kadar ertelenir.
+"""
+import json
+import os
+import queue
+import struct
+import threading
+import zlib
+
+from project_io import decode_set_binary, encode_set_binary, load_project, save_project
+
+JOURNAL_SUFFIX = '.journal'
+SNAPSHOT_SUFFIX = '.autosave'
+# Günlük bu boyutu geçince yan dosyaya birleştirilir
+COMPACT_BYTES = 1 << 20
+
+# Günlük kaydı: tip (u8), set_id (i32), uzunluk (u32), crc32 (u32), veri
+RECORD_SET = 1
+RECORD_META = 2
+_RECORD_HEADER = struct.Struct('<BiII')
+
+
+def journal_path(path):
+    return str(path) + JOURNAL_SUFFIX
+
+
+def snapshot_path(path):
+    # Uzantı korunur, böylece save_project aynı biçimi seçer
+    root, ext = os.path.splitext(str(path))
+    return f"{root}{SNAPSHOT_SUFFIX}{ext}"
+
+
+def _temp_path(path):
+    # Uzantı korunur, böylece save_project aynı biçimi seçer
+    root, ext = os.path.splitext(str(path))
+    return f"{root}.tmp{ext}"
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def read_journal(path):
+    """Günlükteki sağlam kayıtları (tip, set_id, veri) olarak döndürür
+
+    Yarıda kalmış veya bozuk son kayıt ve sonrası yok sayılır.
+    """
+    try:
+        with open(journal_path(path), 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return []
+
+    records = []
+    offset = 0
+    while offset + _RECORD_HEADER.size <= len(data):
+        kind, set_id, length, crc = _RECORD_HEADER.unpack_from(data, offset)
+        start = offset + _RECORD_HEADER.size
+        payload = data[start:start + length]
+        if len(payload) != length or zlib.crc32(payload) != crc:
+            break
+        records.append((kind, set_id, payload))
+        offset = start + length
+    return records
+
+
+def apply_journal(project, records):
+    """Günlük kayıtlarını proje verisine uygular"""
+    for kind, set_id, payload in records:
+        if kind == RECORD_SET:
+            project['sets'][set_id] = decode_set_binary(payload)
+        elif kind == RECORD_META:
+            meta = json.loads(payload.decode('utf-8'))
+            # set_ids yalnızca set listesi değiştiğinde yazılır; listede olmayan setler silinmiştir
+            if 'set_ids' in meta:
+                set_ids = set(meta.pop('set_ids'))
+                for removed in [s for s in project['sets'] if s not in set_ids]:
+                    del project['sets'][removed]
+            project.update(meta)
+    return project
+
+
+def load_project_with_journal(path):
+    """Projeyi okur ve kaydedilmemiş değişiklikleri (yan dosya ve günlük) uygular"""
+    records = read_journal(path)
+    snapshot = snapshot_path(path)
+    if os.path.exists(snapshot):
+        project = load_project(snapshot)
+    elif os.path.exists(path):
+        project = load_project(path)
+    else:
+        project = {'sets': {}, 'active_set': 1, 'current_set_id': 1,
+                   'execution_queue': [], 'settings': {}}
+    return apply_journal(project, records)
+
+
+def _write_atomic(target, project):
+    temp = _temp_path(target)
+    save_project(temp, project)
+    with open(temp, 'rb+') as f:
+        os.fsync(f.fileno())
+    os.replace(temp, target)
+
+
+def compact(path):
+    """Günlüğü yan dosyayla birleştirip atomik olarak yeniden yazar ve günlüğü siler
+
+    Projenin kendi dosyasına dokunulmaz.
+    """
+    if not read_journal(path):
+        return False
+    _write_atomic(snapshot_path(path), load_project_with_journal(path))
+    _remove(journal_path(path))
+    return True
+
+
+def commit(path):
+    """Yan dosyayı ve günlüğü projenin dosyasına atomik olarak yazar ve ikisini siler"""
+    snapshot = snapshot_path(path)
+    if not read_journal(path) and not os.path.exists(snapshot) and os.path.exists(path):
+        return False
+    _write_atomic(path, load_project_with_journal(path))
+    _remove(snapshot)
+    _remove(journal_path(path))
+    return True
+
+
+class AutosaveService:
+    """Değişen setleri arka planda günlüğe yazan ve yan dosyada biriktiren servis
+
+    mark_dirty ve flush UI thread'inden çağrılır; dosya işlemlerinin tamamı
+    tek bir yazıcı thread'inde sırayla yapılır.
+    """
+
+    def __init__(self, is_busy=lambda: False, compact_bytes=COMPACT_BYTES):
+        self.is_busy = is_busy
+        self.compact_bytes = compact_bytes
+        self.path = None
+        self.dirty = set()
+        self._written = {}  # set_id -> son yazılan bölümün crc32'si
+        self._meta = None
+        self._set_count = None  # Son yazılan set listesinin uzunluğu
+        self._jobs = queue.Queue()
+        self._compact_pending = None  # Günlüğü yan dosyaya birleştirilecek proje
+        self._save_pending = None  # Elle kaydedilip dosyası yazılacak proje
+        self.last_error = None
+        self._thread = threading.Thread(target=self._run, name="Autosave", daemon=True)
+        self._thread.start()
+
+    def attach(self, path, sets=()):
+        """Servisi bir proje dosyasına bağlar
+
+        sets verilirse bu setler dosyada zaten kayıtlı kabul edilir.
+        """
+        self.path = path
+        self.dirty.clear()
+        self._written = {set_id: None for set_id in sets}
+        self._meta = None
+        self._set_count = len(sets) if sets else None
+
+    def detach(self):
+        self.path = None
+        self.dirty.clear()
+        self._written.clear()
+        self._meta = None
+        self._set_count = None
+
+    def mark_dirty(self, set_id):
+        self.dirty.add(set_id)
+
+    def mark_all_dirty(self, sets):
+        self.dirty.update(sets)
+
+    def flush(self, project, compact_now=False):
+        """Değişen setleri ve proje bilgisini günlüğe yazılmak üzere kuyruğa koyar
+
+        compact_now elle kaydetmedir: ardından projenin dosyası yeniden yazılır.
+        """
+        if self.path is None:
+            return
+        sets = project['sets']
+        records = []
+        for set_id in sorted(self.dirty):
+            if set_id not in sets:
+                continue
+            payload = encode_set_binary(sets[set_id])
+            crc = zlib.crc32(payload)
+            if self._written.get(set_id) != crc:
+                self._written[set_id] = crc
+                records.append((RECORD_SET, set_id, payload))
+        self.dirty.clear()
+
+        meta = {
+            'active_set': project['active_set'],
+            'current_set_id': project['current_set_id'],
+            'execution_queue': list(project['execution_queue']),
+            'settings': dict(project.get('settings', {})),
+        }
+        encoded = json.dumps(meta, ensure_ascii=False)
+        # Set listesi büyük olabilir; yalnızca değiştiğinde yazılır. Uygulamada
+        # setler tek tek silinmez, bu yüzden uzunluk karşılaştırması yeterlidir.
+        set_ids_changed = self._set_count != len(sets)
+        if encoded != self._meta or set_ids_changed:
+            self._meta = encoded
+            if set_ids_changed:
+                self._set_count = len(sets)
+                meta['set_ids'] = list(sets)
+                encoded = json.dumps(meta, ensure_ascii=False)
+            records.append((RECORD_META, 0, encoded.encode('utf-8')))
+
+        if records:
+            self._jobs.put(('append', self.path, records))
+        if compact_now:
+            self._jobs.put(('compact', self.path, None))
+
+    def discard(self):
+        """Elle kaydedilmemiş değişiklikleri (günlük ve yan dosya) siler
+
+        Sıradaki bir elle kaydetme iptal edilmez, önce o yapılır. Sonrasında
+        hiçbir setin dosyadaki hali bilinmiyor sayılır (attach gibi), böylece
+        bir sonraki kaydetme değişen setleri yeniden yazar.
+        """
+        if self.path is not None:
+            self._jobs.put(('discard', self.path, None))
+            self._written = {set_id: None for set_id in self._written}
+            self._meta = None
+            self._set_count = None
+
+    def close(self, timeout=None):
+        """Bekleyen işleri bitirir ve yazıcı thread'ini durdurur"""
+        self._jobs.put(('stop', None, None))
+        self._thread.join(timeout)
+
+    def wait(self):
+        """Kuyruktaki işlerin tamamlanmasını bekler"""
+        self._jobs.join()
+
+    def _run(self):
+        while True:
+            try:
+                job, path, records = self._jobs.get(timeout=1.0)
+            except queue.Empty:
+                # Çalışma bittiyse ertelenen sıkıştırmayı yap
+                self._handle(None, None, None)
+                continue
+            try:
+                self._handle(job, path, records)
+            finally:
+                self._jobs.task_done()
+            if job == 'stop':
+                return
+
+    def _handle(self, job, path, records):
+        try:
+            if job == 'append':
+                if self._append(path, records) >= self.compact_bytes:
+                    self._compact_pending = path
+            elif job == 'compact':
+                self._save_pending = path
+            elif job == 'discard':
+                if self._save_pending == path:
+                    # Çalışma sırasında ertelenmiş elle kaydetme atılmaz
+                    self._commit(path)
+                if self._compact_pending == path:
+                    self._compact_pending = None
+                _remove(journal_path(path))
+                _remove(snapshot_path(path))
+            if job == 'stop' or not self.is_busy():
+                if self._save_pending:
+                    self._commit(self._save_pending)
+                if self._compact_pending:
+                    self._compact(self._compact_pending)
+        except Exception as e:
+            self.last_error = e
+            print(f"Otomatik kayıt hatası: {e}")
+
+    def _append(self, path, records):
+        with open(journal_path(path), 'ab') as f:
+            for kind, set_id, payload in records:
+                f.write(_RECORD_HEADER.pack(kind, set_id, len(payload), zlib.crc32(payload)))
+                f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+            return f.tell()
+
+    def _compact(self, path):
+        self._compact_pending = None
+        compact(path)
+
+    def _commit(self, path):
+        self._save_pending = None
+        if self._compact_pending == path:
+            self._compact_pending = None  # Kaydetme günlüğü zaten birleştirir
+        commit(path)
@@ -0,0 +1,662 @@
+"""Çalıştırma motoru, dosya işlemleri ve UI yenileme için ölçüm aracı
+
+Örnek:
+    python benchmark.py --output sonuc.json
+    python benchmark.py --baseline baseline.json
+    python benchmark.py --save-baseline baseline.json
+
+Motor ölçümleri NullBackend/RecordingBackend ile yapılır, ekran gerekmez.
+switch_set ölçümü için Tk ekranı (gerçek veya Xvfb) gerekir; yoksa atlanır.
+Şablon araması ve bekleme koşulları sentetik görüntülerde ölçülür; numpy yoksa
+atlanır.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from array import array
+
+from autosave import AutosaveService, journal_path, snapshot_path
+from engine import TEXT_ACTIONS, ExecutionEngine, compile_plan
+from input_backends import NullBackend, RecordingBackend
+from models import TEXT_MODE_CODES, TEXT_MODES, Point, new_set_data
+from project_io import load_project, save_project
+from recorder import (EVENT_BUTTON_DOWN, EVENT_BUTTON_UP, EVENT_MOVE, EventRing, Recording,
+                      decode_recording, encode_recording, replay)
+
+# Karşılaştırmada izin verilen göreli kötüleşme
+DEFAULT_TOLERANCE = 0.10
+
+# Metrik adı sonekine göre iyileşme yönü: True -> büyük değer daha iyi
+HIGHER_IS_BETTER = {
+    'steps_per_sec': True,
+    'chars_per_sec': True,
+    '_ms': False,
+    '_us': False,
+    '_ns': False,
+}
+
+
+def make_project(set_count, steps_per_set, queue_length=None):
+    """Ölçüm için sentetik bir proje oluşturur"""
+    sets = {}
+    for set_id in range(1, set_count + 1):
+        set_data = new_set_data(f"Set {set_id}", steps_per_set)
+        for i in range(steps_per_set):
+            # Gerçek projeler gibi slotların bir kısmı boş kalsın
+            if i % 10 < 8:
+                set_data['coordinates'][i] = Point(100 + i, 200 + set_id % 500)
+            set_data['clicks'][i] = ('left', 'right', 'double')[i % 3]
+            if i % 25 == 0:
+                set_data['texts'][i] = f"metin {i}"
+        sets[set_id] = set_data
+
+    if queue_length is None:
+        queue_length = set_count
+    return {
+        'sets': sets,
+        'active_set': 1,
+        'current_set_id': set_count,
+        'execution_queue': [(i % set_count) + 1 for i in range(queue_length)],
+        'settings': {}
+    }
+
+
+def set_fixed_timing(plan, delay_ns):
+    """Plandaki tüm gecikmeleri sabitler ve metin adımlarını kaldırır"""
+    for i in range(len(plan)):
+        plan.delays_ns[i] = delay_ns
+    plan.text_ids[:] = array('i', [-1] * len(plan))
+
+
+def run_engine(plan, backend):
+    """Planı motorda çalıştırır ve motoru döndürür"""
+    engine = ExecutionEngine(plan, backend)
+    engine.start()
+    engine.join()
+    return engine
+
+
+def bench_throughput(step_count):
+    """Gecikmesiz planda saniyedeki adım sayısını ölçer"""
+    project = make_project(1, step_count)
+    started = time.perf_counter()
+    plan = compile_plan(project['sets'], project['execution_queue'])
+    compile_ms = (time.perf_counter() - started) * 1000
+    set_fixed_timing(plan, 0)
+
+    started = time.perf_counter()
+    run_engine(plan, NullBackend())
+    elapsed = time.perf_counter() - started
+    return {
+        'compile_ms': compile_ms,
+        'steps_per_sec': len(plan) / elapsed if elapsed else 0.0,
+    }
+
+
+def bench_jitter(step_count, cadence_ms):
+    """Sabit aralıkla çalışan planda zamanlama sapmasını ölçer"""
+    project = make_project(1, step_count)
+    plan = compile_plan(project['sets'], project['execution_queue'])
+    set_fixed_timing(plan, int(cadence_ms * 1_000_000))
+
+    backend = RecordingBackend(capacity=len(plan))
+    engine = run_engine(plan, backend)
+    jitter = engine.scheduler.jitter.summary()
+
+    # Kayıtlı olay zamanlarından toplam kaymayı hesapla
+    events = backend.events()
+    drift_us = 0.0
+    if len(events) > 1:
+        planned = (len(events) - 1) * cadence_ms * 1000
+        actual = (events[-1][0] - events[0][0]) / 1000
+        drift_us = actual - planned
+    return {
+        'jitter_mean_us': jitter['mean_us'],
+        'jitter_max_us': jitter['max_us'],
+        'drift_us': abs(drift_us),
+    }
+
+
+def bench_stop_latency(delay_ms):
+    """Durdurma isteği ile motorun bitmesi arasındaki süreyi ölçer"""
+    project = make_project(1, 100)
+    plan = compile_plan(project['sets'], project['execution_queue'])
+    set_fixed_timing(plan, int(delay_ms * 1_000_000))
+
+    engine = ExecutionEngine(plan, NullBackend())
+    engine.start()
+    # Motor bir gecikmenin ortasındayken durdur
+    time.sleep(delay_ms / 2000)
+    started = time.perf_counter()
+    engine.stop()
+    engine.join()
+    return {'stop_latency_ms': (time.perf_counter() - started) * 1000}
+
+
+class SlowTypingBackend(RecordingBackend):
+    """Her karakteri char_ns sürede "yazan" kayıt arka ucu
+
+    Gerçek klavye girişinin süresini taklit eder ve gönderilen son olayın
+    zamanını last_event_ns'de tutar. Toplu yazma ve yapıştırma, karakter
+    sayısından bağımsız olarak tek bir gidiş-dönüş (char_ns) sürer.
+    """
+
+    def __init__(self, char_ns, capacity=1024):
+        super().__init__(capacity=capacity)
+        self.char_ns = char_ns
+        self.last_event_ns = 0
+
+    def click(self, x, y, button):
+        super().click(x, y, button)
+        self.last_event_ns = time.monotonic_ns()
+
+    def write(self, text):
+        super().write(text)
+        for _ in text:
+            until = time.monotonic_ns() + self.char_ns
+            while time.monotonic_ns() < until:
+                pass
+            self.last_event_ns = time.monotonic_ns()
+
+    def _round_trip(self):
+        until = time.monotonic_ns() + self.char_ns
+        while time.monotonic_ns() < until:
+            pass
+        self.last_event_ns = time.monotonic_ns()
+
+    def write_batch(self, text, interval_ms=0):
+        RecordingBackend.write(self, text)
+        self._round_trip()
+
+    def paste(self, text):
+        super().paste(text)
+        self._round_trip()
+
+
+def bench_text_modes(text_chars, char_us=200):
+    """Her metin modunda uzun bir metnin saniyede kaç karakterle yazıldığını ölçer"""
+    set_data = new_set_data("Metin", 1)
+    set_data['coordinates'][0] = Point(10, 10)
+    set_data['texts'][0] = "x" * text_chars
+    results = {}
+    for mode in TEXT_MODES:
+        plan = compile_plan({1: set_data}, [1], mode)
+        engine = run_engine(plan, SlowTypingBackend(char_us * 1000))
+        stats = engine.dispatch_stats.summary()[TEXT_ACTIONS[TEXT_MODE_CODES[mode]]]
+        results[f'{mode}_chars_per_sec'] = stats['chars_per_sec']
+        results[f'{mode}_ms'] = stats['mean_ms']
+    return results
+
+
+def bench_recorder(event_count, rate_hz=1000):
+    """Makro kaydının halka tampon, kodlama ve oynatma maliyetlerini ölçer
+
+    Olaylar rate_hz hızında, çoğu küçük fare hareketi olan yapay bir kayıttır.
+    Oynatma RecordingBackend ile gerçek zamanlı yapılır.
+    """
+    period_ns = 1_000_000_000 // rate_hz
+    ring = EventRing(1 << max(10, (event_count - 1).bit_length()))
+    started = time.perf_counter_ns()
+    for i in range(event_count):
+        kind = EVENT_MOVE if i % 50 else (EVENT_BUTTON_DOWN if i % 100 else EVENT_BUTTON_UP)
+        ring.push(i * period_ns, kind, 500 + i % 7, 300 + i % 5, 0)
+    push_ns = (time.perf_counter_ns() - started) / event_count
+    recording = Recording()
+    ring.drain(recording)
+
+    started = time.perf_counter()
+    data = encode_recording(recording)
+    encode_ms = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    decoded = decode_recording(data)
+    decode_ms = (time.perf_counter() - started) * 1000
+    assert len(decoded) == event_count and ring.dropped == 0
+
+    # Oynatma: kaydın ilk saniyesi
+    sample = Recording()
+    for event in list(decoded.events())[:rate_hz]:
+        sample.append(*event)
+    jitter = replay(sample, RecordingBackend(capacity=rate_hz))
+    return {
+        'push_ns': push_ns,
+        'bytes_per_event': len(data) / event_count,
+        'encode_ms': encode_ms,
+        'decode_ms': decode_ms,
+        'replay_jitter_mean_us': jitter['mean_us'],
+        'replay_jitter_max_us': jitter['max_us'],
+    }
+
+
+def bench_stop_guarantee(trials, budget_ms, char_us=500, seed=1):
+    """Durdurmadan sonra budget_ms'den geç giriş olayı gönderilmediğini doğrular
+
+    Her adımda tıklama ve uzun bir metin vardır; motor rastgele anlarda
+    durdurulur ve durdurmadan sonra gönderilen son olayın gecikmesi ölçülür.
+    """
+    rng = random.Random(seed)
+    set_data = new_set_data("Durdurma", 20)
+    for i in range(20):
+        set_data['coordinates'][i] = Point(10 + i, 10)
+        set_data['texts'][i] = "x" * 64
+    plan = compile_plan({1: set_data}, [1])
+    for i in range(len(plan)):
+        plan.delays_ns[i] = 1_000_000
+
+    late_ms = []
+    join_ms = []
+    for _ in range(trials):
+        backend = SlowTypingBackend(char_us * 1000)
+        engine = ExecutionEngine(plan, backend)
+        engine.start()
+        time.sleep(rng.uniform(0.0, 0.2))
+        stopped_at = time.monotonic_ns()
+        engine.stop()
+        engine.join()
+        join_ms.append((time.monotonic_ns() - stopped_at) / 1e6)
+        late_ms.append(max(0, backend.last_event_ns - stopped_at) / 1e6)
+    return {
+        'stop_late_max_ms': max(late_ms),
+        'stop_join_max_ms': max(join_ms),
+        'budget_ms': budget_ms,
+        'within_budget': max(late_ms) <= budget_ms,
+    }
+
+
+def bench_pause_resume(delay_ms, pause_ms=100.0):
+    """Duraklat/devam et sonrası kalan gecikmenin korunmasını ve devam gecikmesini ölçer
+
+    Motor bir gecikmenin ortasında duraklatılır; devam edilince bir sonraki
+    adım, kalan gecikme kadar sonra gelmelidir. Sapma devam gecikmesini de
+    içerir.
+    """
+    project = make_project(1, 2)
+    plan = compile_plan(project['sets'], project['execution_queue'])
+    set_fixed_timing(plan, int(delay_ms * 1_000_000))
+
+    backend = RecordingBackend(capacity=len(plan))
+    engine = ExecutionEngine(plan, backend)
+    engine.start()
+    time.sleep(delay_ms / 2000)
+    paused_at = time.monotonic_ns()
+    engine.pause()
+    time.sleep(pause_ms / 1000)
+    resumed_at = time.monotonic_ns()
+    engine.resume()
+    engine.join()
+
+    events = backend.events()
+    expected = delay_ms * 1_000_000 + (resumed_at - paused_at)
+    actual = events[1][0] - events[0][0]
+    return {'resume_error_us': abs(actual - expected) / 1000}
+
+
+def bench_file_io(set_count, steps_per_set):
+    """Proje kaydetme ve yükleme süresini JSON ve ikili biçim için ölçer"""
+    project = make_project(set_count, steps_per_set)
+    results = {}
+    for suffix, prefix in (('.json', ''), ('.acp', 'binary_')):
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        os.close(fd)
+        try:
+            started = time.perf_counter()
+            save_project(path, project)
+            results[f'{prefix}save_ms'] = (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            load_project(path)
+            results[f'{prefix}load_ms'] = (time.perf_counter() - started) * 1000
+            results[f'{prefix}file_bytes'] = os.path.getsize(path)
+        finally:
+            os.remove(path)
+    return results
+
+
+def bench_autosave(set_count, step_count, cadence_ms):
+    """Çalışma sırasında otomatik kaydın zamanlamaya etkisini ölçer
+
+    Büyük bir proje açıkken motor çalışır; UI thread'i gibi her 50 ms'de
+    birkaç set değiştirilip arka plan kaydına gönderilir.
+    """
+    project = make_project(set_count, 20, queue_length=1)
+    steps = make_project(1, step_count)
+    plan = compile_plan(steps['sets'], steps['execution_queue'])
+    set_fixed_timing(plan, int(cadence_ms * 1_000_000))
+
+    fd, path = tempfile.mkstemp(suffix='.acp')
+    os.close(fd)
+    save_project(path, project)
+    engine = ExecutionEngine(plan, RecordingBackend(capacity=len(plan)))
+    autosave = AutosaveService(is_busy=engine.is_alive)
+    autosave.attach(path, project['sets'])
+    flush_ns = []
+    try:
+        engine.start()
+        revision = 0
+        while engine.is_alive():
+            revision += 1
+            for set_id in range(1, min(set_count, 4) + 1):
+                project['sets'][set_id].delays_ms[0] = 500 + revision
+                autosave.mark_dirty(set_id)
+            started = time.perf_counter_ns()
+            autosave.flush(project)
+            flush_ns.append(time.perf_counter_ns() - started)
+            time.sleep(0.05)
+        engine.join()
+        autosave.close()
+    finally:
+        for leftover in (path, journal_path(path), snapshot_path(path)):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+    jitter = engine.scheduler.jitter.summary()
+    return {
+        'flush_ms': max(flush_ns, default=0) / 1e6,
+        'jitter_mean_us': jitter['mean_us'],
+        'jitter_max_us': jitter['max_us'],
+    }
+
+
+def bench_template_match(screen_size, template_size=(80, 40), repeats=5, seed=1):
+    """Şablon aramasının yakın ve geniş arama sürelerini sentetik ekranda ölçer"""
+    try:
+        import numpy as np
+        from screen import ImageCapture, TemplateTarget
+    except ImportError as e:
+        return {'skipped': f"{type(e).__name__}: {e}"}
+
+    width, height = screen_size
+    rng = np.random.default_rng(seed)
+    # Arayüze benzer, düz renkli bloklardan oluşan ekran
+    blocks = rng.integers(0, 256, (height // 8 + 1, width // 8 + 1)).astype(np.uint8)
+    image = np.kron(blocks, np.ones((8, 8), dtype=np.uint8))[:height, :width]
+    capture = ImageCapture(image)
+    template_w, template_h = template_size
+    left, top = width // 2, height // 2
+    template = image[top:top + template_h, left:left + template_w]
+    center = (left + template_w // 2, top + template_h // 2)
+
+    wide_ns, near_ns = [], []
+    for _ in range(repeats):
+        target = TemplateTarget(template)
+        match = target.locate(capture)
+        assert match is not None and (match.x, match.y) == center
+        wide_ns.append(match.elapsed_ns)
+        near_ns.append(target.locate(capture).elapsed_ns)
+    miss = TemplateTarget(rng.integers(0, 256, (template_h, template_w)).astype(np.uint8))
+    started = time.perf_counter_ns()
+    assert miss.locate(capture) is None
+    return {
+        'near_ms': statistics.median(near_ns) / 1e6,
+        'wide_ms': statistics.median(wide_ns) / 1e6,
+        'miss_ms': (time.perf_counter_ns() - started) / 1e6,
+    }
+
+
+def bench_screen_wait(step_count, respond_ms, delay_ms=2000, poll_ms=10):
+    """Bekleme koşullu adımların sabit gecikmeye göre kazancını ölçer
+
+    Sahte uygulama, her tıklamadan respond_ms sonra koşulun bölgesini
+    değiştirir; adımların gecikmesi (zaman aşımı) delay_ms'dir.
+    """
+    try:
+        import numpy as np
+        from screen import ImageCapture
+    except ImportError as e:
+        return {'skipped': f"{type(e).__name__}: {e}"}
+
+    capture = ImageCapture(np.zeros((64, 64, 3), dtype=np.uint8))
+
+    def respond():
+        capture.pixels[:8, :8] ^= 0xFF
+
+    class RespondingBackend(RecordingBackend):
+        def screen_capture(self):
+            return capture
+
+        def click(self, x, y, button):
+            super().click(x, y, button)
+            threading.Timer(respond_ms / 1000, respond).start()
+
+    set_data = new_set_data("Bekleme", step_count)
+    for i in range(step_count):
+        set_data['coordinates'][i] = Point(32, 32)
+        set_data.delays_ms[i] = delay_ms
+        set_data.set_wait(i, "change 0,0,8,8")
+    plan = compile_plan({1: set_data}, [1])
+    engine = ExecutionEngine(plan, RespondingBackend(), poll_interval=poll_ms / 1000)
+    started = time.perf_counter()
+    engine.start()
+    engine.join()
+    elapsed = time.perf_counter() - started
+    messages = []
+    while not engine.status_queue.empty():
+        messages.append(engine.status_queue.get_nowait())
+    waits = [message[4] for message in messages if message[0] == 'wait' and message[3]]
+    assert len(waits) == step_count
+    stats = engine.dispatch_stats.summary()['condition']
+    return {
+        'step_ms': elapsed * 1000 / step_count,
+        'fixed_delay_ms': float(delay_ms),
+        'wake_late_ms': statistics.mean(waits) / 1e6 - respond_ms,
+        'check_us': stats['mean_ms'] * 1000,
+    }
+
+
+def bench_capture_cache(check_count, ticks=20, capture_ms=5.0, max_age_ms=10.0):
+    """Aynı anda yapılan check_count kontrolün paylaşılan görüntüyle maliyetini ölçer
+
+    Kaynak her yakalamada capture_ms harcar (tam ekran yakalamayı taklit eder);
+    önbelleksiz durumda her kontrol kendi yakalamasını yapar.
+    """
+    try:
+        import numpy as np
+        from screen import CaptureCache, ImageCapture, ScreenCondition
+    except ImportError as e:
+        return {'skipped': f"{type(e).__name__}: {e}"}
+
+    class SlowCapture(ImageCapture):
+        def grab_rgb(self, left, top, width, height):
+            until = time.perf_counter_ns() + int(capture_ms * 1_000_000)
+            while time.perf_counter_ns() < until:
+                pass
+            return super().grab_rgb(left, top, width, height)
+
+    source = SlowCapture(np.zeros((1080, 1920, 3), dtype=np.uint8))
+    conditions = [ScreenCondition.parse(f"color {40 * i},{20 * i} #000000") for i in range(check_count)]
+
+    def run_ticks(capture):
+        started = time.perf_counter()
+        for _ in range(ticks):
+            for condition in conditions:
+                condition.check(capture)
+            invalidate = getattr(capture, 'invalidate', None)
+            if invalidate is not None:
+                invalidate()  # Her tik bir giriş olayıyla biter
+        return (time.perf_counter() - started) * 1000 / ticks
+
+    cache = CaptureCache(source, max_age_ms / 1000)
+    cached_ms = run_ticks(cache)
+    stats = cache.stats()
+    return {
+        'uncached_tick_ms': run_ticks(source),
+        'cached_tick_ms': cached_ms,
+        'captures_per_tick': stats['misses'] / ticks,
+        'hit_rate': stats['hit_rate'],
+    }
+
+
+def bench_switch_set(set_count, repeats, set_size):
+    """AutoClickerApp.switch_set yenileme süresini ölçer (ekran gerekir)"""
+    try:
+        import automation
+        app = automation.AutoClickerApp()
+    except Exception as e:
+        return {'skipped': f"{type(e).__name__}: {e}"}
+
+    try:
+        app.root.withdraw()
+        project = make_project(set_count, set_size)
+        app.sets.clear()
+        app.sets.update(project['sets'])
+        app.root.update()
+
+        started = time.perf_counter()
+        for i in range(repeats):
+            app.switch_set((i % set_count) + 1)
+            app.root.update_idletasks()
+        elapsed = time.perf_counter() - started
+    finally:
+        app.root.destroy()
+    return {
+        'switch_set_ms': elapsed * 1000 / repeats,
+        'setup_ui_ms': app.startup.phases().get('setup_ui', 0.0),
+    }
+
+
+def run_all(args):
+    """Tüm ölçümleri çalıştırır"""
+    results = {}
+    for step_count in args.steps:
+        results[f'throughput/{step_count}'] = bench_throughput(step_count)
+    results['jitter'] = bench_jitter(args.jitter_steps, args.cadence_ms)
+    results['stop'] = bench_stop_latency(args.stop_delay_ms)
+    results['pause'] = bench_pause_resume(args.cadence_ms * 100)
+    results['stop_guarantee'] = bench_stop_guarantee(args.stop_trials, args.stop_budget_ms)
+    results['text'] = bench_text_modes(args.text_chars)
+    results['recorder'] = bench_recorder(args.macro_events)
+    results['template'] = bench_template_match(args.screen_size)
+    results['screen_wait'] = bench_screen_wait(args.wait_steps, args.respond_ms)
+    results['capture_cache'] = bench_capture_cache(args.capture_checks)
+    results['autosave'] = bench_autosave(args.sets[-1], args.jitter_steps, args.cadence_ms)
+    for set_count in args.sets:
+        results[f'file_io/{set_count}'] = bench_file_io(set_count, args.set_size)
+    if not args.no_ui:
+        results['switch_set'] = bench_switch_set(min(args.sets[-1], 50), args.switch_repeats,
+                                                 args.switch_set_size)
+    return results
+
+
+def metric_direction(name):
+    """Metrik için büyük değerin daha iyi olup olmadığını döndürür, bilinmiyorsa None"""
+    for suffix, higher in HIGHER_IS_BETTER.items():
+        if name.endswith(suffix):
+            return higher
+    return None
+
+
+def compare(results, baseline, tolerance):
+    """Sonuçları baseline ile karşılaştırır ve kötüleşmeleri döndürür"""
+    regressions = []
+    for group, metrics in results.items():
+        base_metrics = baseline.get(group, {})
+        for name, value in metrics.items():
+            base = base_metrics.get(name)
+            higher = metric_direction(name)
+            if higher is None or not isinstance(base, (int, float)) or not base:
+                continue
+            change = (value - base) / base
+            if (higher and change < -tolerance) or (not higher and change > tolerance):
+                regressions.append({
+                    'metric': f"{group}.{name}",
+                    'baseline': base,
+                    'value': value,
+                    'change_pct': change * 100,
+                })
+    return regressions
+
+
+def parse_int_list(value):
+    return [int(part) for part in value.split(',') if part]
+
+
+def parse_size(value):
+    width, height = (int(part) for part in value.lower().split('x'))
+    return width, height
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Otomasyon ölçüm aracı")
+    parser.add_argument('--steps', type=parse_int_list, default=[1000, 10000],
+                        help="Hız ölçümü için adım sayıları (virgülle)")
+    parser.add_argument('--sets', type=parse_int_list, default=[1, 100, 10000],
+                        help="Dosya ölçümü için set sayıları (virgülle)")
+    parser.add_argument('--set-size', type=int, default=20,
+                        help="Dosya ölçümünde set başına koordinat sayısı")
+    parser.add_argument('--jitter-steps', type=int, default=500)
+    parser.add_argument('--cadence-ms', type=float, default=2.0)
+    parser.add_argument('--stop-delay-ms', type=float, default=2000.0)
+    parser.add_argument('--stop-trials', type=int, default=20,
+                        help="Durdurma garantisi için deneme sayısı")
+    parser.add_argument('--stop-budget-ms', type=float, default=10.0,
+                        help="Durdurmadan sonra giriş olayı gönderilebilecek en uzun süre")
+    parser.add_argument('--text-chars', type=int, default=2048,
+                        help="Metin modu ölçümündeki metin uzunluğu")
+    parser.add_argument('--macro-events', type=int, default=100000,
+                        help="Makro kaydı ölçümündeki olay sayısı")
+    parser.add_argument('--screen-size', type=parse_size, default=(1920, 1080),
+                        help="Şablon aramasının sentetik ekran boyutu: GENxYÜK")
+    parser.add_argument('--wait-steps', type=int, default=10,
+                        help="Bekleme koşulu ölçümündeki adım sayısı")
+    parser.add_argument('--respond-ms', type=float, default=50.0,
+                        help="Sahte uygulamanın tıklamaya yanıt süresi (ms)")
+    parser.add_argument('--capture-checks', type=int, default=8,
+                        help="Ekran önbelleği ölçümünde tik başına kontrol sayısı")
+    parser.add_argument('--switch-repeats', type=int, default=20)
+    parser.add_argument('--switch-set-size', type=int, default=2000,
+                        help="switch_set ölçümünde set başına koordinat sayısı")
+    parser.add_argument('--no-ui', action='store_true', help="switch_set ölçümünü atla")
+    parser.add_argument('--output', help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument('--baseline', help="Karşılaştırılacak baseline JSON dosyası")
+    parser.add_argument('--save-baseline', help="Sonuçları baseline olarak kaydet")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="İzin verilen göreli kötüleşme (0.10 = %%10)")
+    args = parser.parse_args(argv)
+
+    results = run_all(args)
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'display': os.environ.get('DISPLAY', ''),
+            'timestamp': time.time(),
+        },
+        'results': results,
+    }
+
+    exit_code = 0
+    if not results['stop_guarantee']['within_budget']:
+        print(f"Durdurma garantisi sağlanmadı: {results['stop_guarantee']['stop_late_max_ms']:.2f} ms "
+              f"> {args.stop_budget_ms:.0f} ms", file=sys.stderr)
+        exit_code = 1
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline.get('results', {}), args.tolerance)
+        report['regressions'] = regressions
+        if regressions:
+            exit_code = 1
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+    else:
+        print(text)
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    for regression in report.get('regressions', []):
+        print(f"Kötüleşme: {regression['metric']} {regression['baseline']:.3f} -> "
+              f"{regression['value']:.3f} ({regression['change_pct']:+.1f}%)", file=sys.stderr)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""Ekran yapılandırması ve çözünürlükten bağımsız koordinat dönüşümü
+
+Koordinatlar projedeki referans ekranın (settings['reference_screen'])
+pikselleri olarak saklanır. Çalışırken her adımın çapasına (ANCHORS) göre
+o anki ekranın piksellerine çevrilir: 'scale' ekranla orantılı ölçeklenir,
+köşe ve merkez çapaları o noktaya olan uzaklığı (yalnızca DPI oranıyla
+ölçekleyerek) korur. Dönüşüm her (referans, ekran) çifti için bir kez
+hesaplanır ve derlenen plana çözülmüş pikseller yazılır; tıklama başına ek
+maliyet yoktur.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+
+from models import ANCHOR_CODES, ANCHOR_SCALE, ANCHORS
+
+# Çapanın referans ekrandaki konumu (0 sol/üst, 1 sağ/alt kenar); None: orantılı
+_ANCHOR_EDGES = {
+    'scale': None,
+    'top_left': (0.0, 0.0), 'top_right': (1.0, 0.0),
+    'bottom_left': (0.0, 1.0), 'bottom_right': (1.0, 1.0),
+    'center': (0.5, 0.5),
+}
+
+
+@dataclass(frozen=True)
+class DisplayConfig:
+    """Bir ekran yapılandırması: piksel boyutu, DPI ölçeği ve sanal masaüstündeki konumu
+
+    scale 96 DPI'ya göre ölçektir; bilinmiyorsa None olur ve DPI oranı 1 sayılır.
+    """
+    width: int
+    height: int
+    scale: float = None
+    left: int = 0
+    top: int = 0
+
+    def to_value(self):
+        """Proje ayarlarına yazılacak liste biçimi"""
+        return [self.width, self.height, self.scale, self.left, self.top]
+
+    @classmethod
+    def from_value(cls, value):
+        """to_value biçiminden (veya [genişlik, yükseklik]) okur; geçersizse None"""
+        try:
+            values = list(value)
+            config = cls(int(values[0]), int(values[1]),
+                         float(values[2]) if len(values) > 2 and values[2] is not None else None,
+                         int(values[3]) if len(values) > 3 else 0,
+                         int(values[4]) if len(values) > 4 else 0)
+        except (TypeError, ValueError, IndexError):
+            return None
+        if config.width <= 0 or config.height <= 0 or (config.scale is not None and config.scale <= 0):
+            return None
+        return config
+
+
+def display_config_from_tk(root):
+    """Tk penceresinin bulunduğu ekranın yapılandırması"""
+    return DisplayConfig(root.winfo_screenwidth(), root.winfo_screenheight(),
+                         round(root.winfo_fpixels('1i') / 96, 3))
+
+
+class CoordinateTransform:
+    """Referans ekrandan o anki ekrana, çapa başına doğrusal dönüşüm
+
+    Her çapa için x' = ax * x + bx, y' = ay * y + by katsayıları tutulur.
+    """
+    __slots__ = ('reference', 'current', 'coefficients', 'identity')
+
+    def __init__(self, reference, current):
+        self.reference = reference
+        self.current = current
+        ratio = current.scale / reference.scale if current.scale and reference.scale else 1.0
+        scale_x = current.width / reference.width
+        scale_y = current.height / reference.height
+
+        # Referans masaüstü konumu çıkarılır, o anki ekranınki eklenir
+        def axis(a, offset, ref_origin, origin):
+            return a, offset + origin - a * ref_origin
+
+        coefficients = []
+        for anchor in ANCHORS:
+            edge = _ANCHOR_EDGES[anchor]
+            if edge is None:
+                x_axis = axis(scale_x, 0.0, reference.left, current.left)
+                y_axis = axis(scale_y, 0.0, reference.top, current.top)
+            else:
+                # Kenara olan uzaklık yalnızca DPI oranıyla ölçeklenir
+                x_axis = axis(ratio, edge[0] * (current.width - reference.width * ratio),
+                              reference.left, current.left)
+                y_axis = axis(ratio, edge[1] * (current.height - reference.height * ratio),
+                              reference.top, current.top)
+            coefficients.append(x_axis + y_axis)
+        self.coefficients = tuple(coefficients)
+        self.identity = all(coefficient == (1.0, 0.0, 1.0, 0.0) for coefficient in self.coefficients)
+
+    def to_device(self, x, y, anchor=ANCHOR_SCALE):
+        """Referans koordinatını o anki ekranın pikseline çevirir"""
+        ax, bx, ay, by = self.coefficients[anchor]
+        return int(round(ax * x + bx)), int(round(ay * y + by))
+
+    def to_reference(self, x, y, anchor=ANCHOR_SCALE):
+        """Ekrandaki pikseli referans koordinatına çevirir (to_device'ın tersi)"""
+        ax, bx, ay, by = self.coefficients[anchor]
+        return int(round((x - bx) / ax)), int(round((y - by) / ay))
+
+
+@lru_cache(maxsize=16)
+def transform_for(reference, current):
+    """(referans, ekran) çifti için önbelleğe alınmış dönüşüm"""
+    return CoordinateTransform(reference, current)
+
+
+def settings_transform(settings, current):
+    """Proje ayarlarındaki referans ekrandan current'a dönüşüm; gerekmiyorsa None"""
+    reference = DisplayConfig.from_value(settings.get('reference_screen'))
+    if reference is None or current is None:
+        return None
+    transform = transform_for(reference, current)
+    return None if transform.identity else transform
+
+
+def anchor_code(anchor):
+    return ANCHOR_CODES.get(anchor, ANCHOR_SCALE)
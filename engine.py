@@ -0,0 +1,917 @@
+"""Otomasyon kuyruğunu Tk döngüsünden bağımsız çalıştıran motor"""
+import itertools
+import queue as queue_module
+import threading
+import time
+from array import array
+
+from input_backends import DispatchStats, FailSafeWatchdog
+from models import (ANCHOR_CODES, ANCHOR_SCALE, CLICK_DOUBLE, CLICK_LEFT, CLICK_RIGHT,
+                    NO_COORDINATE, TEXT_BATCH, TEXT_MODE_CODES, TEXT_MODES, TEXT_PASTE, TEXT_TYPE,
+                    parse_region)
+from screen import (CONDITION_CHANGE, DEFAULT_CAPTURE_AGE_MS, DEFAULT_POLL_MS, CaptureCache,
+                    ScreenCondition)
+from telemetry import StepTelemetry
+
+# Zamanlama sabitleri (nanosaniye)
+MIN_DELAY_NS = 100_000_000  # En az 0.1 sn gecikme
+DEFAULT_DELAY_NS = 500_000_000  # Geçersiz gecikme değeri için varsayılan
+TEXT_PAUSE_NS = 100_000_000  # Tıklama ile metin yazma arasındaki bekleme
+# Metinler bu uzunlukta parçalar halinde yazılır; durdurma parçalar arasında kontrol edilir
+TEXT_CHUNK_CHARS = 8
+SPIN_THRESHOLD_NS = 2_000_000  # Hedefe bu kadar kala uyumak yerine döngüde bekle
+MAX_LAG_NS = 250_000_000  # Bu kadar gecikince yetişmeye çalışmak yerine zamanı yeniden hizala
+
+# Metin yazma süreleri DispatchStats'ta mod başına bu adlarla tutulur
+TEXT_ACTIONS = tuple(f"write:{mode}" for mode in TEXT_MODES)
+
+
+def parse_delay_ns(value):
+    """Gecikme değerini nanosaniyeye çevirir, 0.1 sn alt sınırını uygular"""
+    try:
+        delay = float(value)
+    except (TypeError, ValueError):
+        return DEFAULT_DELAY_NS
+    if delay != delay:  # NaN
+        return DEFAULT_DELAY_NS
+    return max(MIN_DELAY_NS, int(round(delay * 1_000_000_000)))
+
+
+def split_text(text, size=TEXT_CHUNK_CHARS):
+    """Metni en fazla size karakterlik parçalara böler"""
+    return tuple(text[i:i + size] for i in range(0, len(text), size))
+
+
+def execution_order(order, count):
+    """Setin 'order' listesine göre koordinat indekslerini çalışma sırasına dizer
+
+    order[i], i. koordinatın çalışma sırasıdır. Geçersiz değerler koordinatın
+    kendi indeksiyle sıralanır; eşitlikte indeks sırası korunur.
+    """
+    def position(index):
+        if index < len(order) and isinstance(order[index], int):
+            return order[index]
+        return index
+    return sorted(range(count), key=lambda index: (position(index), index))
+
+
+class ExecutionPlan:
+    """Kuyruğun derlenmiş, düz adım listesi
+
+    Her adım paralel dizilerde tutulur; boş koordinatlar derleme sırasında
+    atlanır. texts her metni TEXT_CHUNK_CHARS uzunluğunda parçalara bölünmüş
+    olarak, text_modes de aynı sırayla yazma modunu tutar (yapıştırılacak
+    metinler bölünmez). Adımda mod seçilmemişse text_mode kullanılır.
+    transform verilirse (display.CoordinateTransform) koordinatlar derleme
+    sırasında bir kez ekran piksellerine çözülür; display planın çözüldüğü
+    ekran yapılandırmasıdır (dönüşüm yoksa None). template_ids adımın şablon
+    hedefini (templates listesindeki (dosya, geniş arama alanı) çifti; alan
+    ekran piksellerine çözülmüştür, None tüm ekran; -1 yok) gösterir; şablonlu
+    adımda koordinat yalnızca aramanın başlayacağı yerdir. wait_ids de aynı
+    şekilde adımın bekleme koşulunu (waits, ekran piksellerine çözülmüş
+    ScreenCondition) gösterir. Her set, kuyrukta kaç kez geçerse geçsin bir kez derlenir;
+    ranges set_id için adım aralığını ve döngü sayısını verir. queue,
+    derleme anındaki kuyruk sırasıdır.
+    """
+    __slots__ = ('xs', 'ys', 'clicks', 'delays_ns', 'text_ids', 'coord_ids', 'texts',
+                 'text_modes', 'text_mode', 'template_ids', 'templates', 'wait_ids', 'waits',
+                 'transform', 'display', 'ranges', 'queue', '_text_index', '_template_index',
+                 '_wait_index')
+
+    def __init__(self, text_mode=TEXT_TYPE, transform=None):
+        self.xs = array('i')
+        self.ys = array('i')
+        self.clicks = array('b')
+        self.delays_ns = array('q')
+        self.text_ids = array('i')  # -1: metin yok
+        self.coord_ids = array('i')  # Setteki orijinal koordinat indeksi
+        self.texts = []
+        self.text_modes = array('b')
+        self.text_mode = text_mode
+        self.template_ids = array('i')  # -1: şablon yok
+        self.templates = []
+        self.wait_ids = array('i')  # -1: sabit gecikme
+        self.waits = []
+        self.transform = transform
+        self.display = transform.current if transform is not None else None
+        # set_id -> (başlangıç, bitiş, döngü sayısı)
+        self.ranges = {}
+        self.queue = []
+        self._text_index = {}
+        self._template_index = {}
+        self._wait_index = {}
+
+    def __len__(self):
+        return len(self.xs)
+
+    def add_set(self, set_id, set_data):
+        """Seti plana ekler (daha önce eklenmediyse) ve aralığını döndürür"""
+        compiled = self.ranges.get(set_id)
+        if compiled is not None:
+            return compiled
+
+        start = len(self)
+        xs, ys = set_data.xs, set_data.ys
+        clicks, delays_ms, texts = set_data.clicks, set_data.delays_ms, set_data.texts
+        step_modes = set_data.text_modes
+        anchors = set_data.anchors
+        step_templates = set_data.templates
+        search_regions = set_data.search_regions
+        step_waits = set_data.waits
+        to_device = self.transform.to_device if self.transform is not None else None
+        text_index = self._text_index
+        template_index = self._template_index
+        wait_index = self._wait_index
+
+        for i in execution_order(set_data.order, len(set_data)):
+            x = xs[i]
+            if x == NO_COORDINATE:
+                continue
+            y = ys[i]
+            anchor = ANCHOR_CODES.get(anchors.get(i), ANCHOR_SCALE)
+            if to_device is not None:
+                x, y = to_device(x, y, anchor)
+            self.xs.append(x)
+            self.ys.append(y)
+            self.clicks.append(clicks[i])
+            self.delays_ns.append(max(MIN_DELAY_NS, delays_ms[i] * 1_000_000))
+            self.coord_ids.append(i)
+
+            text = texts.get(i)
+            if text and text.strip():
+                mode = TEXT_MODE_CODES.get(step_modes.get(i), self.text_mode)
+                key = (text, mode)
+                if key not in text_index:
+                    text_index[key] = len(self.texts)
+                    self.texts.append((text,) if mode == TEXT_PASTE else split_text(text))
+                    self.text_modes.append(mode)
+                self.text_ids.append(text_index[key])
+            else:
+                self.text_ids.append(-1)
+
+            template = step_templates.get(i)
+            if template:
+                search = search_regions.get(i)
+                key = (template, search, anchor if search else None)
+                if key not in template_index:
+                    if search:
+                        search = parse_region(search)
+                        if to_device is not None:
+                            # Arama alanı adımın çapasıyla birlikte taşınır
+                            left, top = to_device(search[0], search[1], anchor)
+                            right, bottom = to_device(search[0] + search[2],
+                                                      search[1] + search[3], anchor)
+                            search = (left, top, max(1, right - left), max(1, bottom - top))
+                    template_index[key] = len(self.templates)
+                    self.templates.append((template, search or None))
+                self.template_ids.append(template_index[key])
+            else:
+                self.template_ids.append(-1)
+
+            wait = step_waits.get(i)
+            if wait:
+                key = (wait, anchor)
+                if key not in wait_index:
+                    condition = ScreenCondition.parse(wait)
+                    if to_device is not None:
+                        # Koşul bölgesi adımın çapasıyla birlikte taşınır
+                        condition = condition.mapped(
+                            lambda cx, cy: to_device(cx, cy, anchor))
+                    wait_index[key] = len(self.waits)
+                    self.waits.append(condition)
+                self.wait_ids.append(wait_index[key])
+            else:
+                self.wait_ids.append(-1)
+
+        compiled = (start, len(self), set_data.loop_count)
+        self.ranges[set_id] = compiled
+        return compiled
+
+
+def compile_plan(sets, execution_queue, text_mode='type', transform=None):
+    """Kuyruğu ve setleri çalıştırılabilir bir ExecutionPlan'e derler
+
+    text_mode, adımda seçilmemişse kullanılacak metin modudur (TEXT_MODES);
+    transform, referans koordinatlarını ekran piksellerine çeviren dönüşümdür.
+    """
+    plan = ExecutionPlan(TEXT_MODE_CODES.get(text_mode, TEXT_TYPE), transform)
+    for set_id in execution_queue:
+        plan.add_set(set_id, sets[set_id])
+        plan.queue.append(set_id)
+    return plan
+
+
+# Kimlikler tüm kuyruklarda tekildir; dosya açılınca eski widget'larla çakışmaz
+_entry_ids = itertools.count(1)
+
+
+class ExecutionQueue:
+    """Sabit kimlikli elemanlardan oluşan, thread güvenli işlem kuyruğu
+
+    Elemanlar çift bağlı liste olarak tutulur: ekleme, silme, taşıma ve
+    sonrakini bulma O(1)'dir. Her elemanın kimliği (entry_id) silinene kadar
+    değişmez, böylece UI ve motor aynı elemana güvenle başvurabilir.
+    """
+
+    def __init__(self, set_ids=()):
+        self._lock = threading.Lock()
+        self._nodes = {}  # entry_id -> [önceki, sonraki, set_id]
+        self._removed = {}  # silinen entry_id -> silindiği andaki önceki eleman
+        self._head = None
+        self._tail = None
+        for set_id in set_ids:
+            self.append(set_id)
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __contains__(self, entry_id):
+        return entry_id in self._nodes
+
+    def __iter__(self):
+        """Set kimliklerini sırayla döndürür (liste gibi kullanılabilsin)"""
+        return iter([set_id for _, set_id in self.entries()])
+
+    def entries(self):
+        """(entry_id, set_id) çiftlerini sırayla döndürür"""
+        with self._lock:
+            result = []
+            entry_id = self._head
+            while entry_id is not None:
+                node = self._nodes[entry_id]
+                result.append((entry_id, node[2]))
+                entry_id = node[1]
+            return result
+
+    def set_ids(self):
+        """Set kimliklerini liste olarak döndürür"""
+        return list(self)
+
+    def set_id(self, entry_id):
+        """Elemanın set kimliğini döndürür, silinmişse None"""
+        node = self._nodes.get(entry_id)
+        return node[2] if node is not None else None
+
+    def append(self, set_id):
+        """Kuyruğun sonuna ekler ve yeni elemanın kimliğini döndürür"""
+        with self._lock:
+            entry_id = next(_entry_ids)
+            self._nodes[entry_id] = [self._tail, None, set_id]
+            if self._tail is None:
+                self._head = entry_id
+            else:
+                self._nodes[self._tail][1] = entry_id
+            self._tail = entry_id
+            return entry_id
+
+    def _unlink(self, entry_id):
+        prev_id, next_id, _ = self._nodes[entry_id]
+        if prev_id is None:
+            self._head = next_id
+        else:
+            self._nodes[prev_id][1] = next_id
+        if next_id is None:
+            self._tail = prev_id
+        else:
+            self._nodes[next_id][0] = prev_id
+        return prev_id
+
+    def remove(self, entry_id):
+        """Elemanı kuyruktan siler; eleman yoksa False döndürür"""
+        with self._lock:
+            if entry_id not in self._nodes:
+                return False
+            self._removed[entry_id] = self._unlink(entry_id)
+            del self._nodes[entry_id]
+            return True
+
+    def popleft(self):
+        """İlk elemanı siler ve (entry_id, set_id) döndürür"""
+        with self._lock:
+            entry_id = self._head
+            if entry_id is None:
+                raise IndexError("Kuyruk boş")
+            set_id = self._nodes[entry_id][2]
+            self._removed[entry_id] = self._unlink(entry_id)
+            del self._nodes[entry_id]
+            return entry_id, set_id
+
+    def move(self, entry_id, before_id=None):
+        """Elemanı before_id'nin önüne (None ise sona) taşır"""
+        with self._lock:
+            if entry_id not in self._nodes or entry_id == before_id:
+                return False
+            if before_id is not None and before_id not in self._nodes:
+                return False
+            self._unlink(entry_id)
+            node = self._nodes[entry_id]
+            if before_id is None:
+                node[0], node[1] = self._tail, None
+                if self._tail is None:
+                    self._head = entry_id
+                else:
+                    self._nodes[self._tail][1] = entry_id
+                self._tail = entry_id
+            else:
+                before = self._nodes[before_id]
+                node[0], node[1] = before[0], before_id
+                if before[0] is None:
+                    self._head = entry_id
+                else:
+                    self._nodes[before[0]][1] = entry_id
+                before[0] = entry_id
+            return True
+
+    def clear(self):
+        with self._lock:
+            self._nodes.clear()
+            self._removed.clear()
+            self._head = None
+            self._tail = None
+
+    def first(self):
+        """İlk elemanın kimliğini döndürür"""
+        return self._head
+
+    def previous_of(self, entry_id):
+        node = self._nodes.get(entry_id)
+        return node[0] if node is not None else None
+
+    def next_of(self, entry_id):
+        """Sonraki elemanın kimliğini döndürür
+
+        Eleman çalışırken silindiyse, silindiği yerden sonra gelen ilk canlı
+        eleman döndürülür; böylece motor kuyruğun kalanıyla devam eder.
+        """
+        with self._lock:
+            node = self._nodes.get(entry_id)
+            if node is not None:
+                return node[1]
+            # Silinmiş elemanın canlı bir öncülünü bul
+            prev_id = self._removed.get(entry_id)
+            while prev_id is not None and prev_id not in self._nodes:
+                prev_id = self._removed.get(prev_id)
+            if prev_id is None:
+                return self._head
+            return self._nodes[prev_id][1]
+
+
+class JitterStats:
+    """Planlanan ve gerçekleşen adım zamanları arasındaki farkı biriktirir"""
+    __slots__ = ('count', 'total_ns', 'total_sq', 'min_ns', 'max_ns', 'resyncs')
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.total_sq = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self.resyncs = 0
+
+    def record(self, lateness_ns):
+        """Bir adımın planlanan zamandan sapmasını kaydeder"""
+        if self.count == 0 or lateness_ns < self.min_ns:
+            self.min_ns = lateness_ns
+        if self.count == 0 or lateness_ns > self.max_ns:
+            self.max_ns = lateness_ns
+        self.count += 1
+        self.total_ns += lateness_ns
+        self.total_sq += lateness_ns * lateness_ns
+
+    def summary(self):
+        """Mikrosaniye cinsinden özet döndürür"""
+        if not self.count:
+            return {'count': 0, 'mean_us': 0.0, 'stddev_us': 0.0,
+                    'min_us': 0.0, 'max_us': 0.0, 'resyncs': self.resyncs}
+        mean = self.total_ns / self.count
+        variance = max(0.0, self.total_sq / self.count - mean * mean)
+        return {
+            'count': self.count,
+            'mean_us': mean / 1000,
+            'stddev_us': variance ** 0.5 / 1000,
+            'min_us': self.min_ns / 1000,
+            'max_us': self.max_ns / 1000,
+            'resyncs': self.resyncs,
+        }
+
+
+class RunControl:
+    """Motorun çalışma/duraklatma/durdurma durumu
+
+    Durum yalnızca kilit altında değişir ve her değişiklikte bekleyen thread
+    Condition ile anında uyandırılır; arka arkaya basılan tuşlar iki kez
+    devam ettiremez.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self.running = True
+        self.paused = False
+
+    def stop(self):
+        with self._cond:
+            self.running = False
+            self._cond.notify_all()
+
+    def set_paused(self, paused, on_change=None):
+        """Duraklatma durumunu ayarlar; durum gerçekten değiştiyse True döndürür
+
+        on_change, durum değişikliğiyle aynı kilit altında çağrılır, böylece
+        bildirimlerin sırası durum değişikliklerinin sırasıyla aynı kalır.
+        """
+        with self._cond:
+            return self._set_paused(paused, on_change)
+
+    def toggle(self, on_change=None):
+        """Duraklatma durumunu değiştirir ve yeni durumu döndürür"""
+        with self._cond:
+            self._set_paused(not self.paused, on_change)
+            return self.paused
+
+    def _set_paused(self, paused, on_change):
+        if not self.running or self.paused == paused:
+            return False
+        self.paused = paused
+        if on_change is not None:
+            on_change(paused)
+        self._cond.notify_all()
+        return True
+
+    def sleep(self, timeout_ns):
+        """timeout_ns kadar bekler; durum değişirse erken döner
+
+        Süre kesintisiz dolduysa True döndürür.
+        """
+        with self._cond:
+            if not self.running or self.paused:
+                return False
+            return not self._cond.wait(timeout_ns / 1e9)
+
+    def wait_while_paused(self):
+        """Devam edilene veya durdurulana kadar bekler; çalışmaya devam ediliyorsa True"""
+        with self._cond:
+            while self.paused and self.running:
+                self._cond.wait()
+            return self.running
+
+
+class StepScheduler:
+    """Adımları mutlak time.monotonic_ns() zaman noktalarına göre planlar
+
+    Her adımın hedef zamanı bir öncekinin hedefine gecikme eklenerek bulunur,
+    böylece tıklama ve yazma süreleri birikip kaymaya yol açmaz. Bekleme,
+    hedefe spin_ns kalana kadar uyku, sonrasında aktif döngüdür. control
+    verilirse bekleme duraklatma ve durdurmayla anında kesilir.
+    """
+
+    def __init__(self, spin_ns=SPIN_THRESHOLD_NS, max_lag_ns=MAX_LAG_NS, control=None):
+        self.spin_ns = spin_ns
+        self.max_lag_ns = max_lag_ns
+        self.control = control
+        self.deadline_ns = 0
+        self.lateness_ns = 0  # Son wait()'in hedef zamandan sapması
+        self.jitter = JitterStats()
+
+    def start(self):
+        """Zaman çizelgesini şu ana hizalar"""
+        self.deadline_ns = time.monotonic_ns()
+
+    def advance(self, delay_ns):
+        """Bir sonraki hedef zamanı ilerletir"""
+        self.deadline_ns += delay_ns
+
+    def wait(self, record=True):
+        """Hedef zamana kadar bekler ve gerçekleşen zamanı döndürür
+
+        Duraklatılınca kalan süre saklanır ve devam edildiği andan itibaren
+        aynı süre beklenir. Durdurulursa None döndürür.
+        """
+        control = self.control
+        while True:
+            now = time.monotonic_ns()
+            if control is not None:
+                if control.paused:
+                    remaining = max(0, self.deadline_ns - now)
+                    if not control.wait_while_paused():
+                        return None
+                    self.deadline_ns = time.monotonic_ns() + remaining
+                    continue
+                if not control.running:
+                    return None
+
+            deadline = self.deadline_ns
+            remaining = deadline - now
+            if remaining > self.spin_ns:
+                if control is None:
+                    time.sleep((remaining - self.spin_ns) / 1e9)
+                elif not control.sleep(remaining - self.spin_ns):
+                    continue  # Durum değişti, yeniden değerlendir
+                now = time.monotonic_ns()
+
+            interrupted = False
+            while now < deadline:
+                if control is not None and (control.paused or not control.running):
+                    interrupted = True
+                    break
+                now = time.monotonic_ns()
+            if not interrupted:
+                break
+
+        lateness = now - deadline
+        self.lateness_ns = lateness
+        if record:
+            self.jitter.record(lateness)
+        if lateness > self.max_lag_ns:
+            # Uzun bir takılmadan sonra kaçırılan adımları art arda yapma
+            self.deadline_ns = now
+            self.jitter.resyncs += 1
+        return now
+
+
+class ExecutionEngine(threading.Thread):
+    """İşlem kuyruğunu arka plan thread'inde çalıştırır
+
+    Motor başlangıçta derlenen ExecutionPlan'i yürütür. Kuyruk canlıdır:
+    çalışma sırasında ExecutionQueue'ya eklenen setler sets üzerinden plana
+    derlenir, silinen eleman o anki adımdan sonra bırakılır. Kuyruk imleci
+    (current_entry, current_loop, current_coord) motorun kendisine aittir.
+    UI'a durum bilgisi yalnızca status_queue üzerinden gönderilir; motor
+    hiçbir Tk widget'ına dokunmaz. text_interval, toplu yazma modunda
+    karakterler arası beklemedir (sn).
+
+    Şablonlu adımlarda şablon önce ekranda aranır (screen.TemplateTarget) ve
+    bulunduğu yere tıklanır; bulunamazsa adımın tıklaması ve metni atlanır.
+    Bekleme koşullu adımlardan sonra sabit gecikme yerine koşulun bölgesi
+    poll_interval (sn) aralıkla yoklanır; gecikme zaman aşımı olur ve koşul
+    sağlanınca sonraki adıma hemen geçilir. capture verilmezse ekran
+    görüntüsü kaynağı ekrana bakan ilk adımda backend.screen_capture() ile
+    motor thread'inde oluşturulur; kaynak yoksa kayıtlı koordinat ve sabit
+    gecikme kullanılır. Tüm ekran okumaları tek bir screen.CaptureCache'ten
+    geçer: görüntü en fazla capture_max_age (sn) kullanılır ve her giriş
+    gönderiminden sonra geçersiz sayılır. Her adımın planlanan/gerçekleşen
+    gecikmesi, giriş süresi ve sapması telemetry'ye (telemetry.StepTelemetry)
+    yazılır ve çalışma bitince ('telemetry', telemetry) olarak gönderilir.
+    """
+
+    def __init__(self, plan, backend, status_queue=None, failsafe=False, queue=None, sets=None,
+                 text_interval=0.0, capture=None, poll_interval=DEFAULT_POLL_MS / 1000,
+                 capture_max_age=DEFAULT_CAPTURE_AGE_MS / 1000, telemetry=None):
+        super().__init__(name="ExecutionEngine", daemon=True)
+        self.plan = plan
+        self.backend = backend
+        self.failsafe = failsafe
+        self.status_queue = status_queue if status_queue is not None else queue_module.Queue()
+        self.queue = queue if queue is not None else ExecutionQueue(plan.queue)
+        self.sets = sets
+        self.text_interval_ns = max(0, int(round(text_interval * 1_000_000_000)))
+        self._capture_source = capture
+        self.capture = None  # CaptureCache; False: ekran görüntüsü alınamıyor
+        self.capture_max_age = capture_max_age
+        self.poll_ns = max(1_000_000, int(round(poll_interval * 1_000_000_000)))
+        self._targets = {}  # şablon kimliği -> screen.TemplateTarget
+        self._conditions = {}  # koşul kimliği -> ekran sınırlarına kırpılmış ScreenCondition
+
+        # Kuyruk imleci
+        self.current_entry = None
+        self.current_loop = 0
+        self.current_coord = 0
+
+        self.control = RunControl()
+        self.scheduler = StepScheduler(control=self.control)
+        self.dispatch_stats = DispatchStats()
+        self.telemetry = telemetry if telemetry is not None else StepTelemetry()
+
+    @property
+    def running(self):
+        return self.control.running
+
+    @property
+    def paused(self):
+        return self.control.paused
+
+    def stop(self):
+        """Motoru durdurur; bekleyen gecikme anında kesilir"""
+        self.control.stop()
+
+    def _post_pause_state(self, paused):
+        self._post('paused' if paused else 'resumed')
+
+    def pause(self):
+        """Motoru bir sonraki bekleme noktasında duraklatır; zaten duraklatılmışsa False"""
+        return self.control.set_paused(True, self._post_pause_state)
+
+    def resume(self):
+        """Kalan gecikmeyle kaldığı adımdan devam ettirir; zaten çalışıyorsa False"""
+        return self.control.set_paused(False, self._post_pause_state)
+
+    def toggle_pause(self):
+        """Duraklatma durumunu değiştirir ve yeni durumu döndürür"""
+        return self.control.toggle(self._post_pause_state)
+
+    def _post(self, kind, *payload):
+        """UI'a durum mesajı gönderir"""
+        self.status_queue.put((kind,) + payload)
+
+    def run(self):
+        """Kuyruğu baştan sona işler"""
+        watchdog = None
+        activate = getattr(self.backend, 'activate', None)
+        if activate is not None:
+            activate()
+        if self.failsafe:
+            watchdog = FailSafeWatchdog(self.backend, self.stop)
+            watchdog.start()
+        try:
+            self._run_queue()
+        except Exception as e:
+            self._post('error', str(e))
+        finally:
+            self.control.stop()
+            if watchdog is not None:
+                watchdog.stop()
+            deactivate = getattr(self.backend, 'deactivate', None)
+            if deactivate is not None:
+                deactivate()
+            self._post('stats', self.scheduler.jitter.summary())
+            self._post('input_stats', self.dispatch_stats.summary())
+            if self.capture:
+                self._post('capture_stats', self.capture.stats())
+            self._post('telemetry', self.telemetry)
+            self._post('finished')
+
+    def _pace(self, delay_ns):
+        """Metin yazarken karakterler arası bekler; duraklatılırsa devamı bekler
+
+        StepScheduler.wait gibi duraklatılınca kalan süre saklanır ve devam
+        edildiği andan itibaren beklenir. Durdurulduysa False döndürür.
+        """
+        control = self.control
+        clock = time.monotonic_ns
+        deadline = clock() + delay_ns
+        while True:
+            remaining = deadline - clock()
+            if remaining <= 0:
+                return control.running
+            if control.sleep(remaining):
+                return True
+            if control.paused:
+                remaining = max(0, deadline - clock())
+                if not control.wait_while_paused():
+                    return False
+                deadline = clock() + remaining
+            elif not control.running:
+                return False
+
+    def _write_text(self, chunks, mode):
+        """Metni moduna göre yazar; yarıda durdurulduysa False döndürür"""
+        backend = self.backend
+        control = self.control
+        if mode == TEXT_PASTE:
+            backend.paste(chunks[0])
+            return True
+        if mode != TEXT_BATCH:
+            return backend.write_chunks(chunks, lambda: control.running)
+
+        interval_ns = self.text_interval_ns
+        if interval_ns and not backend.timed_batch:
+            # Arka uç olay gecikmesi desteklemiyor: karakter karakter gönder
+            for chunk in chunks:
+                for char in chunk:
+                    if not control.running:
+                        return False
+                    backend.write_batch(char)
+                    if not self._pace(interval_ns):
+                        return False
+            return True
+
+        interval_ms = interval_ns // 1_000_000
+        for chunk in chunks:
+            if not control.running:
+                return False
+            backend.write_batch(chunk, interval_ms)
+            # Sunucu parçayı oynatırken bekle; sonraki parça aynı aralıkla başlasın
+            if interval_ns and not self._pace(len(chunk) * interval_ns):
+                return False
+        return True
+
+    def _screen(self):
+        """Ekran görüntüsü kaynağını (ilk kullanımda oluşturarak) döndürür; yoksa None"""
+        if self.capture is None:
+            source = self._capture_source or self.backend.screen_capture()
+            if source is None:
+                self.capture = False  # Tekrar denenmez
+            elif isinstance(source, CaptureCache):
+                self.capture = source
+            else:
+                self.capture = CaptureCache(source, self.capture_max_age)
+        return self.capture or None
+
+    def _wait_for(self, condition, baseline, timeout_ns):
+        """Koşul sağlanana veya timeout_ns dolana kadar bölgeyi yoklar
+
+        (sağlandı mı, geçen süre ns) döndürür; durdurulursa None. Duraklatılan
+        süre zaman aşımına sayılmaz.
+        """
+        control = self.control
+        capture = self.capture
+        record = self.dispatch_stats.record
+        clock = time.monotonic_ns
+        started = clock()
+        deadline = started + timeout_ns
+        while True:
+            check_started = time.perf_counter_ns()
+            satisfied = condition.check(capture, baseline)
+            record('condition', time.perf_counter_ns() - check_started)
+            now = clock()
+            if satisfied or now >= deadline:
+                return satisfied, now - started
+            if not control.sleep(min(self.poll_ns, deadline - now)):
+                paused_at = clock()
+                if not control.wait_while_paused():
+                    return None
+                paused = clock() - paused_at
+                started += paused
+                deadline += paused
+
+    def _condition(self, wait_id):
+        """Koşulun ekran sınırlarına kırpılmış hali; bölge tamamen dışındaysa RuntimeError"""
+        condition = self._conditions.get(wait_id)
+        if condition is None:
+            original = self.plan.waits[wait_id]
+            condition = original.clipped(self.capture.bounds())
+            if condition is None:
+                raise RuntimeError(f"Bekleme koşulunun bölgesi ekranın dışında: {original}")
+            self._conditions[wait_id] = condition
+        return condition
+
+    def _locate(self, template_id, x, y):
+        """Şablonu (x, y) çevresinden başlayarak ekranda arar
+
+        (x, y, bulundu mu, arama süresi ns) döndürür; arka uç ekran görüntüsü
+        sağlamıyorsa None döner ve kayıtlı koordinat kullanılır.
+        """
+        capture = self._screen()
+        if capture is None:
+            return None
+        target = self._targets.get(template_id)
+        if target is None:
+            from screen import TemplateTarget, load_image
+            path, search = self.plan.templates[template_id]
+            try:
+                template = load_image(path)
+            except OSError as e:
+                raise RuntimeError(f"Şablon görüntüsü açılamadı ({path}): {e}") from e
+            # İlk arama adımın kayıtlı koordinatının çevresinde başlar
+            target = self._targets[template_id] = TemplateTarget(template, hint=(x, y),
+                                                                 search=search)
+        started = time.perf_counter_ns()
+        match = target.locate(capture)
+        elapsed = time.perf_counter_ns() - started
+        if match is None:
+            return x, y, False, elapsed
+        return match.x, match.y, True, elapsed
+
+    def _run_queue(self):
+        plan = self.plan
+        xs, ys, clicks = plan.xs, plan.ys, plan.clicks
+        delays_ns, text_ids, coord_ids = plan.delays_ns, plan.text_ids, plan.coord_ids
+        texts, text_modes = plan.texts, plan.text_modes
+        template_ids = plan.template_ids
+        wait_ids = plan.wait_ids
+        locate = self._locate
+        wait_for = self._wait_for
+        backend = self.backend
+        click = backend.click
+        double_click = backend.double_click
+        write_text = self._write_text
+        record_dispatch = self.dispatch_stats.record
+        record_text = self.dispatch_stats.record_text
+        clock = time.perf_counter_ns
+        control = self.control
+        record_step = self.telemetry.record
+        # Önceki adımın planlanan ve gerçekleşen başlangıcı (telemetri için)
+        previous_deadline = previous_start = None
+        # Giriş işlemlerinden sonraki bekleme motor tarafından, kesilebilir şekilde yapılır
+        action_pause_ns = int((getattr(backend, 'pause', 0.0) or 0.0) * 1_000_000_000)
+
+        scheduler = self.scheduler
+        scheduler.start()
+
+        execution_queue = self.queue
+        entry = execution_queue.first()
+
+        while self.running and entry is not None:
+            self.current_entry = entry
+            set_id = execution_queue.set_id(entry)
+            compiled = plan.ranges.get(set_id)
+            if compiled is None and set_id is not None and self.sets is not None:
+                # Çalışma sırasında kuyruğa eklenen set
+                # (diziler aynı nesnelere eklenir, yerel referanslar geçerli kalır)
+                compiled = plan.add_set(set_id, self.sets[set_id])
+            if compiled is None:
+                entry = execution_queue.next_of(entry)
+                continue
+            start, stop, loop_count = compiled
+            step = start
+
+            while self.running and self.current_loop < loop_count:
+                while self.running and step < stop:
+                    # Duraklatma bekleme içinde ele alınır; None ise durduruldu
+                    step_start = scheduler.wait()
+                    if step_start is None:
+                        break
+                    overrun = scheduler.lateness_ns
+                    deadline = step_start - overrun
+                    planned = deadline - previous_deadline if previous_deadline is not None else 0
+                    actual = step_start - previous_start if previous_start is not None else 0
+                    previous_deadline, previous_start = deadline, step_start
+
+                    # Eleman çalışırken kuyruktan silindiyse bırak
+                    if entry not in execution_queue:
+                        break
+                    self.current_coord = coord_ids[step]
+                    self._post('step', entry, self.current_loop, self.current_coord)
+
+                    # Bekleme koşulu: değişim, adımdan önceki hale göre aranır
+                    wait_id = wait_ids[step]
+                    condition = self._condition(wait_id) if wait_id >= 0 and self._screen() else None
+                    baseline = None
+                    if condition is not None and condition.kind == CONDITION_CHANGE:
+                        baseline = condition.sample(self.capture)
+
+                    x, y = xs[step], ys[step]
+                    template_id = template_ids[step]
+                    located = locate(template_id, x, y) if template_id >= 0 else None
+                    if located is not None:
+                        x, y, found, elapsed = located
+                        record_dispatch('match', elapsed)
+                        self._post('match', entry, self.current_coord, found, x, y, elapsed)
+                        if not found:
+                            # Hedef ekranda yok: tıklama ve metin atlanır, zamanlama sürer
+                            record_step(step_start, set_id, self.current_coord, planned, actual, 0,
+                                        overrun)
+                            scheduler.advance(delays_ns[step])
+                            step += 1
+                            continue
+
+                    # Tıklama tipine göre işlem yap
+                    click_type = clicks[step]
+                    started = clock()
+                    if click_type == CLICK_LEFT:
+                        click(x, y, 'left')
+                        record_dispatch('click', clock() - started)
+                    elif click_type == CLICK_RIGHT:
+                        click(x, y, 'right')
+                        record_dispatch('click', clock() - started)
+                    elif click_type == CLICK_DOUBLE:
+                        double_click(x, y)
+                        record_dispatch('double', clock() - started)
+                    dispatch = clock() - started
+                    if self.capture:
+                        # Giriş ekranı değiştirmiş olabilir
+                        self.capture.invalidate()
+                    if action_pause_ns and click_type >= 0:
+                        control.sleep(action_pause_ns)
+
+                    # Metin varsa yaz
+                    text_id = text_ids[step]
+                    if text_id >= 0:
+                        scheduler.advance(TEXT_PAUSE_NS)
+                        if scheduler.wait(record=False) is None:
+                            break
+                        chunks = texts[text_id]
+                        mode = text_modes[text_id]
+                        started = clock()
+                        completed = write_text(chunks, mode)
+                        elapsed = clock() - started
+                        dispatch += elapsed
+                        if completed:
+                            record_text(TEXT_ACTIONS[mode], sum(map(len, chunks)), elapsed)
+                        if self.capture:
+                            self.capture.invalidate()
+                        if not completed:
+                            break
+                        if action_pause_ns:
+                            control.sleep(action_pause_ns)
+
+                    record_step(step_start, set_id, self.current_coord, planned, actual, dispatch,
+                                overrun)
+                    if condition is not None:
+                        waited = wait_for(condition, baseline, delays_ns[step])
+                        if waited is None:
+                            break
+                        self._post('wait', entry, self.current_coord, *waited)
+                        # Sonraki adım sabit gecikmeyi değil koşulun sağlandığı anı izler
+                        scheduler.start()
+                    else:
+                        scheduler.advance(delays_ns[step])
+                    step += 1
+
+                if entry not in execution_queue:
+                    break
+                self.current_loop += 1
+                step = start
+
+            entry = execution_queue.next_of(entry)
+            self.current_loop = 0
+            self.current_coord = 0
@@ -0,0 +1,71 @@
+"""Global kısayol tuşlarının tek noktadan yönetimi"""
+import time
+
+from input_backends import DispatchStats
+
+
+class HotkeyRegistry:
+    """Gruplanmış global kısayol bağlantıları
+
+    Her bağlantı keyboard.on_press_key ile yalnızca kendi tuşu için kurulur.
+    keyboard'un dinleyici thread'i yine her olayı Python'da çözer; kaldırılan,
+    her olayda çağrılan genel geri çağrı ve onun tuş adı karşılaştırmalarıdır:
+    diğer tuşlar bizim kodumuza ulaşmadan filtrelenir. Bağlantılar
+    gruplar halinde (ör. 'coordinate', 'run') eklenip kaldırılır; bir grubu
+    kaldırmak diğerlerine dokunmaz (keyboard.unhook_all yerine handle
+    başına keyboard.unhook). Her geri çağrının süresi callback_stats'ta
+    biriktirilir.
+    """
+
+    def __init__(self, keyboard=None):
+        self._keyboard = keyboard
+        self._groups = {}  # grup -> [(tuş, handle)]
+        self.callback_stats = DispatchStats()
+
+    @property
+    def keyboard(self):
+        if self._keyboard is None:
+            import keyboard
+            self._keyboard = keyboard
+        return self._keyboard
+
+    def bind(self, group, key, callback, suppress=False):
+        """key tuşuna basılınca callback'i çağıran bağlantıyı gruba ekler"""
+        name = f"{group}:{key}"
+        record = self.callback_stats.record
+
+        def timed_callback(event):
+            # keyboard thread'inde çalışır; hata olursa hook thread'i düşmesin
+            started = time.perf_counter_ns()
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"Kısayol hatası ({name}): {e}")
+            finally:
+                record(name, time.perf_counter_ns() - started)
+
+        handle = self.keyboard.on_press_key(key, timed_callback, suppress=suppress)
+        self._groups.setdefault(group, []).append((key, handle))
+        return handle
+
+    def unbind_group(self, group):
+        """Gruptaki tüm bağlantıları kaldırır"""
+        for _, handle in self._groups.pop(group, []):
+            try:
+                self.keyboard.unhook(handle)
+            except (KeyError, ValueError):
+                pass  # Zaten kaldırılmış
+
+    def rebind_group(self, group, bindings):
+        """Grubu verilen (tuş, geri çağrı) bağlantılarıyla yeniden kurar"""
+        self.unbind_group(group)
+        for key, callback in bindings:
+            self.bind(group, key, callback)
+
+    def is_bound(self, group):
+        return bool(self._groups.get(group))
+
+    def clear(self):
+        """Tüm grupları kaldırır"""
+        for group in list(self._groups):
+            self.unbind_group(group)
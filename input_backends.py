@@ -0,0 +1,563 @@
+"""Çalıştırma motorunun kullandığı fare/klavye giriş katmanı"""
+import sys
+import threading
+import time
+from array import array
+
+
+class DispatchStats:
+    """Her giriş işleminin gerçekte ne kadar sürdüğünü biriktirir"""
+
+    def __init__(self):
+        # işlem tipi -> [adet, toplam ns, maks ns]
+        self.actions = {}
+        # işlem tipi -> yazılan toplam karakter (yalnızca metin işlemleri)
+        self.chars = {}
+
+    def record(self, action, elapsed_ns):
+        """Bir giriş işleminin süresini kaydeder"""
+        entry = self.actions.get(action)
+        if entry is None:
+            self.actions[action] = [1, elapsed_ns, elapsed_ns]
+            return
+        entry[0] += 1
+        entry[1] += elapsed_ns
+        if elapsed_ns > entry[2]:
+            entry[2] = elapsed_ns
+
+    def record_text(self, action, chars, elapsed_ns):
+        """Bir metin yazma işleminin süresini ve karakter sayısını kaydeder"""
+        self.record(action, elapsed_ns)
+        self.chars[action] = self.chars.get(action, 0) + chars
+
+    def summary(self):
+        """İşlem tipi başına milisaniye cinsinden özet döndürür
+
+        Metin işlemlerinde saniyedeki karakter sayısı (chars_per_sec) da verilir.
+        """
+        result = {}
+        for action, (count, total, peak) in self.actions.items():
+            result[action] = {
+                'count': count,
+                'mean_ms': total / count / 1e6,
+                'max_ms': peak / 1e6,
+            }
+            chars = self.chars.get(action)
+            if chars is not None:
+                result[action]['chars'] = chars
+                result[action]['chars_per_sec'] = chars / (total / 1e9) if total else 0.0
+        return result
+
+
+def format_input_stats(action, stats):
+    """Giriş süresi özetinin bir satırını okunabilir metne çevirir"""
+    text = (f"Giriş süresi ({action}): ort {stats['mean_ms']:.2f} ms, "
+            f"maks {stats['max_ms']:.2f} ms ({stats['count']} işlem)")
+    if 'chars_per_sec' in stats:
+        text += f", {stats['chars_per_sec']:.0f} karakter/sn"
+    return text
+
+
+class InputBackend:
+    """Giriş arka uçlarının ortak arayüzü
+
+    Motor yalnızca bu metotları çağırır. Bir tıklama (taşıma + bas + bırak)
+    tek çağrıdır, böylece arka uç olayları tek seferde gönderebilir. Arka
+    uçlar kendileri beklemez; her işlemden sonraki pause (sn) beklemesini
+    motor, durdurmayla kesilebilecek şekilde yapar. builtin_failsafe False
+    ise motor güvenlik köşesini FailSafeWatchdog ile kendisi izler.
+
+    Metinler üç modda yazılabilir: write_chunks (tuş tuş), paste (panoya
+    kopyalayıp yapıştırma kısayolu) ve write_batch (parçanın tüm tuş
+    olaylarını tek seferde gönderme). timed_batch True olan arka uçlar
+    karakter arası beklemeyi olaylarla birlikte sunucuya bırakır; diğerlerinde
+    motor karakter karakter gönderip arada bekler.
+    """
+    builtin_failsafe = False
+    timed_batch = False
+
+    def __init__(self, pause=0.0):
+        self.pause = pause
+
+    def activate(self):
+        """Çalışma başlarken çağrılır"""
+
+    def deactivate(self):
+        """Çalışma bittiğinde çağrılır"""
+
+    def click(self, x, y, button):
+        raise NotImplementedError
+
+    def double_click(self, x, y):
+        raise NotImplementedError
+
+    def write(self, text):
+        raise NotImplementedError
+
+    def write_chunks(self, chunks, is_running):
+        """Metni parça parça yazar; is_running() False olunca keser
+
+        Metin sonuna kadar yazıldıysa True döndürür.
+        """
+        for chunk in chunks:
+            if not is_running():
+                return False
+            self.write(chunk)
+        return True
+
+    def write_batch(self, text, interval_ms=0):
+        """text'in tuş olaylarını tek seferde gönderir
+
+        timed_batch False ise interval_ms yok sayılır; bekleme motordadır.
+        """
+        self.write(text)
+
+    def paste(self, text):
+        """Metni panoya kopyalayıp yapıştırma kısayoluna basar"""
+        import pyperclip  # Yalnızca yapıştırma modu kullanılınca yüklenir
+        pyperclip.copy(text)
+        self.paste_shortcut()
+
+    def paste_shortcut(self):
+        raise NotImplementedError
+
+    # Makro oynatma için tek tek olaylar (recorder.replay)
+
+    def move(self, x, y):
+        raise NotImplementedError
+
+    def button(self, x, y, button, pressed):
+        """(x, y) konumunda fare tuşuna basar veya bırakır"""
+        raise NotImplementedError
+
+    def key(self, name, pressed):
+        """Tuşa basar veya bırakır; name tek karakter veya recorder.SPECIAL_KEYS adıdır"""
+        raise NotImplementedError
+
+    def position(self):
+        raise NotImplementedError
+
+    def display_config(self):
+        """Olayların gönderildiği ekranın yapılandırması (display.DisplayConfig); bilinmiyorsa None"""
+        return None
+
+    def screen_capture(self):
+        """Şablon hedefleri için ekran görüntüsü kaynağı; None ise şablonlar aranmaz"""
+        from screen import ScreenCapture
+        return ScreenCapture()
+
+    def failsafe_points(self):
+        return []
+
+
+class PyAutoGuiBackend(InputBackend):
+    """pyautogui üzerinden giriş gönderir
+
+    pyautogui'nin her çağrıdan sonra eklediği PAUSE beklemesi çağrılarda
+    kapatılır (_pause=False) ve aynı süre motorun kesilebilir beklemesine
+    devredilir. Hızlı modda bu süre projedeki input_pause değeridir ve köşe
+    kontrolü (FAILSAFE) kapatılır; güvenlik durdurması FailSafeWatchdog'a
+    geçer.
+    """
+
+    # FAILSAFE modül genelinde bir ayardır: onu kapatan etkin hızlı arka uçlar
+    # sayılır, ilk etkinleşen eski değeri saklar, son kapanan geri yükler
+    _failsafe_lock = threading.Lock()
+    _failsafe_users = 0
+    _failsafe_saved = None
+
+    def __init__(self, fast=False, pause=0.0):
+        super().__init__(pause)
+        import pyautogui
+        self.pyautogui = pyautogui
+        self.fast = fast
+        self.builtin_failsafe = not fast
+        if not fast:
+            self.pause = pyautogui.PAUSE
+        self._active = False
+
+    def activate(self):
+        """Çalışma boyunca geçerli pyautogui ayarlarını uygular"""
+        if not self.fast or self._active:
+            return
+        cls = PyAutoGuiBackend
+        with cls._failsafe_lock:
+            if cls._failsafe_users == 0:
+                cls._failsafe_saved = self.pyautogui.FAILSAFE
+                self.pyautogui.FAILSAFE = False
+            cls._failsafe_users += 1
+        self._active = True
+
+    def deactivate(self):
+        """pyautogui ayarlarını, başka etkin hızlı arka uç kalmadıysa eski haline getirir"""
+        if not self._active:
+            return
+        cls = PyAutoGuiBackend
+        with cls._failsafe_lock:
+            cls._failsafe_users -= 1
+            if cls._failsafe_users == 0:
+                self.pyautogui.FAILSAFE = cls._failsafe_saved
+                cls._failsafe_saved = None
+        self._active = False
+
+    def click(self, x, y, button):
+        self.pyautogui.click(x, y, button=button, _pause=False)
+
+    def double_click(self, x, y):
+        self.pyautogui.doubleClick(x, y, _pause=False)
+
+    def write(self, text):
+        self.pyautogui.write(text, _pause=False)
+
+    def paste_shortcut(self):
+        modifier = 'command' if sys.platform == 'darwin' else 'ctrl'
+        self.pyautogui.hotkey(modifier, 'v', _pause=False)
+
+    # pyautogui'de adı farklı olan tuşlar
+    KEY_NAMES = {
+        'shift_r': 'shiftright', 'ctrl_l': 'ctrlleft', 'ctrl_r': 'ctrlright',
+        'alt_l': 'altleft', 'alt_r': 'altright', 'alt_gr': 'altright',
+        'cmd': 'command' if sys.platform == 'darwin' else 'win',
+        'cmd_r': 'command' if sys.platform == 'darwin' else 'winright',
+        'caps_lock': 'capslock', 'page_up': 'pageup', 'page_down': 'pagedown',
+    }
+
+    def move(self, x, y):
+        self.pyautogui.moveTo(x, y, _pause=False)
+
+    def button(self, x, y, button, pressed):
+        if pressed:
+            self.pyautogui.mouseDown(x, y, button=button, _pause=False)
+        else:
+            self.pyautogui.mouseUp(x, y, button=button, _pause=False)
+
+    def key(self, name, pressed):
+        name = self.KEY_NAMES.get(name, name)
+        if pressed:
+            self.pyautogui.keyDown(name, _pause=False)
+        else:
+            self.pyautogui.keyUp(name, _pause=False)
+
+    def position(self):
+        point = self.pyautogui.position()
+        return point[0], point[1]
+
+    def display_config(self):
+        from display import DisplayConfig
+        width, height = self.pyautogui.size()
+        return DisplayConfig(int(width), int(height))  # DPI bilinmiyor
+
+    def failsafe_points(self):
+        return [tuple(point) for point in self.pyautogui.FAILSAFE_POINTS]
+
+
+class XTestBackend(InputBackend):
+    """X11 XTEST eklentisi ile doğrudan olay gönderir (Linux)
+
+    Bir tıklamanın taşıma, basma ve bırakma olayları (çift tıklamada iki
+    çift) istemci tamponunda biriktirilir ve tek flush ile sunucuya gider.
+    Toplu yazmada karakter arası bekleme XTEST'in olay gecikmesiyle
+    sunucuya bırakılır.
+    """
+    BUTTONS = {'left': 1, 'middle': 2, 'right': 3}
+    # Özel karakterlerin keysym karşılıkları
+    SPECIAL_KEYSYMS = {'\n': 0xff0d, '\r': 0xff0d, '\t': 0xff09, '\b': 0xff08}
+    SHIFT_KEYSYM = 0xffe1
+    CONTROL_KEYSYM = 0xffe3
+    # Makro oynatmadaki özel tuş adlarının X keysym adları
+    KEY_KEYSYMS = {
+        'enter': 'Return', 'tab': 'Tab', 'backspace': 'BackSpace', 'space': 'space',
+        'esc': 'Escape', 'delete': 'Delete', 'insert': 'Insert',
+        'shift': 'Shift_L', 'shift_r': 'Shift_R', 'ctrl': 'Control_L', 'ctrl_l': 'Control_L',
+        'ctrl_r': 'Control_R', 'alt': 'Alt_L', 'alt_l': 'Alt_L', 'alt_r': 'Alt_R',
+        'alt_gr': 'ISO_Level3_Shift', 'cmd': 'Super_L', 'cmd_r': 'Super_R',
+        'caps_lock': 'Caps_Lock', 'home': 'Home', 'end': 'End', 'page_up': 'Prior',
+        'page_down': 'Next', 'up': 'Up', 'down': 'Down', 'left': 'Left', 'right': 'Right',
+    }
+    timed_batch = True
+
+    def __init__(self, pause=0.0, display_name=None):
+        super().__init__(pause)
+        from Xlib import X, display
+        from Xlib.ext import xtest
+        self.X = X
+        self.display_name = display_name
+        self.display = display.Display(display_name)
+        if not self.display.has_extension('XTEST'):
+            raise RuntimeError("X sunucusunda XTEST eklentisi yok")
+        self.fake_input = xtest.fake_input
+        self.root = self.display.screen().root
+        self.shift_keycode = self.display.keysym_to_keycode(self.SHIFT_KEYSYM)
+        self._keycodes = {}  # karakter -> (keycode, shift gerekli mi)
+
+    def click(self, x, y, button):
+        X, fake, d = self.X, self.fake_input, self.display
+        code = self.BUTTONS[button]
+        fake(d, X.MotionNotify, x=x, y=y)
+        fake(d, X.ButtonPress, code)
+        fake(d, X.ButtonRelease, code)
+        d.flush()
+
+    def double_click(self, x, y):
+        X, fake, d = self.X, self.fake_input, self.display
+        fake(d, X.MotionNotify, x=x, y=y)
+        for _ in range(2):
+            fake(d, X.ButtonPress, 1)
+            fake(d, X.ButtonRelease, 1)
+        d.flush()
+
+    def _keycode_for(self, char):
+        """Karakterin keycode'unu ve shift gerekip gerekmediğini bulur"""
+        cached = self._keycodes.get(char)
+        if cached is not None:
+            return cached
+        keysym = self.SPECIAL_KEYSYMS.get(char)
+        if keysym is None:
+            code = ord(char)
+            # Latin-1 keysym'leri kod noktasıyla aynıdır, diğerleri Unicode keysym
+            keysym = code if code < 0x100 else 0x01000000 | code
+        keycode = self.display.keysym_to_keycode(keysym)
+        if keycode:
+            shift = self.display.keycode_to_keysym(keycode, 0) != keysym
+            cached = (keycode, shift)
+        else:
+            print(f"Klavye düzeninde karşılığı olmayan karakter atlandı: {char!r}")
+            cached = (0, False)
+        self._keycodes[char] = cached
+        return cached
+
+    def write(self, text):
+        self.write_batch(text)
+
+    def write_batch(self, text, interval_ms=0):
+        X, fake, d = self.X, self.fake_input, self.display
+        # İlk karakter hemen, sonrakiler sunucuda interval_ms gecikmeyle işlenir
+        delay = X.CurrentTime
+        for char in text:
+            keycode, shift = self._keycode_for(char)
+            if not keycode:
+                continue
+            if shift:
+                fake(d, X.KeyPress, self.shift_keycode, time=delay)
+                delay = X.CurrentTime
+            fake(d, X.KeyPress, keycode, time=delay)
+            fake(d, X.KeyRelease, keycode)
+            if shift:
+                fake(d, X.KeyRelease, self.shift_keycode)
+            delay = interval_ms
+        d.flush()
+
+    def paste_shortcut(self):
+        X, fake, d = self.X, self.fake_input, self.display
+        control = self.display.keysym_to_keycode(self.CONTROL_KEYSYM)
+        v = self._keycode_for('v')[0]
+        fake(d, X.KeyPress, control)
+        fake(d, X.KeyPress, v)
+        fake(d, X.KeyRelease, v)
+        fake(d, X.KeyRelease, control)
+        d.flush()
+
+    def move(self, x, y):
+        self.fake_input(self.display, self.X.MotionNotify, x=x, y=y)
+        self.display.flush()
+
+    def button(self, x, y, button, pressed):
+        X, fake, d = self.X, self.fake_input, self.display
+        fake(d, X.MotionNotify, x=x, y=y)
+        fake(d, X.ButtonPress if pressed else X.ButtonRelease, self.BUTTONS[button])
+        d.flush()
+
+    def key(self, name, pressed):
+        if len(name) == 1:
+            # Shift olayları da kayıtta olduğundan yalnızca tuşun kendisi gönderilir
+            keycode = self._keycode_for(name)[0]
+        else:
+            from Xlib import XK
+            keysym_name = self.KEY_KEYSYMS.get(name) or name.upper()
+            keycode = self.display.keysym_to_keycode(XK.string_to_keysym(keysym_name))
+        if keycode:
+            self.fake_input(self.display, self.X.KeyPress if pressed else self.X.KeyRelease, keycode)
+            self.display.flush()
+
+    def position(self):
+        pointer = self.root.query_pointer()
+        return pointer.root_x, pointer.root_y
+
+    def display_config(self):
+        from display import DisplayConfig
+        screen = self.display.screen()
+        # Fiziksel genişlikten DPI; 96 DPI = 1.0
+        dpi = screen.width_in_pixels * 25.4 / screen.width_in_mms if screen.width_in_mms else 96
+        return DisplayConfig(screen.width_in_pixels, screen.height_in_pixels, round(dpi / 96, 3))
+
+    def screen_capture(self):
+        from screen import ScreenCapture
+        return ScreenCapture(self.display_name)
+
+    def failsafe_points(self):
+        screen = self.display.screen()
+        right, bottom = screen.width_in_pixels - 1, screen.height_in_pixels - 1
+        return [(0, 0), (right, 0), (0, bottom), (right, bottom)]
+
+
+# RecordingBackend olay tipleri
+EVENT_CLICK_LEFT = 0
+EVENT_CLICK_RIGHT = 1
+EVENT_DOUBLE = 2
+EVENT_WRITE = 3
+EVENT_PASTE = 4
+EVENT_MOVE = 5
+EVENT_BUTTON_DOWN = 6
+EVENT_BUTTON_UP = 7
+EVENT_KEY_DOWN = 8
+EVENT_KEY_UP = 9
+
+
+class RecordingBackend(InputBackend):
+    """Olayları göndermek yerine zaman damgasıyla kaydeder
+
+    Gerçek ekran gerektirmez; motoru Xvfb altında veya tamamen başsız
+    ölçmek ve denemek için kullanılır.
+    """
+    EVENT_CODES = {'left': EVENT_CLICK_LEFT, 'right': EVENT_CLICK_RIGHT}
+
+    def __init__(self, pause=0.0, capacity=1024):
+        super().__init__(pause)
+        # Önceden ayrılmış diziler, kayıt sırasında bellek ayırmayı azaltır
+        self.times = array('q', bytes(8 * capacity))
+        self.kinds = bytearray(capacity)
+        self.xs = array('i', bytes(4 * capacity))
+        self.ys = array('i', bytes(4 * capacity))
+        self.texts = []
+        self.count = 0
+
+    def _record(self, kind, x, y):
+        index = self.count
+        if index == len(self.kinds):
+            # Kapasite dolunca iki katına çıkar
+            self.times.extend(self.times)
+            self.kinds.extend(self.kinds)
+            self.xs.extend(self.xs)
+            self.ys.extend(self.ys)
+        self.times[index] = time.monotonic_ns()
+        self.kinds[index] = kind
+        self.xs[index] = x
+        self.ys[index] = y
+        self.count = index + 1
+
+    def click(self, x, y, button):
+        self._record(self.EVENT_CODES[button], x, y)
+
+    def double_click(self, x, y):
+        self._record(EVENT_DOUBLE, x, y)
+
+    def write(self, text):
+        self.texts.append(text)
+        self._record(EVENT_WRITE, len(self.texts) - 1, 0)
+
+    def paste(self, text):
+        # Pano kullanılmaz; başsız ortamda da çalışır
+        self.texts.append(text)
+        self._record(EVENT_PASTE, len(self.texts) - 1, 0)
+
+    def move(self, x, y):
+        self._record(EVENT_MOVE, x, y)
+
+    def button(self, x, y, button, pressed):
+        self._record(EVENT_BUTTON_DOWN if pressed else EVENT_BUTTON_UP, x, y)
+
+    def key(self, name, pressed):
+        self.texts.append(name)
+        self._record(EVENT_KEY_DOWN if pressed else EVENT_KEY_UP, len(self.texts) - 1, 0)
+
+    def position(self):
+        return -1, -1
+
+    def screen_capture(self):
+        return None
+
+    def events(self):
+        """Kaydedilen olayları (zaman ns, tip, x, y) olarak döndürür"""
+        return [(self.times[i], self.kinds[i], self.xs[i], self.ys[i]) for i in range(self.count)]
+
+
+class NullBackend(InputBackend):
+    """Hiçbir şey yapmayan arka uç; yalnızca motorun kendi yükünü ölçmek için"""
+
+    def click(self, x, y, button):
+        pass
+
+    def double_click(self, x, y):
+        pass
+
+    def write(self, text):
+        pass
+
+    def paste(self, text):
+        pass
+
+    def move(self, x, y):
+        pass
+
+    def button(self, x, y, button, pressed):
+        pass
+
+    def key(self, name, pressed):
+        pass
+
+    def position(self):
+        return -1, -1
+
+    def screen_capture(self):
+        return None
+
+
+def create_backend(settings):
+    """Proje ayarlarındaki input_backend değerine göre arka ucu oluşturur"""
+    name = settings.get('input_backend', 'pyautogui')
+    pause = settings.get('input_pause', 0.0)
+    if name == 'pyautogui':
+        return PyAutoGuiBackend(fast=settings.get('fast_input', False), pause=pause)
+    if name == 'xtest':
+        return XTestBackend(pause=pause)
+    if name == 'recording':
+        return RecordingBackend(pause=pause)
+    if name == 'null':
+        return NullBackend(pause=pause)
+    raise ValueError(f"Bilinmeyen giriş arka ucu: {name}")
+
+
+BACKEND_NAMES = ('pyautogui', 'xtest', 'recording', 'null')
+
+
+class FailSafeWatchdog(threading.Thread):
+    """Fare güvenlik köşesine götürüldüğünde çalışmayı durdurur
+
+    pyautogui'nin her çağrıda yaptığı konum kontrolünün yerine geçer; kontrol
+    tıklama yolunun dışında, ayrı bir thread'de yapılır.
+    """
+
+    def __init__(self, backend, on_trigger, interval=0.05):
+        super().__init__(name="FailSafeWatchdog", daemon=True)
+        self.backend = backend
+        self.on_trigger = on_trigger
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def stop(self):
+        self._stopped.set()
+
+    def run(self):
+        points = set(self.backend.failsafe_points())
+        if not points:
+            return
+        while not self._stopped.wait(self.interval):
+            try:
+                position = self.backend.position()
+            except Exception:
+                continue
+            if position in points:
+                print("Güvenlik köşesi algılandı, otomasyon durduruluyor.")
+                self.on_trigger()
+                return
+
@@ -0,0 +1,339 @@
+"""Set ve koordinat veri modeli"""
+import math
+from array import array
+from dataclasses import dataclass
+
+# Yeni bir setin başlangıçtaki koordinat sayısı; setler daha sonra büyüyebilir
+DEFAULT_SET_SIZE = 20
+
+# Tıklama tipi kodları (CLICK_TYPES sırasıyla)
+CLICK_LEFT = 0
+CLICK_RIGHT = 1
+CLICK_DOUBLE = 2
+CLICK_TYPES = ('left', 'right', 'double')
+CLICK_CODES = {name: code for code, name in enumerate(CLICK_TYPES)}
+
+# Metin yazma modları: tuş tuş yazma, panodan yapıştırma, toplu tuş olayı gönderme.
+# Adımdaki boş mod ('') projenin varsayılan modunu kullanır.
+TEXT_TYPE = 0
+TEXT_PASTE = 1
+TEXT_BATCH = 2
+TEXT_MODES = ('type', 'paste', 'batch')
+TEXT_MODE_CODES = {name: code for code, name in enumerate(TEXT_MODES)}
+
+# Koordinat çapaları (display.py): ekran değişince noktanın neye göre korunacağı.
+# Adımdaki boş çapa ('') 'scale' demektir.
+ANCHOR_SCALE = 0
+ANCHORS = ('scale', 'top_left', 'top_right', 'bottom_left', 'bottom_right', 'center')
+ANCHOR_CODES = {name: code for code, name in enumerate(ANCHORS)}
+
+DEFAULT_DELAY_MS = 500
+# Kayıtsız koordinat için xs/ys dizilerindeki işaret değeri
+NO_COORDINATE = -2 ** 31
+
+
+def format_delay(delay_ms):
+    """Milisaniye gecikmeyi UI'da gösterilen saniye metnine çevirir ("0.5", "1.25")"""
+    text = f"{delay_ms / 1000:.3f}".rstrip('0')
+    return text + '0' if text.endswith('.') else text
+
+
+def parse_delay_ms(value):
+    """Saniye cinsinden gecikme değerini milisaniyeye çevirir
+
+    Geçersiz veya sonlu olmayan değerlerde ValueError fırlatır.
+    """
+    delay = float(value)
+    if not math.isfinite(delay):
+        raise ValueError(f"Geçersiz gecikme: {value}")
+    return int(round(delay * 1000))
+
+
+def parse_region(value):
+    """"x,y,gen,yük" metnini (sol, üst, genişlik, yükseklik) olarak okur; geçersizse ValueError"""
+    parts = [int(part) for part in str(value).split(',')]
+    if len(parts) != 4 or parts[2] <= 0 or parts[3] <= 0:
+        raise ValueError(f"Geçersiz bölge: {value!r}")
+    return tuple(parts)
+
+
+# Slot alanlarının varsayılan değerleri (indekse göre)
+SLOT_DEFAULTS = {
+    'coordinates': lambda i: None,
+    'names': lambda i: f"K {i+1}",
+    'clicks': lambda i: 'left',
+    'delays': lambda i: format_delay(DEFAULT_DELAY_MS),
+    'order': lambda i: i,
+    'texts': lambda i: '',
+    'text_modes': lambda i: '',
+    'anchors': lambda i: '',
+    'templates': lambda i: '',
+    'search_regions': lambda i: '',
+    'waits': lambda i: '',
+}
+
+
+@dataclass
+class Point:
+    __slots__ = ('x', 'y')
+    x: int
+    y: int
+
+
+class SlotColumn:
+    """Setin bir alanını liste gibi gösteren ince erişim katmanı
+
+    set_data['delays'][i] gibi eski kullanımlar bu görünüm üzerinden
+    doğrudan setin dizilerini okur ve yazar.
+    """
+    __slots__ = ('_set', '_get', '_put')
+
+    def __init__(self, set_data, get, put):
+        self._set = set_data
+        self._get = get
+        self._put = put
+
+    def __len__(self):
+        return len(self._set)
+
+    def _index(self, index):
+        size = len(self._set)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("slot indeksi aralık dışında")
+        return index
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self._set)))]
+        return self._get(self._index(index))
+
+    def __setitem__(self, index, value):
+        self._put(self._index(index), value)
+
+    def __iter__(self):
+        get = self._get
+        return (get(i) for i in range(len(self._set)))
+
+    def index(self, value):
+        for i, item in enumerate(self):
+            if item == value:
+                return i
+        raise ValueError(f"{value!r} sütunda yok")
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+
+class SetData:
+    """Bir setin koordinatları, dizi tabanlı (struct-of-arrays) biçimde
+
+    x/y, tıklama kodu, gecikme (ms) ve sıra değerleri array'lerde tutulur;
+    çoğu slotta varsayılan olan isim ve metinler yalnızca farklı olanlar
+    için sözlükte saklanır; adıma özel metin modları, çapalar, şablon
+    görüntüler, şablon arama alanları ve bekleme koşulları da öyle. Eski sözlük erişimi (set_data['clicks'][i])
+    SlotColumn üzerinden çalışmaya devam eder.
+    """
+    __slots__ = ('name', 'loop_count', 'xs', 'ys', 'clicks', 'delays_ms', 'order',
+                 'names', 'texts', 'text_modes', 'anchors', 'templates', 'search_regions',
+                 'waits')
+
+    def __init__(self, name, size=DEFAULT_SET_SIZE, loop_count=1):
+        self.name = name
+        self.loop_count = loop_count
+        self.xs = array('i', [NO_COORDINATE]) * size
+        self.ys = array('i', [NO_COORDINATE]) * size
+        self.clicks = array('b', [CLICK_LEFT]) * size
+        self.delays_ms = array('i', [DEFAULT_DELAY_MS]) * size
+        self.order = array('i', range(size))
+        self.names = {}  # indeks -> varsayılandan farklı isim
+        self.texts = {}  # indeks -> boş olmayan metin
+        self.text_modes = {}  # indeks -> projeden farklı metin modu
+        self.anchors = {}  # indeks -> 'scale' dışındaki koordinat çapası
+        self.templates = {}  # indeks -> şablon görüntü dosyası (screen.py)
+        self.search_regions = {}  # indeks -> şablonun geniş arama alanı ("x,y,gen,yük")
+        self.waits = {}  # indeks -> bekleme koşulu metni (screen.ScreenCondition)
+
+    def __len__(self):
+        return len(self.xs)
+
+    def append_slots(self, count):
+        """Setin sonuna count adet boş slot ekler"""
+        start = len(self)
+        self.xs.extend(array('i', [NO_COORDINATE]) * count)
+        self.ys.extend(array('i', [NO_COORDINATE]) * count)
+        self.clicks.extend(array('b', [CLICK_LEFT]) * count)
+        self.delays_ms.extend(array('i', [DEFAULT_DELAY_MS]) * count)
+        self.order.extend(range(start, start + count))
+
+    def copy(self):
+        copied = SetData(self.name, 0, self.loop_count)
+        for field in ('xs', 'ys', 'clicks', 'delays_ms', 'order'):
+            setattr(copied, field, array(getattr(self, field).typecode, getattr(self, field)))
+        copied.names = dict(self.names)
+        copied.texts = dict(self.texts)
+        copied.text_modes = dict(self.text_modes)
+        copied.anchors = dict(self.anchors)
+        copied.templates = dict(self.templates)
+        copied.search_regions = dict(self.search_regions)
+        copied.waits = dict(self.waits)
+        return copied
+
+    # Slot erişimi
+
+    def coordinate(self, index):
+        x = self.xs[index]
+        return None if x == NO_COORDINATE else Point(x, self.ys[index])
+
+    def set_coordinate(self, index, point):
+        if point:
+            x, y = (point.x, point.y) if isinstance(point, Point) else point
+            self.xs[index] = int(x)
+            self.ys[index] = int(y)
+        else:
+            self.xs[index] = self.ys[index] = NO_COORDINATE
+
+    def has_coordinate(self, index):
+        return self.xs[index] != NO_COORDINATE
+
+    def click(self, index):
+        return CLICK_TYPES[self.clicks[index]]
+
+    def set_click(self, index, click_type):
+        self.clicks[index] = CLICK_CODES[click_type]
+
+    def delay(self, index):
+        return format_delay(self.delays_ms[index])
+
+    def set_delay(self, index, value):
+        self.delays_ms[index] = parse_delay_ms(value)
+
+    def set_order(self, index, value):
+        self.order[index] = int(value)
+
+    def coordinate_name(self, index):
+        return self.names.get(index) or f"K {index+1}"
+
+    def set_coordinate_name(self, index, name):
+        if name and name != f"K {index+1}":
+            self.names[index] = name
+        else:
+            self.names.pop(index, None)
+
+    def text(self, index):
+        return self.texts.get(index, '')
+
+    def set_text(self, index, text):
+        if text:
+            self.texts[index] = text
+        else:
+            self.texts.pop(index, None)
+
+    def text_mode(self, index):
+        """Adımın metin modunu döndürür; '' projenin varsayılanı demektir"""
+        return self.text_modes.get(index, '')
+
+    def set_text_mode(self, index, mode):
+        if not mode:
+            self.text_modes.pop(index, None)
+        elif mode in TEXT_MODE_CODES:
+            self.text_modes[index] = mode
+        else:
+            raise ValueError(f"Bilinmeyen metin modu: {mode}")
+
+    def anchor(self, index):
+        """Koordinatın çapasını döndürür; '' orantılı ölçekleme demektir"""
+        return self.anchors.get(index, '')
+
+    def set_anchor(self, index, anchor):
+        if not anchor or anchor == ANCHORS[ANCHOR_SCALE]:
+            self.anchors.pop(index, None)
+        elif anchor in ANCHOR_CODES:
+            self.anchors[index] = anchor
+        else:
+            raise ValueError(f"Bilinmeyen çapa: {anchor}")
+
+    def template(self, index):
+        """Adımın şablon görüntü dosyasını döndürür; '' şablonsuz demektir"""
+        return self.templates.get(index, '')
+
+    def set_template(self, index, path):
+        if path:
+            self.templates[index] = str(path)
+        else:
+            self.templates.pop(index, None)
+
+    def search_region(self, index):
+        """Şablonun geniş arama alanını "x,y,gen,yük" olarak döndürür; '' tüm ekran demektir"""
+        return self.search_regions.get(index, '')
+
+    def set_search_region(self, index, region):
+        """Arama alanını ayarlar; geçersiz alanda ValueError fırlatır"""
+        if not region:
+            self.search_regions.pop(index, None)
+            return
+        left, top, width, height = parse_region(region)
+        self.search_regions[index] = f"{left},{top},{width},{height}"
+
+    def wait(self, index):
+        """Adımdan sonraki bekleme koşulunu döndürür; '' sabit gecikme demektir"""
+        return self.waits.get(index, '')
+
+    def set_wait(self, index, condition):
+        """Bekleme koşulunu ayarlar; geçersiz koşulda ValueError fırlatır"""
+        if not condition:
+            self.waits.pop(index, None)
+            return
+        from screen import ScreenCondition
+        self.waits[index] = str(ScreenCondition.parse(str(condition)))
+
+    # Eski sözlük arayüzü
+
+    _COLUMNS = {
+        'coordinates': ('coordinate', 'set_coordinate'),
+        'names': ('coordinate_name', 'set_coordinate_name'),
+        'clicks': ('click', 'set_click'),
+        'delays': ('delay', 'set_delay'),
+        'order': (None, 'set_order'),
+        'texts': ('text', 'set_text'),
+        'text_modes': ('text_mode', 'set_text_mode'),
+        'anchors': ('anchor', 'set_anchor'),
+        'templates': ('template', 'set_template'),
+        'search_regions': ('search_region', 'set_search_region'),
+        'waits': ('wait', 'set_wait'),
+    }
+
+    def __getitem__(self, key):
+        if key in ('name', 'loop_count'):
+            return getattr(self, key)
+        if key == 'order':
+            return SlotColumn(self, self.order.__getitem__, self.set_order)
+        get, put = self._COLUMNS[key]
+        return SlotColumn(self, getattr(self, get), getattr(self, put))
+
+    def __setitem__(self, key, value):
+        if key in ('name', 'loop_count'):
+            setattr(self, key, value)
+            return
+        column = self[key]
+        if len(value) != len(self):
+            raise ValueError(f"{key} uzunluğu setin boyutuyla aynı olmalı")
+        for i, item in enumerate(value):
+            column[i] = item
+
+    def __contains__(self, key):
+        return key in ('name', 'loop_count') or key in self._COLUMNS
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+
+def new_set_data(name, size=DEFAULT_SET_SIZE):
+    """Boş bir set için veri yapısı oluşturur"""
+    return SetData(name, size)
+
+
+def append_slots(set_data, count):
+    """Setin sonuna count adet boş slot ekler"""
+    set_data.append_slots(count)
@@ -0,0 +1,340 @@
+"""Proje dosyalarını okur ve yazar; tkinter'a bağımlı değildir
+
+İki biçim desteklenir: okunabilir JSON ve .acp uzantılı ikili biçim. İkili
+dosyada her setin kendi bölümü ve bir set dizini vardır; açılışta yalnızca
+aktif set ve kuyruktaki setler çözülür, diğerleri ilk erişimde çözülür.
+"""
+import json
+import struct
+import sys
+from array import array
+from collections.abc import MutableMapping
+
+from models import (CLICK_LEFT, CLICK_TYPES, DEFAULT_DELAY_MS, NO_COORDINATE, SLOT_DEFAULTS,
+                    SetData, format_delay)
+
+
+def encode_set(set_data):
+    """Setin varsayılandan farklı slotlarını {indeks: değer} biçiminde döndürür
+
+    Boş ve varsayılan slotlar dosyaya yazılmaz; değerler doğrudan setin
+    dizilerinden okunur.
+    """
+    xs, ys = set_data.xs, set_data.ys
+    clicks, delays_ms, order = set_data.clicks, set_data.delays_ms, set_data.order
+    size = len(set_data)
+    return {
+        'coordinates': {str(i): (xs[i], ys[i]) for i in range(size) if xs[i] != NO_COORDINATE},
+        'names': {str(i): name for i, name in sorted(set_data.names.items())},
+        'clicks': {str(i): CLICK_TYPES[clicks[i]] for i in range(size) if clicks[i] != CLICK_LEFT},
+        'delays': {str(i): format_delay(delays_ms[i]) for i in range(size)
+                   if delays_ms[i] != DEFAULT_DELAY_MS},
+        'order': {str(i): order[i] for i in range(size) if order[i] != i},
+        'texts': {str(i): text for i, text in sorted(set_data.texts.items())},
+        'text_modes': {str(i): mode for i, mode in sorted(set_data.text_modes.items())},
+        'anchors': {str(i): anchor for i, anchor in sorted(set_data.anchors.items())},
+        'templates': {str(i): path for i, path in sorted(set_data.templates.items())},
+        'search_regions': {str(i): region for i, region in sorted(set_data.search_regions.items())},
+        'waits': {str(i): condition for i, condition in sorted(set_data.waits.items())},
+    }
+
+
+def iter_slots(values, size):
+    """Seyrek ({indeks: değer}) veya eski tam liste biçimindeki dolu slotları (indeks, değer) olarak döndürür"""
+    if isinstance(values, dict):
+        for index, value in values.items():
+            index = int(index)
+            if 0 <= index < size:
+                yield index, value
+    elif values:
+        yield from enumerate(values[:size])
+
+
+def project_to_dict(project):
+    """Proje verisini JSON'a yazılabilir sözlüğe çevirir"""
+    data = {
+        'sets': {},
+        'active_set': project['active_set'],
+        'current_set_id': project['current_set_id'],
+        'execution_queue': list(project['execution_queue']),
+        'settings': project.get('settings', {})
+    }
+    
+    # Her seti seyrek biçimde kaydet: yalnızca dolu/değiştirilmiş slotlar yazılır
+    for set_id, set_data in project['sets'].items():
+        entry = {
+            'name': set_data.name,
+            'size': len(set_data),
+            'loop_count': set_data.loop_count
+        }
+        entry.update(encode_set(set_data))
+        data['sets'][str(set_id)] = entry
+    return data
+
+
+def project_from_dict(data):
+    """JSON'dan okunan sözlüğü proje verisine çevirir"""
+    sets = {}
+    for set_id, set_data in data['sets'].items():
+        # Eski dosyalarda size yoktur, uzunluk listelerden bulunur
+        size = set_data.get('size')
+        if size is None:
+            size = max(len(set_data.get(field) or []) for field in SLOT_DEFAULTS)
+        
+        loaded = SetData(set_data['name'], size, set_data.get('loop_count', 1))
+        for field in SLOT_DEFAULTS:
+            column = loaded[field]
+            for index, value in iter_slots(set_data.get(field), size):
+                try:
+                    column[index] = value
+                except (KeyError, TypeError, ValueError):
+                    # Geçersiz değer varsayılanda kalır
+                    pass
+        sets[int(set_id)] = loaded
+    
+    return {
+        'sets': sets,
+        'active_set': data.get('active_set', min(sets, default=1)),
+        'current_set_id': data.get('current_set_id', max(sets, default=1)),
+        'execution_queue': data.get('execution_queue', []),
+        'settings': data.get('settings', {})
+    }
+
+
+# İkili biçim:
+#   MAGIC | meta uzunluğu (u32) | meta JSON | set sayısı (u32)
+#   | dizin: set sayısı x (set_id i32, offset u64, uzunluk u32) | set bölümleri
+# Set bölümü:
+#   boyut (u32), döngü sayısı (i32), isim uzunluğu (u16), isim
+#   | xs, ys (i32), clicks (i8), delays_ms (i32), order (i32) dizileri
+#   | isim tablosu | metin tablosu | metin modu tablosu | çapa tablosu
+#   | şablon tablosu | bekleme koşulu tablosu | şablon arama alanı tablosu
+# Metin tablosundan sonraki tablolar sonradan eklendi; eski dosyalarda bölüm
+# daha önce biter ve eksik tablolar boş kabul edilir.
+# Tablo: kayıt sayısı (u32), kayıt başına (indeks u32, uzunluk u32, UTF-8)
+BINARY_MAGIC = b'ACP1'
+BINARY_EXTENSION = '.acp'
+_U32 = struct.Struct('<I')
+_INDEX_ENTRY = struct.Struct('<iQI')
+_SET_HEADER = struct.Struct('<IiH')
+_TABLE_ENTRY = struct.Struct('<II')
+_ARRAY_FIELDS = ('xs', 'ys', 'clicks', 'delays_ms', 'order')
+_TABLE_FIELDS = ('names', 'texts', 'text_modes', 'anchors', 'templates', 'waits',
+                 'search_regions')
+# Okurken değeri doğrulanan tablolar ve SetData'daki ayarlayıcıları
+_CHECKED_TABLES = {'text_modes': 'set_text_mode', 'anchors': 'set_anchor', 'waits': 'set_wait',
+                   'search_regions': 'set_search_region'}
+# Bu sayıdan sonraki tablolar eski dosyalarda bulunmayabilir
+_REQUIRED_TABLES = 2
+
+
+def _array_bytes(values):
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _read_array(typecode, data, offset, count):
+    values = array(typecode)
+    end = offset + count * values.itemsize
+    values.frombytes(data[offset:end])
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values, end
+
+
+def encode_set_binary(set_data):
+    """Seti ikili set bölümüne çevirir"""
+    name = set_data.name.encode('utf-8')
+    parts = [_SET_HEADER.pack(len(set_data), set_data.loop_count, len(name)), name]
+    parts.extend(_array_bytes(getattr(set_data, field)) for field in _ARRAY_FIELDS)
+    for field in _TABLE_FIELDS:
+        table = getattr(set_data, field)
+        parts.append(_U32.pack(len(table)))
+        for index, text in sorted(table.items()):
+            encoded = text.encode('utf-8')
+            parts.append(_TABLE_ENTRY.pack(index, len(encoded)))
+            parts.append(encoded)
+    return b''.join(parts)
+
+
+def decode_set_binary(data, offset=0, end=None):
+    """İkili set bölümünü SetData'ya çevirir
+
+    end bölümün bittiği konumdur; verilmezse bölüm verinin sonuna kadar sürer.
+    """
+    if end is None:
+        end = len(data)
+    size, loop_count, name_length = _SET_HEADER.unpack_from(data, offset)
+    offset += _SET_HEADER.size
+    set_data = SetData(bytes(data[offset:offset + name_length]).decode('utf-8'), 0, loop_count)
+    offset += name_length
+    for field in _ARRAY_FIELDS:
+        values, offset = _read_array(getattr(set_data, field).typecode, data, offset, size)
+        setattr(set_data, field, values)
+    for number, field in enumerate(_TABLE_FIELDS):
+        if number >= _REQUIRED_TABLES and offset >= end:
+            break  # Eski biçim: sonraki tablolar yok
+        table = getattr(set_data, field)
+        (count,) = _U32.unpack_from(data, offset)
+        offset += _U32.size
+        for _ in range(count):
+            index, length = _TABLE_ENTRY.unpack_from(data, offset)
+            offset += _TABLE_ENTRY.size
+            value = bytes(data[offset:offset + length]).decode('utf-8')
+            offset += length
+            setter = _CHECKED_TABLES.get(field)
+            if setter is None:
+                table[index] = value
+                continue
+            try:
+                getattr(set_data, setter)(index, value)
+            except ValueError:
+                # Geçersiz kayıt varsayılanda kalır (JSON'daki gibi)
+                pass
+    return set_data
+
+
+class LazySets(MutableMapping):
+    """İkili dosyadaki setleri ilk erişimde çözen set sözlüğü
+
+    Çözülmemiş setlerin ham bölümleri tekrar kaydederken olduğu gibi
+    kopyalanır.
+    """
+
+    def __init__(self, data, index):
+        self._data = data
+        self._index = index  # set_id -> (offset, uzunluk)
+        self._loaded = {}
+        self._keys = dict.fromkeys(index)  # Sırayı korumak için
+
+    def __getitem__(self, set_id):
+        set_data = self._loaded.get(set_id)
+        if set_data is None:
+            offset, length = self._index[set_id]
+            set_data = decode_set_binary(self._data, offset, offset + length)
+            self._loaded[set_id] = set_data
+        return set_data
+
+    def __setitem__(self, set_id, set_data):
+        self._loaded[set_id] = set_data
+        self._index.pop(set_id, None)
+        self._keys[set_id] = None
+
+    def __delitem__(self, set_id):
+        del self._keys[set_id]
+        self._loaded.pop(set_id, None)
+        self._index.pop(set_id, None)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, set_id):
+        return set_id in self._keys
+
+    def clear(self):
+        self._keys.clear()
+        self._loaded.clear()
+        self._index.clear()
+
+    def preload(self, set_ids):
+        """Verilen setleri (varsa) hemen çözer"""
+        for set_id in set_ids:
+            if set_id in self._keys:
+                self[set_id]
+
+    def is_loaded(self, set_id):
+        return set_id in self._loaded
+
+    def raw_section(self, set_id):
+        """Çözülmemiş setin ham bölümünü döndürür, çözüldüyse None"""
+        if set_id in self._loaded or set_id not in self._index:
+            return None
+        offset, length = self._index[set_id]
+        return self._data[offset:offset + length]
+
+
+def save_project_binary(path, project):
+    """Projeyi ikili biçimde yazar"""
+    sets = project['sets']
+    meta = json.dumps({
+        'active_set': project['active_set'],
+        'current_set_id': project['current_set_id'],
+        'execution_queue': list(project['execution_queue']),
+        'settings': project.get('settings', {})
+    }, ensure_ascii=False).encode('utf-8')
+
+    sections = []
+    for set_id in sets:
+        section = sets.raw_section(set_id) if isinstance(sets, LazySets) else None
+        if section is None:
+            section = encode_set_binary(sets[set_id])
+        sections.append((set_id, section))
+
+    offset = (len(BINARY_MAGIC) + _U32.size + len(meta) + _U32.size
+              + _INDEX_ENTRY.size * len(sections))
+    header = [BINARY_MAGIC, _U32.pack(len(meta)), meta, _U32.pack(len(sections))]
+    for set_id, section in sections:
+        header.append(_INDEX_ENTRY.pack(set_id, offset, len(section)))
+        offset += len(section)
+
+    with open(path, 'wb') as f:
+        f.writelines(header)
+        f.writelines(section for _, section in sections)
+
+
+def load_project_binary(data):
+    """İkili proje verisini okur; yalnızca aktif set ve kuyruktaki setler çözülür"""
+    data = memoryview(data)
+    offset = len(BINARY_MAGIC)
+    (meta_length,) = _U32.unpack_from(data, offset)
+    offset += _U32.size
+    meta = json.loads(bytes(data[offset:offset + meta_length]).decode('utf-8'))
+    offset += meta_length
+    (count,) = _U32.unpack_from(data, offset)
+    offset += _U32.size
+
+    index = {}
+    for _ in range(count):
+        set_id, set_offset, length = _INDEX_ENTRY.unpack_from(data, offset)
+        offset += _INDEX_ENTRY.size
+        index[set_id] = (set_offset, length)
+
+    sets = LazySets(data, index)
+    active_set = meta.get('active_set', min(sets, default=1))
+    execution_queue = meta.get('execution_queue', [])
+    sets.preload([active_set, *execution_queue])
+
+    return {
+        'sets': sets,
+        'active_set': active_set,
+        'current_set_id': meta.get('current_set_id', max(sets, default=1)),
+        'execution_queue': execution_queue,
+        'settings': meta.get('settings', {})
+    }
+
+
+def is_binary_path(path):
+    return str(path).lower().endswith(BINARY_EXTENSION)
+
+
+def save_project(path, project):
+    """Projeyi dosyaya yazar; .acp uzantısında ikili, diğerlerinde JSON biçimi kullanılır"""
+    if is_binary_path(path):
+        save_project_binary(path, project)
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(project_to_dict(project), f, ensure_ascii=False, indent=2)
+
+
+def load_project(path):
+    """Proje dosyasını okur; biçim dosyanın başındaki imzadan anlaşılır"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data.startswith(BINARY_MAGIC):
+        return load_project_binary(data)
+    return project_from_dict(json.loads(data.decode('utf-8')))
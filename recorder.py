@@ -0,0 +1,416 @@
+"""Fare ve klavye olaylarını yüksek hızda kaydeden makro kaydedici
+
+Olaylar pynput dinleyicilerinin thread'lerinde monotonik zaman damgasıyla
+önceden ayrılmış bir halka tampona yazılır; ayrı bir thread tamponu kısa
+aralıklarla Recording'e boşaltır, böylece geri çağrılarda bellek ayırma
+veya dosya işlemi yapılmaz. Kayıt, zaman ve konum farklarının zigzag
+varint olarak yazıldığı sıkıştırılmış bir akışa (.acm) kaydedilir; motorun
+zamanlayıcısıyla orijinal veya ölçeklenmiş hızda oynatılabilir ya da
+tıklama/metin adımlarından oluşan bir sete çevrilebilir.
+"""
+import threading
+import time
+from array import array
+
+from engine import MIN_DELAY_NS, TEXT_PAUSE_NS, StepScheduler
+from models import CLICK_DOUBLE, CLICK_LEFT, CLICK_RIGHT, DEFAULT_DELAY_MS, SetData
+
+# Olay tipleri
+EVENT_MOVE = 0
+EVENT_BUTTON_DOWN = 1
+EVENT_BUTTON_UP = 2
+EVENT_KEY_DOWN = 3
+EVENT_KEY_UP = 4
+EVENT_SCROLL = 5
+
+# Fare tuşları: detay = indeks
+BUTTON_NAMES = ('left', 'middle', 'right')
+# Karakter üretmeyen tuşlar (pynput Key adları): detay = -(indeks + 1).
+# Karakter tuşlarında detay karakterin kod noktasıdır.
+SPECIAL_KEYS = (
+    'enter', 'tab', 'backspace', 'space', 'esc', 'delete', 'insert',
+    'shift', 'shift_r', 'ctrl', 'ctrl_l', 'ctrl_r', 'alt', 'alt_l', 'alt_r', 'alt_gr',
+    'cmd', 'cmd_r', 'caps_lock', 'home', 'end', 'page_up', 'page_down',
+    'up', 'down', 'left', 'right',
+    'f1', 'f2', 'f3', 'f4', 'f5', 'f6', 'f7', 'f8', 'f9', 'f10', 'f11', 'f12',
+)
+_SPECIAL_CODES = {name: -(index + 1) for index, name in enumerate(SPECIAL_KEYS)}
+# Sete çevirirken metne karşılık gelen özel tuşlar
+_KEY_TEXT = {'enter': '\n', 'tab': '\t', 'space': ' '}
+
+# Halka tamponun kapasitesi (2'nin kuvveti); 1 kHz'de ~65 sn'lik pay bırakır
+RING_CAPACITY = 1 << 16
+# Halka tamponun boşaltılma aralığı (sn)
+DRAIN_INTERVAL = 0.05
+# Bu süre içinde aynı yere yapılan iki sol tıklama çift tıklama sayılır
+DOUBLE_CLICK_MS = 400
+DOUBLE_CLICK_DISTANCE = 4
+
+MACRO_MAGIC = b'ACM1'
+MACRO_EXTENSION = '.acm'
+
+
+def key_name(detail):
+    """Olay detayını tuş adına (tek karakter veya SPECIAL_KEYS adı) çevirir"""
+    return chr(detail) if detail >= 0 else SPECIAL_KEYS[-detail - 1]
+
+
+class EventRing:
+    """Sabit kapasiteli, önceden ayrılmış olay halkası
+
+    Birden fazla dinleyici thread'i push ile yazar, tek bir thread drain ile
+    okur. Halka doluysa olay atılır ve dropped artırılır.
+    """
+
+    def __init__(self, capacity=RING_CAPACITY):
+        if capacity & (capacity - 1):
+            raise ValueError("Halka kapasitesi 2'nin kuvveti olmalı")
+        self.capacity = capacity
+        self.mask = capacity - 1
+        self.times = array('q', bytes(8 * capacity))
+        self.kinds = bytearray(capacity)
+        self.xs = array('i', bytes(4 * capacity))
+        self.ys = array('i', bytes(4 * capacity))
+        self.details = array('i', bytes(4 * capacity))
+        self.head = 0  # Yazılan toplam olay
+        self.tail = 0  # Okunan toplam olay
+        self.dropped = 0
+        self.high_water = 0  # Görülen en yüksek doluluk
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self.head - self.tail
+
+    def push(self, timestamp, kind, x, y, detail):
+        with self._lock:
+            head = self.head
+            used = head - self.tail
+            if used >= self.capacity:
+                self.dropped += 1
+                return False
+            i = head & self.mask
+            self.times[i] = timestamp
+            self.kinds[i] = kind
+            self.xs[i] = x
+            self.ys[i] = y
+            self.details[i] = detail
+            self.head = head + 1
+            if used >= self.high_water:
+                self.high_water = used + 1
+        return True
+
+    def drain(self, recording):
+        """Okunmamış olayları recording'e aktarır ve sayısını döndürür"""
+        head = self.head
+        tail = self.tail
+        mask = self.mask
+        append = recording.append
+        for n in range(tail, head):
+            i = n & mask
+            append(self.times[i], self.kinds[i], self.xs[i], self.ys[i], self.details[i])
+        self.tail = head
+        return head - tail
+
+
+class Recording:
+    """Kaydedilmiş olaylar; zamanlar kaydın başından itibaren nanosaniye"""
+    __slots__ = ('times', 'kinds', 'xs', 'ys', 'details')
+
+    def __init__(self):
+        self.times = array('q')
+        self.kinds = bytearray()
+        self.xs = array('i')
+        self.ys = array('i')
+        self.details = array('i')
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def append(self, timestamp, kind, x, y, detail=0):
+        self.times.append(timestamp)
+        self.kinds.append(kind)
+        self.xs.append(x)
+        self.ys.append(y)
+        self.details.append(detail)
+
+    def duration_ns(self):
+        return self.times[-1] - self.times[0] if self.times else 0
+
+    def events(self):
+        """Olayları (zaman ns, tip, x, y, detay) olarak döndürür"""
+        return zip(self.times, self.kinds, self.xs, self.ys, self.details)
+
+
+class MacroRecorder:
+    """pynput dinleyicileriyle fare ve klavye olaylarını kaydeder
+
+    pynput yalnızca start çağrılınca içe aktarılır. stop, dinleyicileri
+    durdurur, tamponu son kez boşaltır ve Recording'i döndürür.
+    """
+
+    def __init__(self, capacity=RING_CAPACITY, record_moves=True, drain_interval=DRAIN_INTERVAL):
+        self.ring = EventRing(capacity)
+        self.record_moves = record_moves
+        self.drain_interval = drain_interval
+        self.recording = Recording()
+        self.started_ns = 0
+        self._listeners = []
+        self._drainer = None
+        self._stopped = threading.Event()
+        self._x = self._y = 0  # Klavye olaylarına yazılan son fare konumu
+
+    @property
+    def running(self):
+        return self._drainer is not None
+
+    def start(self):
+        from pynput import keyboard, mouse  # Yalnızca kayıt başlatılınca yüklenir
+        self.recording = Recording()
+        self.ring.dropped = self.ring.high_water = 0
+        self._stopped.clear()
+        self.started_ns = time.monotonic_ns()
+        self._listeners = [
+            mouse.Listener(on_move=self._on_move if self.record_moves else None,
+                           on_click=self._on_click, on_scroll=self._on_scroll),
+            keyboard.Listener(on_press=self._on_press, on_release=self._on_release),
+        ]
+        for listener in self._listeners:
+            listener.start()
+        self._drainer = threading.Thread(target=self._drain_loop, name="MacroDrain", daemon=True)
+        self._drainer.start()
+
+    def stop(self):
+        """Kaydı bitirir ve Recording'i döndürür"""
+        for listener in self._listeners:
+            listener.stop()
+        self._listeners = []
+        if self._drainer is not None:
+            self._stopped.set()
+            self._drainer.join()
+            self._drainer = None
+        self.ring.drain(self.recording)
+        return self.recording
+
+    def stats(self):
+        """Kayıt hızı ve tampon kullanımı özeti"""
+        recording = self.recording
+        duration = recording.duration_ns() / 1e9
+        return {
+            'events': len(recording),
+            'duration_s': duration,
+            'events_per_sec': len(recording) / duration if duration else 0.0,
+            'dropped': self.ring.dropped,
+            'ring_high_water': self.ring.high_water,
+        }
+
+    def _drain_loop(self):
+        while not self._stopped.wait(self.drain_interval):
+            self.ring.drain(self.recording)
+
+    def _push(self, kind, x, y, detail=0):
+        self.ring.push(time.monotonic_ns() - self.started_ns, kind, x, y, detail)
+
+    # pynput geri çağrıları (dinleyici thread'lerinde çalışır)
+
+    def _on_move(self, x, y):
+        self._x, self._y = int(x), int(y)
+        self._push(EVENT_MOVE, self._x, self._y)
+
+    def _on_click(self, x, y, button, pressed):
+        name = getattr(button, 'name', '')
+        if name not in BUTTON_NAMES:
+            return
+        self._x, self._y = int(x), int(y)
+        self._push(EVENT_BUTTON_DOWN if pressed else EVENT_BUTTON_UP,
+                   self._x, self._y, BUTTON_NAMES.index(name))
+
+    def _on_scroll(self, x, y, dx, dy):
+        self._push(EVENT_SCROLL, int(dx), int(dy))
+
+    def _key_detail(self, key):
+        char = getattr(key, 'char', None)
+        if char:
+            return ord(char[0])
+        return _SPECIAL_CODES.get(getattr(key, 'name', None))
+
+    def _on_press(self, key):
+        detail = self._key_detail(key)
+        if detail is not None:
+            self._push(EVENT_KEY_DOWN, self._x, self._y, detail)
+
+    def _on_release(self, key):
+        detail = self._key_detail(key)
+        if detail is not None:
+            self._push(EVENT_KEY_UP, self._x, self._y, detail)
+
+
+# Akış biçimi:
+#   MACRO_MAGIC | olay sayısı (varint)
+#   | olay başına: tip (u8), zaman farkı µs (varint), dx, dy, detay farkı (zigzag varint)
+# Farklar bir önceki olaya göredir; fare hareketleri çoğunlukla 4-5 bayta sığar.
+
+def _zigzag(value):
+    return value << 1 if value >= 0 else ((-value) << 1) - 1
+
+
+def _unzigzag(value):
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+def _put_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _get_varint(data, offset):
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def encode_recording(recording):
+    """Kaydı fark kodlanmış bayt akışına çevirir"""
+    out = bytearray(MACRO_MAGIC)
+    _put_varint(out, len(recording))
+    previous_us = x0 = y0 = d0 = 0
+    for timestamp, kind, x, y, detail in recording.events():
+        now_us = timestamp // 1000
+        out.append(kind)
+        _put_varint(out, max(0, now_us - previous_us))
+        _put_varint(out, _zigzag(x - x0))
+        _put_varint(out, _zigzag(y - y0))
+        _put_varint(out, _zigzag(detail - d0))
+        previous_us = max(previous_us, now_us)
+        x0, y0, d0 = x, y, detail
+    return bytes(out)
+
+
+def decode_recording(data):
+    """encode_recording ile yazılmış akışı Recording'e çevirir"""
+    if bytes(data[:len(MACRO_MAGIC)]) != MACRO_MAGIC:
+        raise ValueError("Makro kaydı değil")
+    count, offset = _get_varint(data, len(MACRO_MAGIC))
+    recording = Recording()
+    append = recording.append
+    now_us = x = y = detail = 0
+    for _ in range(count):
+        kind = data[offset]
+        delta, offset = _get_varint(data, offset + 1)
+        dx, offset = _get_varint(data, offset)
+        dy, offset = _get_varint(data, offset)
+        dd, offset = _get_varint(data, offset)
+        now_us += delta
+        x += _unzigzag(dx)
+        y += _unzigzag(dy)
+        detail += _unzigzag(dd)
+        append(now_us * 1000, kind, x, y, detail)
+    return recording
+
+
+def save_recording(path, recording):
+    with open(path, 'wb') as f:
+        f.write(encode_recording(recording))
+
+
+def load_recording(path):
+    with open(path, 'rb') as f:
+        return decode_recording(f.read())
+
+
+def is_macro_path(path):
+    return str(path).lower().endswith(MACRO_EXTENSION)
+
+
+def replay(recording, backend, speed=1.0, control=None, moves=True):
+    """Kaydı arka uç üzerinden orijinal zamanlamayla oynatır
+
+    speed 2.0 iki kat hızlı, 0.5 yarı hızda oynatır. Zamanlama motorun
+    StepScheduler'ı ile mutlak zaman noktalarına göre yapılır; control
+    verilirse duraklatma ve durdurma anında etkili olur. Zamanlama
+    sapmasının özetini döndürür.
+    """
+    if speed <= 0:
+        raise ValueError("Oynatma hızı pozitif olmalı")
+    scheduler = StepScheduler(control=control)
+    move, button, key = backend.move, backend.button, backend.key
+    activate = getattr(backend, 'activate', None)
+    if activate is not None:
+        activate()
+    try:
+        scheduler.start()
+        previous = recording.times[0] if len(recording) else 0
+        for timestamp, kind, x, y, detail in recording.events():
+            if kind == EVENT_MOVE and not moves:
+                continue
+            scheduler.advance(int((timestamp - previous) / speed))
+            previous = timestamp
+            if scheduler.wait() is None:
+                break
+            if kind == EVENT_MOVE:
+                move(x, y)
+            elif kind == EVENT_BUTTON_DOWN or kind == EVENT_BUTTON_UP:
+                button(x, y, BUTTON_NAMES[detail], kind == EVENT_BUTTON_DOWN)
+            elif kind == EVENT_KEY_DOWN or kind == EVENT_KEY_UP:
+                key(key_name(detail), kind == EVENT_KEY_DOWN)
+    finally:
+        deactivate = getattr(backend, 'deactivate', None)
+        if deactivate is not None:
+            deactivate()
+    return scheduler.jitter.summary()
+
+
+def recording_to_set(recording, name, exclude=None):
+    """Kayıttaki tıklamaları ve yazılan metinleri bir sete çevirir
+
+    Her sol/sağ tıklama bir adım olur; kısa aralıkla aynı yere yapılan iki
+    sol tıklama çift tıklamaya birleştirilir. Tıklamadan sonra yazılan
+    karakterler o adımın metni olur. Gecikmeler, motorun adımları kayıttaki
+    aralıklarla çalıştıracağı şekilde hesaplanır. exclude (x0, y0, x1, y1)
+    verilirse bu alandaki tıklamalar (ör. uygulamanın kendi penceresi)
+    atlanır.
+    """
+    steps = []  # [zaman ns, x, y, tıklama kodu, metin parçaları]
+    for timestamp, kind, x, y, detail in recording.events():
+        if kind == EVENT_BUTTON_DOWN and detail != 1:
+            if exclude is not None and exclude[0] <= x < exclude[2] and exclude[1] <= y < exclude[3]:
+                continue
+            last = steps[-1] if steps else None
+            if (detail == 0 and last is not None and last[3] == CLICK_LEFT and not last[4]
+                    and timestamp - last[0] <= DOUBLE_CLICK_MS * 1_000_000
+                    and abs(x - last[1]) <= DOUBLE_CLICK_DISTANCE
+                    and abs(y - last[2]) <= DOUBLE_CLICK_DISTANCE):
+                last[3] = CLICK_DOUBLE
+                continue
+            steps.append([timestamp, x, y, CLICK_LEFT if detail == 0 else CLICK_RIGHT, []])
+        elif kind == EVENT_KEY_DOWN and steps:
+            pressed = key_name(detail)
+            text = steps[-1][4]
+            if len(pressed) == 1:
+                text.append(pressed)
+            elif pressed in _KEY_TEXT:
+                text.append(_KEY_TEXT[pressed])
+            elif pressed == 'backspace' and text:
+                text.pop()
+
+    set_data = SetData(name, max(len(steps), 1))
+    min_delay_ms = MIN_DELAY_NS // 1_000_000
+    for i, (timestamp, x, y, click, text) in enumerate(steps):
+        set_data.set_coordinate(i, (x, y))
+        set_data.clicks[i] = click
+        set_data.set_text(i, ''.join(text))
+        if i + 1 < len(steps):
+            gap_ns = steps[i + 1][0] - timestamp
+            if text:
+                gap_ns -= TEXT_PAUSE_NS  # Motor metinden önce bu kadar bekler
+            set_data.delays_ms[i] = max(min_delay_ms, gap_ns // 1_000_000)
+        else:
+            set_data.delays_ms[i] = DEFAULT_DELAY_MS
+    return set_data
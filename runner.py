@@ -0,0 +1,488 @@
+"""Kayıtlı bir projeyi arayüz olmadan çalıştırır
+
+Örnek:
+    python runner.py proje.json
+    python runner.py proje.acp --backend xtest --fast
+    python runner.py proje.json --queue 2,3 --verbose
+    python runner.py proje.json --text-mode paste
+    python runner.py makro.acm --speed 2
+    python runner.py proje.json --backend xtest --displays :1,:2,:3,:4
+    python runner.py proje.json --telemetry adimlar.csv --telemetry autoclicker.prom
+
+Proje dosyası save_file ile yazılmış JSON veya ikili (.acp) dosyadır.
+Kuyruk, arayüzdeki ile aynı motorla (döngü sayıları, tıklama tipleri,
+metinler ve gecikmeler) çalıştırılır. Bu modül tkinter'ı hiçbir zaman içe
+aktarmaz; pyautogui arka ucu kendi bağımlılıkları nedeniyle aktarabilir,
+başsız sistemlerde xtest arka ucu önerilir.
+
+--displays verilirse kuyruğun bağımsız kopyaları her X ekranı (ör. Xvfb
+:1..:N) için ayrı bir süreçte çalıştırılır; ilerleme ve ölçümler ana
+süreçte toplanır.
+
+.acm uzantılı makro kayıtları (recorder.py) kaydedildikleri zamanlamayla,
+--speed verilirse hızlandırılarak veya yavaşlatılarak oynatılır.
+"""
+import argparse
+import multiprocessing
+import os
+import queue
+import signal
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from display import settings_transform
+from engine import ExecutionEngine, ExecutionQueue, RunControl, compile_plan
+from input_backends import BACKEND_NAMES, FailSafeWatchdog, create_backend, format_input_stats
+from models import TEXT_MODES
+from project_io import load_project
+from recorder import is_macro_path, load_recording, replay
+from screen import DEFAULT_CAPTURE_AGE_MS, DEFAULT_POLL_MS, format_capture_stats
+from telemetry import TELEMETRY_FORMATS, format_telemetry_summary
+
+
+# Paralel çalışmada işçilerin ilerleme gönderme aralığı (sn)
+PROGRESS_INTERVAL = 0.5
+
+
+def parse_queue(value):
+    return [int(part) for part in value.split(',') if part]
+
+
+def parse_telemetry_path(value):
+    if os.path.splitext(value)[1].lower() not in TELEMETRY_FORMATS:
+        raise argparse.ArgumentTypeError(
+            f"telemetri dosyasının uzantısı {', '.join(TELEMETRY_FORMATS)} olmalı")
+    return value
+
+
+def parse_displays(value):
+    return [part.strip() for part in value.split(',') if part.strip()]
+
+
+def build_settings(project, args):
+    """Proje ayarlarını komut satırı seçenekleriyle birleştirir"""
+    settings = {'fast_input': False, 'input_pause': 0.0, 'input_backend': 'pyautogui',
+                'text_mode': 'type', 'text_interval': 0.0, 'wait_poll': DEFAULT_POLL_MS / 1000,
+                'capture_max_age': DEFAULT_CAPTURE_AGE_MS / 1000}
+    settings.update(project.get('settings', {}))
+    if args.backend is not None:
+        settings['input_backend'] = args.backend
+    if args.fast:
+        settings['fast_input'] = True
+    if args.pause is not None:
+        settings['input_pause'] = args.pause
+    if args.text_mode is not None:
+        settings['text_mode'] = args.text_mode
+    if args.text_interval is not None:
+        settings['text_interval'] = args.text_interval
+    if args.wait_poll is not None:
+        settings['wait_poll'] = args.wait_poll
+    if args.capture_max_age is not None:
+        settings['capture_max_age'] = args.capture_max_age
+    return settings
+
+
+class ProgressPrinter:
+    """Motorun durum mesajlarını konsola yazar"""
+
+    def __init__(self, sets, execution_queue, verbose=False, stream=sys.stdout):
+        self.sets = sets
+        self.queue = execution_queue
+        self.verbose = verbose
+        self.stream = stream
+        self.position = None  # (entry_id, döngü)
+        self.entry_numbers = {entry_id: i + 1 for i, (entry_id, _) in
+                              enumerate(execution_queue.entries())}
+        self.steps = 0
+        self.error = None
+        self.telemetry = None
+
+    def handle(self, message):
+        """Bir durum mesajını işler; motor bittiyse True döndürür"""
+        kind = message[0]
+        if kind == 'step':
+            entry, loop, coord = message[1:]
+            self.steps += 1
+            if (entry, loop) != self.position:
+                self.position = (entry, loop)
+                set_id = self.queue.set_id(entry)
+                set_data = self.sets[set_id]
+                self.print(f"[{self.entry_numbers.get(entry, '?')}/{len(self.entry_numbers)}] "
+                           f"{set_data['name']} - döngü {loop + 1}/{set_data['loop_count']}")
+            if self.verbose:
+                set_data = self.sets[self.queue.set_id(entry)]
+                self.print(f"    {set_data['names'][coord]}")
+        elif kind == 'match':
+            entry, coord, found, x, y, elapsed = message[1:]
+            if self.verbose or not found:
+                set_data = self.sets[self.queue.set_id(entry)]
+                result = f"({x}, {y})" if found else "bulunamadı, adım atlandı"
+                self.print(f"    şablon {set_data['names'][coord]}: {result} "
+                           f"[{elapsed / 1e6:.1f} ms]")
+        elif kind == 'wait':
+            entry, coord, satisfied, elapsed = message[1:]
+            if self.verbose:
+                set_data = self.sets[self.queue.set_id(entry)]
+                result = "sağlandı" if satisfied else "zaman aşımı"
+                self.print(f"    bekleme {set_data['names'][coord]}: {result} "
+                           f"[{elapsed / 1e6:.1f} ms]")
+        elif kind in ('paused', 'resumed'):
+            self.print("Duraklatıldı" if kind == 'paused' else "Devam ediliyor")
+        elif kind == 'error':
+            self.error = message[1]
+            self.print(f"İşlem hatası: {message[1]}")
+        elif kind == 'input_stats':
+            for action, stats in message[1].items():
+                self.print(format_input_stats(action, stats))
+        elif kind == 'capture_stats':
+            self.print(format_capture_stats(message[1]))
+        elif kind == 'telemetry':
+            self.telemetry = message[1]
+            if self.telemetry.count:
+                self.print(format_telemetry_summary(self.telemetry.summary()))
+        elif kind == 'stats':
+            stats = message[1]
+            self.print(f"Zamanlama sapması: ort {stats['mean_us']:.0f} µs, "
+                       f"maks {stats['max_us']:.0f} µs ({stats['count']} adım)")
+        elif kind == 'finished':
+            return True
+        return False
+
+    def print(self, text):
+        print(text, file=self.stream, flush=True)
+
+
+def queue_set_ids(project, args):
+    """Çalıştırılacak set kimliklerini döndürür; geçersizse hata mesajı yazıp None döndürür"""
+    sets = project['sets']
+    set_ids = args.queue if args.queue is not None else project['execution_queue']
+    missing = [set_id for set_id in set_ids if set_id not in sets]
+    if missing:
+        print(f"Projede olmayan setler: {', '.join(map(str, missing))}", file=sys.stderr)
+        return None
+    if not set_ids:
+        print("İşlem kuyruğu boş!", file=sys.stderr)
+        return None
+    return set_ids
+
+
+def run_project(project, args):
+    """Projenin kuyruğunu çalıştırır ve çıkış kodunu döndürür"""
+    sets = project['sets']
+    set_ids = queue_set_ids(project, args)
+    if set_ids is None:
+        return 2
+
+    execution_queue = ExecutionQueue(set_ids)
+    settings = build_settings(project, args)
+    try:
+        backend = create_backend(settings)
+    except Exception as e:
+        print(f"Giriş arka ucu başlatılamadı: {e}", file=sys.stderr)
+        return 1
+    transform = settings_transform(settings, backend.display_config())
+    plan = compile_plan(sets, execution_queue, settings['text_mode'], transform)
+    if plan.display is not None:
+        reference = transform.reference
+        print(f"Koordinatlar {reference.width}x{reference.height} ekrandan "
+              f"{plan.display.width}x{plan.display.height} ekrana çevrildi", flush=True)
+
+    status = queue.Queue()
+    engine = ExecutionEngine(plan, backend, status, failsafe=not backend.builtin_failsafe,
+                             queue=execution_queue, sets=sets,
+                             text_interval=settings['text_interval'],
+                             poll_interval=settings['wait_poll'],
+                             capture_max_age=settings['capture_max_age'])
+    printer = ProgressPrinter(sets, execution_queue, verbose=args.verbose)
+    total = sum((stop - start) * loops for start, stop, loops in map(plan.ranges.get, set_ids))
+    print(f"{len(set_ids)} set, {total} adım çalıştırılıyor...", flush=True)
+
+    started = time.perf_counter()
+    engine.start()
+    try:
+        while not printer.handle(status.get()):
+            pass
+    except KeyboardInterrupt:
+        print("Durduruluyor...", flush=True)
+        engine.stop()
+        engine.join()
+        return 130
+    engine.join()
+
+    elapsed = time.perf_counter() - started
+    print(f"Tamamlandı: {printer.steps} adım, {elapsed:.2f} sn", flush=True)
+    if printer.telemetry is not None and not export_telemetry(printer.telemetry, sets, args.telemetry):
+        return 1
+    return 1 if printer.error else 0
+
+
+def export_telemetry(telemetry, sets, paths, labels=None):
+    """Adım ölçümlerini verilen dosyalara yazar; hata olursa False döndürür"""
+    telemetry.set_names = {set_id: sets[set_id].name for set_id in telemetry.by_set if set_id in sets}
+    exported = True
+    for path in paths or ():
+        try:
+            telemetry.export(path, labels)
+        except (OSError, ValueError) as e:
+            print(f"Telemetri yazılamadı ({path}): {e}", file=sys.stderr)
+            exported = False
+        else:
+            print(f"Telemetri yazıldı: {path}", flush=True)
+    return exported
+
+
+def worker_path(path, index):
+    """İşçiye özel dosya adı: sonuc.csv -> sonuc-2.csv"""
+    root, extension = os.path.splitext(path)
+    return f"{root}-{index + 1}{extension}"
+
+
+def run_replay(args):
+    """Makro kaydını oynatır ve çıkış kodunu döndürür"""
+    try:
+        recording = load_recording(args.project)
+    except (OSError, ValueError, IndexError) as e:
+        print(f"Makro yükleme hatası: {e}", file=sys.stderr)
+        return 1
+    try:
+        backend = create_backend(build_settings({}, args))
+    except Exception as e:
+        print(f"Giriş arka ucu başlatılamadı: {e}", file=sys.stderr)
+        return 1
+
+    control = RunControl()
+    watchdog = None
+    if not backend.builtin_failsafe:
+        watchdog = FailSafeWatchdog(backend, control.stop)
+        watchdog.start()
+    duration = recording.duration_ns() / 1e9 / args.speed
+    print(f"{len(recording)} olay oynatılıyor (~{duration:.1f} sn, hız x{args.speed:g})...", flush=True)
+    started = time.perf_counter()
+    try:
+        stats = replay(recording, backend, speed=args.speed, control=control)
+    except KeyboardInterrupt:
+        print("Durduruluyor...", flush=True)
+        return 130
+    finally:
+        control.stop()
+        if watchdog is not None:
+            watchdog.stop()
+    print(f"Zamanlama sapması: ort {stats['mean_us']:.0f} µs, "
+          f"maks {stats['max_us']:.0f} µs ({stats['count']} olay)")
+    print(f"Tamamlandı: {stats['count']} olay, {time.perf_counter() - started:.2f} sn", flush=True)
+    return 0
+
+
+def ignore_interrupt():
+    """İşçi süreç başlatıcısı: terminalin Ctrl-C'si işçilere de gider; işçiler
+    yalnızca ortak stop olayıyla durur"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def run_worker(index, display, args, progress, stop):
+    """Bir X ekranında kuyruğun bir kopyasını çalıştırır (işçi süreç)
+
+    İlerleme, PROGRESS_INTERVAL aralıklarla progress kuyruğuna özet olarak
+    gönderilir; adım başına süreçler arası mesaj gönderilmez.
+    """
+    # Giriş modülleri ekranı DISPLAY'den okur; içe aktarılmadan önce ayarlanmalı
+    os.environ['DISPLAY'] = display
+    project = load_project(args.project)
+    sets = project['sets']
+    set_ids = args.queue if args.queue is not None else project['execution_queue']
+    execution_queue = ExecutionQueue(set_ids)
+    settings = build_settings(project, args)
+    backend = create_backend(settings)
+    # Her ekranın çözünürlüğü farklı olabilir; dönüşüm işçi başına bulunur
+    transform = settings_transform(settings, backend.display_config())
+    plan = compile_plan(sets, execution_queue, settings['text_mode'], transform)
+
+    status = queue.Queue()
+    engine = ExecutionEngine(plan, backend, status, failsafe=not backend.builtin_failsafe,
+                             queue=execution_queue, sets=sets,
+                             text_interval=settings['text_interval'],
+                             poll_interval=settings['wait_poll'],
+                             capture_max_age=settings['capture_max_age'])
+    result = {'index': index, 'display': display, 'steps': 0, 'error': None,
+              'stats': None, 'input_stats': None, 'capture_stats': None}
+    position = None
+    started = time.perf_counter()
+    last_report = started
+    engine.start()
+    while True:
+        try:
+            message = status.get(timeout=0.1)
+        except queue.Empty:
+            message = None
+        if stop.is_set():
+            engine.stop()
+
+        if message is not None:
+            kind = message[0]
+            if kind == 'step':
+                result['steps'] += 1
+                position = message[1:3]
+            elif kind == 'error':
+                result['error'] = message[1]
+            elif kind in ('stats', 'input_stats', 'capture_stats'):
+                result[kind] = message[1]
+            elif kind == 'telemetry':
+                # Her ekranın ölçümleri ayrı dosyaya; Prometheus satırları display etiketiyle ayrışır
+                paths = [worker_path(path, index) for path in args.telemetry or ()]
+                export_telemetry(message[1], sets, paths, {'display': display})
+            elif kind == 'finished':
+                break
+
+        now = time.perf_counter()
+        if now - last_report >= PROGRESS_INTERVAL and position is not None:
+            last_report = now
+            entry, loop = position
+            set_data = sets[execution_queue.set_id(entry)] if entry in execution_queue else None
+            progress.put((index, result['steps'],
+                          set_data['name'] if set_data is not None else '', loop + 1))
+    engine.join()
+    result['elapsed'] = time.perf_counter() - started
+    return result
+
+
+def aggregate_results(results):
+    """İşçi sonuçlarını tek özet halinde birleştirir"""
+    steps = sum(result['steps'] for result in results)
+    elapsed = max((result['elapsed'] for result in results), default=0.0)
+    jitter = [result['stats'] for result in results if result['stats'] and result['stats']['count']]
+    count = sum(stats['count'] for stats in jitter)
+    summary = {
+        'workers': len(results),
+        'steps': steps,
+        'elapsed': elapsed,
+        'steps_per_sec': steps / elapsed if elapsed else 0.0,
+        'jitter_mean_us': (sum(stats['mean_us'] * stats['count'] for stats in jitter) / count
+                           if count else 0.0),
+        'jitter_max_us': max((stats['max_us'] for stats in jitter), default=0.0),
+        'errors': [(result['display'], result['error']) for result in results if result['error']],
+    }
+    actions = {}
+    for result in results:
+        for action, stats in (result['input_stats'] or {}).items():
+            total = actions.setdefault(action, {'count': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+            total['count'] += stats['count']
+            total['total_ms'] += stats['mean_ms'] * stats['count']
+            total['max_ms'] = max(total['max_ms'], stats['max_ms'])
+            if 'chars' in stats:
+                total['chars'] = total.get('chars', 0) + stats['chars']
+    summary['input_stats'] = {}
+    for action, total in actions.items():
+        if not total['count']:
+            continue
+        stats = {'count': total['count'], 'mean_ms': total['total_ms'] / total['count'],
+                 'max_ms': total['max_ms']}
+        if 'chars' in total:
+            stats['chars'] = total['chars']
+            stats['chars_per_sec'] = (total['chars'] / (total['total_ms'] / 1000)
+                                      if total['total_ms'] else 0.0)
+        summary['input_stats'][action] = stats
+    return summary
+
+
+def run_parallel(project, args):
+    """Kuyruğu her ekranda ayrı süreçte çalıştırır ve sonuçları toplar"""
+    if queue_set_ids(project, args) is None:
+        return 2
+    displays = args.displays
+    # Her işçi giriş modüllerini kendi DISPLAY değeriyle yeniden yüklesin
+    context = multiprocessing.get_context('spawn')
+    with context.Manager() as manager:
+        progress = manager.Queue()
+        stop = manager.Event()
+        print(f"{len(displays)} ekranda çalıştırılıyor: {', '.join(displays)}", flush=True)
+        with ProcessPoolExecutor(max_workers=len(displays), mp_context=context,
+                                 initializer=ignore_interrupt) as pool:
+            futures = [pool.submit(run_worker, i, display, args, progress, stop)
+                       for i, display in enumerate(displays)]
+            status = {}  # işçi -> (adım, set, döngü)
+            interrupted = False
+            try:
+                while not all(future.done() for future in futures):
+                    try:
+                        index, steps, set_name, loop = progress.get(timeout=PROGRESS_INTERVAL)
+                    except queue.Empty:
+                        continue
+                    status[index] = (steps, set_name, loop)
+                    total = sum(steps for steps, _, _ in status.values())
+                    parts = ", ".join(f"{displays[i]} {name} d{loop}"
+                                      for i, (_, name, loop) in sorted(status.items()))
+                    print(f"Toplam {total} adım | {parts}", flush=True)
+            except KeyboardInterrupt:
+                print("Durduruluyor...", flush=True)
+                interrupted = True
+                stop.set()
+
+            results = []
+            for display, future in zip(displays, futures):
+                try:
+                    results.append(future.result())
+                except BaseException as e:
+                    # İşçide KeyboardInterrupt dahil her hata o ekranın sonucudur
+                    results.append({'display': display, 'steps': 0, 'elapsed': 0.0,
+                                    'error': f"{type(e).__name__}: {e}", 'stats': None,
+                                    'input_stats': None, 'capture_stats': None})
+
+    summary = aggregate_results(results)
+    for result in results:
+        print(f"  {result['display']}: {result['steps']} adım"
+              + (f", hata: {result['error']}" if result['error'] else ""))
+    for action, stats in summary['input_stats'].items():
+        print(format_input_stats(action, stats))
+    print(f"Zamanlama sapması: ort {summary['jitter_mean_us']:.0f} µs, "
+          f"maks {summary['jitter_max_us']:.0f} µs")
+    print(f"Tamamlandı: {summary['workers']} ekran, {summary['steps']} adım, "
+          f"{summary['elapsed']:.2f} sn ({summary['steps_per_sec']:.1f} adım/sn)", flush=True)
+    if interrupted:
+        return 130
+    return 1 if summary['errors'] else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Otomasyon projesini arayüz olmadan çalıştırır")
+    parser.add_argument('project', help="Proje dosyası (.json veya .acp) ya da makro kaydı (.acm)")
+    parser.add_argument('--backend', choices=BACKEND_NAMES,
+                        help="Giriş arka ucu (varsayılan: projedeki ayar)")
+    parser.add_argument('--fast', action='store_true', help="Hızlı giriş modunu aç")
+    parser.add_argument('--pause', type=float, help="Her giriş işleminden sonraki bekleme (sn)")
+    parser.add_argument('--text-mode', choices=TEXT_MODES,
+                        help="Adımda seçilmemişse metin yazma modu (varsayılan: projedeki ayar)")
+    parser.add_argument('--text-interval', type=float,
+                        help="Toplu yazmada karakterler arası bekleme (sn)")
+    parser.add_argument('--wait-poll', type=float,
+                        help="Bekleme koşullarının yoklama aralığı (sn)")
+    parser.add_argument('--telemetry', action='append', type=parse_telemetry_path, metavar='DOSYA',
+                        help="Adım ölçümlerini yaz (" + ", ".join(TELEMETRY_FORMATS)
+                             + "; birden fazla verilebilir)")
+    parser.add_argument('--capture-max-age', type=float,
+                        help="Kontrollerin paylaştığı ekran görüntüsünün en büyük yaşı (sn)")
+    parser.add_argument('--queue', type=parse_queue,
+                        help="Projedeki kuyruk yerine çalıştırılacak set kimlikleri (virgülle)")
+    parser.add_argument('--verbose', action='store_true', help="Her adımı yazdır")
+    parser.add_argument('--displays', type=parse_displays,
+                        help="Kuyruğu her biri ayrı süreçte çalıştırılacak X ekranları (ör. :1,:2)")
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help="Makro oynatma hızı çarpanı (ör. 2 iki kat hızlı)")
+    args = parser.parse_args(argv)
+    if args.speed <= 0:
+        parser.error("--speed pozitif olmalı")
+    if is_macro_path(args.project):
+        return run_replay(args)
+
+    try:
+        project = load_project(args.project)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Dosya yükleme hatası: {e}", file=sys.stderr)
+        return 1
+    if args.displays:
+        return run_parallel(project, args)
+    return run_project(project, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
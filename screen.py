@@ -0,0 +1,573 @@
+"""Ekrana bakan adımlar: şablon görüntü hedefleri ve bekleme koşulları
+
+Şablon, normalize çapraz korelasyonla (NCC) aranır: pay FFT ile, pencere
+toplamları integral görüntülerle hesaplanır, böylece arama alanının
+boyutundan bağımsız olarak birkaç dizi işlemine iner. Arama önce şablonun
+son bulunduğu yerin çevresindeki küçük bir alanda yapılır; bulunamazsa
+geniş alana (verilmişse ilgi bölgesi, yoksa tüm ekran) geçilir.
+
+Ekran görüntüsü ScreenCapture ile (mss varsa mss, yoksa pyautogui) yalnızca
+aranan bölge için alınır. ImageCapture aynı arayüzü kayıtlı bir ekran
+görüntüsü üzerinden sağlar; eşleştirme ekran olmadan denenebilir:
+
+    python screen.py ekran.png sablon.png [--region x,y,w,h] [--near x,y]
+
+Bekleme koşulları (ScreenCondition) adımdan sonraki sabit gecikmenin yerine
+geçer: küçük bir bölge değişene, bir piksel belirli renge gelene veya
+bölgenin özeti (CRC32) beklenen değere eşit olana kadar yalnızca o bölge
+yoklanır; gecikme zaman aşımı olur.
+
+Motor ekran görüntülerini CaptureCache üzerinden alır: yalnızca istenen
+bölgeleri kapsayan dikdörtgen yakalanır ve en fazla max_age boyunca
+paylaşılır; bölgeler bu görüntünün kopyasız NumPy görünümleri olarak
+okunur. Bir önceki görüntüden okunan bölgeler bir sonraki yakalamaya
+eklendiğinden aynı anda yapılan kontroller tek bir yakalamaya iner, tek
+bir bölgeyi yoklayan bekleme ise yalnızca o bölgeyi yakalar.
+
+numpy, Pillow ve mss yalnızca şablon veya koşul kullanılınca içe aktarılır.
+"""
+import argparse
+import sys
+import time
+import zlib
+from dataclasses import dataclass, replace
+
+# Bu skorun altındaki en iyi eşleşme "bulunamadı" sayılır (NCC, -1..1)
+MATCH_THRESHOLD = 0.9
+# Son bulunan yerin çevresinde şablonun her yanına eklenen arama payı (piksel)
+NEAR_MARGIN = 48
+# Geniş arama önce bu oranda küçültülmüş görüntüde yapılır; aday tam çözünürlükte doğrulanır.
+# Küçültülmüş şablonun kenarı COARSE_MIN_SIZE'dan kısaysa kaba arama atlanır.
+COARSE_FACTOR = 4
+COARSE_MIN_SIZE = 6
+COARSE_THRESHOLD = 0.6
+
+
+def fast_length(size):
+    """size'dan büyük veya eşit, yalnızca 2, 3 ve 5 çarpanlı en küçük FFT uzunluğu"""
+    best = 1 << (size - 1).bit_length()
+    power5 = 1
+    while power5 < best:
+        power35 = power5
+        while power35 < best:
+            length = power35
+            while length < size:
+                length *= 2
+            best = min(best, length)
+            power35 *= 3
+        power5 *= 5
+    return best
+
+
+def to_gray(pixels):
+    """RGB(A) veya gri piksel dizisini float32 gri görüntüye çevirir"""
+    import numpy as np
+    pixels = np.asarray(pixels)
+    if pixels.ndim == 2:
+        return pixels.astype(np.float32, copy=False)
+    rgb = pixels[..., :3].astype(np.float32)
+    return rgb @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+def downsample(image, factor):
+    """Görüntüyü factor x factor blokların ortalamasıyla küçültür"""
+    rows, cols = image.shape[0] // factor, image.shape[1] // factor
+    blocks = image[:rows * factor, :cols * factor].reshape(rows, factor, cols, factor)
+    return blocks.mean(axis=(1, 3), dtype=image.dtype if image.dtype.kind == 'f' else None)
+
+
+def load_image(path):
+    """Görüntü dosyasını gri NumPy dizisi olarak okur"""
+    from PIL import Image
+    with Image.open(path) as image:
+        return to_gray(image.convert('L'))
+
+
+def load_pixels(path):
+    """Görüntü dosyasını RGB uint8 NumPy dizisi olarak okur"""
+    import numpy as np
+    from PIL import Image
+    with Image.open(path) as image:
+        return np.asarray(image.convert('RGB'))
+
+
+@dataclass
+class Match:
+    __slots__ = ('x', 'y', 'score', 'elapsed_ns')
+    x: int  # Eşleşmenin ekrandaki merkezi
+    y: int
+    score: float
+    elapsed_ns: int
+
+
+class TemplateMatcher:
+    """Şablonu verilen görüntü içinde normalize çapraz korelasyonla arar"""
+
+    def __init__(self, template, threshold=MATCH_THRESHOLD):
+        import numpy as np
+        self.np = np
+        template = to_gray(template).astype(np.float64)
+        self.height, self.width = template.shape
+        centered = template - template.mean()
+        self.norm2 = float((centered * centered).sum())
+        # Korelasyon, ters çevrilmiş şablonla evrişimdir
+        self._kernel = centered[::-1, ::-1]
+        self._spectra = {}  # FFT boyutu -> şablonun spektrumu
+        self.threshold = threshold
+
+    def scores(self, image):
+        """Şablonun sığdığı her sol üst konum için NCC skorlarını döndürür"""
+        np = self.np
+        image = np.asarray(image, dtype=np.float64)
+        rows, cols = image.shape
+        h, w = self.height, self.width
+        if rows < h or cols < w:
+            return np.empty((0, 0))
+
+        # FFT boyutu hızlı uzunluklara yuvarlanır; döngüsel taşma geçerli bölgeye uzanmaz
+        shape = (fast_length(rows + h - 1), fast_length(cols + w - 1))
+        spectrum = self._spectra.get(shape)
+        if spectrum is None:
+            spectrum = self._spectra[shape] = np.fft.rfft2(self._kernel, shape)
+        correlation = np.fft.irfft2(np.fft.rfft2(image, shape) * spectrum, shape)
+        numerator = correlation[h - 1:rows, w - 1:cols]
+
+        # Pencere toplamları integral görüntülerle
+        integral = np.zeros((rows + 1, cols + 1))
+        integral[1:, 1:] = image.cumsum(0).cumsum(1)
+        squares = np.zeros((rows + 1, cols + 1))
+        squares[1:, 1:] = (image * image).cumsum(0).cumsum(1)
+        window = integral[h:, w:] - integral[:-h, w:] - integral[h:, :-w] + integral[:-h, :-w]
+        window2 = squares[h:, w:] - squares[:-h, w:] - squares[h:, :-w] + squares[:-h, :-w]
+        variance = np.maximum(window2 - window * window / (h * w), 0.0)
+
+        denominator = np.sqrt(variance * self.norm2)
+        # Düz (tek renkli) pencerelerde skor tanımsız, eşleşme sayılmaz
+        return np.divide(numerator, denominator, out=np.zeros_like(numerator),
+                         where=denominator > 1e-6 * max(self.norm2, 1.0))
+
+    def match(self, image, left=0, top=0):
+        """En iyi eşleşmeyi Match olarak, eşik altındaysa None döndürür
+
+        left/top, image'in ekrandaki sol üst köşesidir.
+        """
+        started = time.perf_counter_ns()
+        scores = self.scores(image)
+        if not scores.size:
+            return None
+        row, col = divmod(int(scores.argmax()), scores.shape[1])
+        score = float(scores[row, col])
+        if score < self.threshold:
+            return None
+        return Match(left + col + self.width // 2, top + row + self.height // 2, score,
+                     time.perf_counter_ns() - started)
+
+
+def clip_region(region, bounds):
+    """(sol, üst, genişlik, yükseklik) bölgesini bounds içine kırpar; boşsa None"""
+    left, top = max(region[0], bounds[0]), max(region[1], bounds[1])
+    right = min(region[0] + region[2], bounds[0] + bounds[2])
+    bottom = min(region[1] + region[3], bounds[1] + bounds[3])
+    if right <= left or bottom <= top:
+        return None
+    return left, top, right - left, bottom - top
+
+
+class TemplateTarget:
+    """Bir adımın şablon hedefi
+
+    hint, şablonun beklendiği ekran noktasıdır (adımın kayıtlı koordinatı);
+    ilk arama onun, sonrakiler son bulunduğu yerin çevresinde yapılır.
+    search geniş arama alanıdır (sol, üst, genişlik, yükseklik); None ise
+    tüm ekran aranır. Geniş arama, şablon yeterince büyükse önce
+    küçültülmüş görüntüde aday bulur ve yalnızca adayın çevresini tam
+    çözünürlükte doğrular. Kaba aramada aday çıkmazsa şablon yok sayılır;
+    aday doğrulanamazsa tam çözünürlükte aranır.
+    """
+
+    def __init__(self, template, hint=None, search=None, threshold=MATCH_THRESHOLD,
+                 near_margin=NEAR_MARGIN):
+        self.matcher = TemplateMatcher(template, threshold)
+        self.coarse = None
+        if min(self.matcher.height, self.matcher.width) >= COARSE_FACTOR * COARSE_MIN_SIZE:
+            self.coarse = TemplateMatcher(downsample(to_gray(template), COARSE_FACTOR),
+                                          COARSE_THRESHOLD)
+        self.last = hint
+        self.search = search
+        self.near_margin = near_margin
+        self.near_hits = 0
+        self.wide_hits = 0
+        self.misses = 0
+
+    def region_around(self, point, margin):
+        half_w = self.matcher.width // 2 + margin
+        half_h = self.matcher.height // 2 + margin
+        return (point[0] - half_w, point[1] - half_h, 2 * half_w + 1, 2 * half_h + 1)
+
+    def _search(self, capture, region):
+        region = clip_region(region, capture.bounds())
+        if region is None:
+            return None
+        return self.matcher.match(capture.grab(*region), region[0], region[1])
+
+    def _wide_search(self, capture, region):
+        region = clip_region(region, capture.bounds())
+        if region is None:
+            return None
+        image = capture.grab(*region)
+        if self.coarse is not None:
+            factor = COARSE_FACTOR
+            candidate = self.coarse.match(downsample(image, factor))
+            if candidate is None:
+                return None
+            # Kaba konumun yuvarlama hatası en fazla bir blok
+            center = (region[0] + candidate.x * factor, region[1] + candidate.y * factor)
+            match = self._search(capture, self.region_around(center, 2 * factor))
+            if match is not None:
+                return match
+        return self.matcher.match(image, region[0], region[1])
+
+    def locate(self, capture):
+        """Şablonu ekranda arar; bulunursa Match (toplam süreyle), yoksa None"""
+        started = time.perf_counter_ns()
+        match = None
+        if self.last is not None:
+            match = self._search(capture, self.region_around(self.last, self.near_margin))
+            if match is not None:
+                self.near_hits += 1
+        if match is None:
+            match = self._wide_search(capture, self.search or capture.bounds())
+            if match is not None:
+                self.wide_hits += 1
+        if match is None:
+            self.misses += 1
+            return None
+        self.last = (match.x, match.y)
+        match.elapsed_ns = time.perf_counter_ns() - started
+        return match
+
+
+class ScreenCapture:
+    """Ekranın istenen bölgesini gri NumPy dizisi olarak alır
+
+    mss kuruluysa onu (Linux'ta XShm ile paylaşımlı bellek), değilse
+    pyautogui.screenshot'ı kullanır. display, X ekranının adıdır (ör. ':1');
+    yalnızca mss ile kullanılır. Nesne onu oluşturan thread'de kullanılmalıdır.
+    """
+
+    def __init__(self, display=None):
+        try:
+            import mss
+        except ImportError:
+            self._mss = None
+            import pyautogui
+            self._pyautogui = pyautogui
+            width, height = pyautogui.size()
+            self._bounds = (0, 0, int(width), int(height))
+        else:
+            self._mss = mss.mss(display=display) if display else mss.mss()
+            monitor = self._mss.monitors[0]  # Tüm ekranları kapsayan sanal masaüstü
+            self._bounds = (monitor['left'], monitor['top'], monitor['width'], monitor['height'])
+
+    def bounds(self):
+        return self._bounds
+
+    def grab_rgb(self, left, top, width, height):
+        """Bölgeyi (yükseklik, genişlik, 3) uint8 RGB dizisi olarak alır"""
+        import numpy as np
+        if self._mss is not None:
+            shot = self._mss.grab({'left': left, 'top': top, 'width': width, 'height': height})
+            pixels = np.frombuffer(shot.bgra, dtype=np.uint8).reshape(height, width, 4)
+            return pixels[..., 2::-1]  # BGRA -> RGB
+        return np.asarray(self._pyautogui.screenshot(region=(left, top, width, height)))
+
+    def grab(self, left, top, width, height):
+        """Bölgeyi gri float32 dizisi olarak alır"""
+        return to_gray(self.grab_rgb(left, top, width, height))
+
+
+class ImageCapture:
+    """Kayıtlı bir ekran görüntüsünü ScreenCapture gibi sunar (ekransız deneme için)"""
+
+    def __init__(self, image, left=0, top=0):
+        import numpy as np
+        pixels = load_pixels(image) if isinstance(image, str) else np.asarray(image)
+        if pixels.ndim == 2:
+            pixels = np.repeat(pixels[..., None], 3, axis=2)
+        self.pixels = pixels[..., :3]
+        self.image = to_gray(self.pixels)
+        self.left = left
+        self.top = top
+
+    def bounds(self):
+        return (self.left, self.top, self.image.shape[1], self.image.shape[0])
+
+    def grab_rgb(self, left, top, width, height):
+        x, y = left - self.left, top - self.top
+        return self.pixels[y:y + height, x:x + width]
+
+    def grab(self, left, top, width, height):
+        x, y = left - self.left, top - self.top
+        return self.image[y:y + height, x:x + width]
+
+
+# Önbellekteki ekran görüntüsünün varsayılan en büyük yaşı (ms)
+DEFAULT_CAPTURE_AGE_MS = 10
+
+
+class CaptureCache:
+    """Ekran bölgelerini kısa süre paylaştıran önbellek
+
+    source ScreenCapture veya ImageCapture'dır. Okunan bölge son görüntünün
+    içindeyse ve görüntü max_age (sn) dolmamışsa ya da invalidate()
+    çağrılmamışsa (ör. giriş gönderildikten sonra) yeniden yakalanmaz.
+    Aksi halde istenen bölge, önceki görüntüden okunan bölgelerle birlikte
+    (kapsayan dikdörtgen olarak) yakalanır: her tikte aynı bölgelere bakan
+    kontroller tek yakalamayı paylaşır, tek bölge yoklanırken ekranın geri
+    kalanı alınmaz. grab_rgb bölgeyi ekran sınırlarına kırpar ve görüntünün
+    kopyasız görünümü olarak döndürür, bu yüzden döndürülen dizi
+    değiştirilmemeli, saklanacaksa kopyalanmalıdır. Tamamen ekran dışındaki
+    bölgede ValueError fırlatır. hits/misses ve yakalama süreleri stats()
+    ile okunur.
+    """
+
+    def __init__(self, source, max_age=DEFAULT_CAPTURE_AGE_MS / 1000):
+        self.source = source
+        self.max_age_ns = max(0, int(round(max_age * 1_000_000_000)))
+        self._bounds = tuple(source.bounds())
+        self._frame = None
+        self._frame_region = None  # Son görüntünün kapsadığı bölge
+        self._taken_ns = 0
+        self._read = None  # Son görüntüden okunan bölgelerin kapsayanı
+        self.hits = 0
+        self.misses = 0
+        self.capture_ns = 0
+        self.max_capture_ns = 0
+        self.captured_pixels = 0
+
+    def bounds(self):
+        return self._bounds
+
+    def invalidate(self):
+        """Sonraki okumada yeni görüntü alınmasını sağlar"""
+        self._frame = None
+
+    def _frame_for(self, region):
+        """region'ı kapsayan görüntü ve sol üst köşesi; gerekirse yakalar"""
+        fresh = self._frame is not None and time.monotonic_ns() - self._taken_ns <= self.max_age_ns
+        if fresh and _contains(self._frame_region, region):
+            self.hits += 1
+            self._read = _union(self._read, region)
+            return self._frame, self._frame_region
+        if fresh:
+            # Aynı tikte yeni bir bölge: öncekilerle birlikte yeniden yakalanır
+            self._read = wanted = _union(self._read, region)
+        else:
+            # Yeni tik: önceki tikte okunan bölgeler yine okunacak varsayılır
+            wanted = _union(self._read, region)
+            self._read = region
+        started = time.perf_counter_ns()
+        self._frame = self.source.grab_rgb(*wanted)
+        cost = time.perf_counter_ns() - started
+        self._frame_region = wanted
+        self._taken_ns = time.monotonic_ns()
+        self.misses += 1
+        self.capture_ns += cost
+        self.max_capture_ns = max(self.max_capture_ns, cost)
+        self.captured_pixels += wanted[2] * wanted[3]
+        return self._frame, wanted
+
+    def frame(self):
+        """Ekranın tamamı; yeterince yeniyse önbellekten"""
+        return self._frame_for(self._bounds)[0]
+
+    def grab_rgb(self, left, top, width, height):
+        region = clip_region((left, top, width, height), self._bounds)
+        if region is None:
+            raise ValueError(f"Bölge ekranın dışında: {left},{top},{width},{height}")
+        frame, origin = self._frame_for(region)
+        x, y = region[0] - origin[0], region[1] - origin[1]
+        return frame[y:y + region[3], x:x + region[2]]
+
+    def grab(self, left, top, width, height):
+        return to_gray(self.grab_rgb(left, top, width, height))
+
+    def stats(self):
+        """Önbellek sayaçlarının özeti"""
+        reads = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / reads if reads else 0.0,
+            'capture_mean_ms': self.capture_ns / self.misses / 1e6 if self.misses else 0.0,
+            'capture_max_ms': self.max_capture_ns / 1e6,
+            'capture_mean_kpixels': self.captured_pixels / self.misses / 1000 if self.misses else 0.0,
+        }
+
+
+def _contains(outer, inner):
+    return (outer[0] <= inner[0] and outer[1] <= inner[1]
+            and inner[0] + inner[2] <= outer[0] + outer[2]
+            and inner[1] + inner[3] <= outer[1] + outer[3])
+
+
+def _union(a, b):
+    """İki bölgeyi kapsayan en küçük bölge; a None olabilir"""
+    if a is None:
+        return b
+    left, top = min(a[0], b[0]), min(a[1], b[1])
+    right = max(a[0] + a[2], b[0] + b[2])
+    bottom = max(a[1] + a[3], b[1] + b[3])
+    return left, top, right - left, bottom - top
+
+
+def format_capture_stats(stats):
+    """CaptureCache.stats() özetini tek satırlık metne çevirir"""
+    return (f"Ekran görüntüsü: {stats['misses']} yakalama, {stats['hits']} önbellekten "
+            f"(%{stats['hit_rate'] * 100:.0f}), ort {stats['capture_mean_ms']:.2f} ms, "
+            f"maks {stats['capture_max_ms']:.2f} ms, ort {stats['capture_mean_kpixels']:.1f} bin piksel")
+
+
+# Bekleme koşulu türleri
+CONDITION_CHANGE = 'change'  # Bölge, adımdan önceki halinden farklılaşınca
+CONDITION_COLOR = 'color'  # Piksel verilen renge (tolerans içinde) gelince
+CONDITION_HASH = 'hash'  # Bölgenin CRC32 özeti verilen değere eşit olunca
+CONDITION_KINDS = (CONDITION_CHANGE, CONDITION_COLOR, CONDITION_HASH)
+# Koşul yoklama aralığının varsayılanı (ms)
+DEFAULT_POLL_MS = 20
+DEFAULT_COLOR_TOLERANCE = 8
+
+
+def region_hash(pixels):
+    """RGB bölgenin CRC32 özeti"""
+    import numpy as np
+    return zlib.crc32(np.ascontiguousarray(pixels, dtype=np.uint8).tobytes())
+
+
+@dataclass(frozen=True)
+class ScreenCondition:
+    """Ekranın küçük bir bölgesine bakan bekleme koşulu
+
+    Metin biçimi (adımın waits alanında saklanır):
+        change x,y,gen,yük [tolerans]
+        color x,y #rrggbb [tolerans]
+        hash x,y,gen,yük xxxxxxxx
+    tolerans kanal başına izin verilen en büyük farktır.
+    """
+    kind: str
+    left: int
+    top: int
+    width: int = 1
+    height: int = 1
+    value: int = 0  # color: 0xRRGGBB, hash: CRC32
+    tolerance: int = 0
+
+    @classmethod
+    def parse(cls, text):
+        """Metin biçiminden okur; geçersizse ValueError"""
+        parts = text.split()
+        if len(parts) < 2 or parts[0] not in CONDITION_KINDS:
+            raise ValueError(f"Geçersiz bekleme koşulu: {text!r}")
+        kind, numbers = parts[0], [int(part) for part in parts[1].split(',')]
+        rest = parts[2:]
+        if kind == CONDITION_COLOR:
+            if len(numbers) != 2 or not rest or not rest[0].startswith('#') or len(rest) > 2:
+                raise ValueError(f"Geçersiz renk koşulu: {text!r}")
+            tolerance = int(rest[1]) if len(rest) > 1 else DEFAULT_COLOR_TOLERANCE
+            return cls(kind, numbers[0], numbers[1], value=int(rest[0][1:], 16),
+                       tolerance=tolerance)
+        if len(numbers) != 4 or numbers[2] <= 0 or numbers[3] <= 0 or len(rest) > 1:
+            raise ValueError(f"Geçersiz bölge koşulu: {text!r}")
+        if kind == CONDITION_HASH:
+            if not rest:
+                raise ValueError(f"Özet değeri eksik: {text!r}")
+            return cls(kind, *numbers, value=int(rest[0], 16))
+        return cls(kind, *numbers, tolerance=int(rest[0]) if rest else 0)
+
+    def __str__(self):
+        if self.kind == CONDITION_COLOR:
+            return f"color {self.left},{self.top} #{self.value:06x} {self.tolerance}"
+        region = f"{self.left},{self.top},{self.width},{self.height}"
+        if self.kind == CONDITION_HASH:
+            return f"hash {region} {self.value:08x}"
+        return f"change {region}" + (f" {self.tolerance}" if self.tolerance else "")
+
+    def mapped(self, to_device):
+        """Bölge köşeleri to_device(x, y) ile çevrilmiş kopyasını döndürür"""
+        left, top = to_device(self.left, self.top)
+        if self.kind == CONDITION_COLOR:
+            return replace(self, left=left, top=top)
+        right, bottom = to_device(self.left + self.width, self.top + self.height)
+        return replace(self, left=left, top=top,
+                       width=max(1, right - left), height=max(1, bottom - top))
+
+    def region(self):
+        return self.left, self.top, self.width, self.height
+
+    def clipped(self, bounds):
+        """Bölgesi bounds içine kırpılmış kopyası; tamamen dışındaysa None"""
+        region = clip_region(self.region(), bounds)
+        if region is None:
+            return None
+        if region == self.region():
+            return self
+        return replace(self, left=region[0], top=region[1], width=region[2], height=region[3])
+
+    def sample(self, capture):
+        """Bölgenin şu anki piksellerini (kopya olarak) alır"""
+        return capture.grab_rgb(*self.region()).copy()
+
+    def check(self, capture, baseline=None):
+        """Koşul sağlanıyorsa True; change için baseline adımdan önceki örnektir"""
+        import numpy as np
+        pixels = capture.grab_rgb(*self.region())
+        if self.kind == CONDITION_HASH:
+            return region_hash(pixels) == self.value
+        if self.kind == CONDITION_COLOR:
+            expected = np.array([(self.value >> 16) & 0xFF, (self.value >> 8) & 0xFF,
+                                 self.value & 0xFF], dtype=np.int16)
+            return bool((np.abs(pixels[0, 0].astype(np.int16) - expected) <= self.tolerance).all())
+        if baseline is None or baseline.shape != pixels.shape:
+            return True
+        difference = np.abs(pixels.astype(np.int16) - baseline.astype(np.int16))
+        return bool((difference > self.tolerance).any())
+
+
+def parse_region(value):
+    left, top, width, height = (int(part) for part in value.split(','))
+    return left, top, width, height
+
+
+def parse_point(value):
+    x, y = (int(part) for part in value.split(','))
+    return x, y
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Şablonu kayıtlı bir ekran görüntüsünde arar")
+    parser.add_argument('screenshot', help="Ekran görüntüsü dosyası")
+    parser.add_argument('template', help="Şablon görüntü dosyası")
+    parser.add_argument('--region', type=parse_region, help="Geniş arama alanı: x,y,genişlik,yükseklik")
+    parser.add_argument('--near', type=parse_point, help="Önce çevresinde aranacak nokta: x,y")
+    parser.add_argument('--threshold', type=float, default=MATCH_THRESHOLD)
+    parser.add_argument('--repeat', type=int, default=1, help="Aramayı tekrarla (son bulunan yer kullanılır)")
+    args = parser.parse_args(argv)
+
+    capture = ImageCapture(args.screenshot)
+    target = TemplateTarget(load_image(args.template), hint=args.near, search=args.region,
+                            threshold=args.threshold)
+    found = True
+    for _ in range(args.repeat):
+        match = target.locate(capture)
+        if match is None:
+            print("Bulunamadı")
+            found = False
+        else:
+            print(f"Bulundu: ({match.x}, {match.y}) skor {match.score:.3f}, "
+                  f"{match.elapsed_ns / 1e6:.2f} ms")
+    print(f"Yakın: {target.near_hits}, geniş: {target.wide_hits}, bulunamadı: {target.misses}")
+    return 0 if found else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
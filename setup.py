@@ -19,6 +19,8 @@ build_exe_options = {
         "time",
         "threading",
         "tkinter",
+        # automation.py bunları ilk kullanımda (LazyModule ile) yükler; import
+        # satırı olmadığı için pakete açıkça eklenmeleri gerekir
         "pyautogui", 
         "keyboard",
         "dataclasses",
@@ -59,6 +61,12 @@ executables = [
         icon=None,  # İkon eklemek isterseniz: "path/to/icon.ico"
         shortcut_name="Otomasyon",
         shortcut_dir="DesktopFolder"
+    ),
+    # Arayüzsüz komut satırı çalıştırıcısı (konsol uygulaması)
+    Executable(
+        script="runner.py",
+        base=None,
+        target_name="OtomasyonCLI.exe"
     )
 ]
 
@@ -0,0 +1,67 @@
+"""Açılış süresi ölçümü ve ağır modüllerin ertelenmiş yüklenmesi"""
+import importlib
+import time
+
+# Soğuk açılış için hedef süre (içe aktarma + arayüz kurulumu + ilk çizim)
+STARTUP_BUDGET_MS = 1500.0
+
+
+class LazyModule:
+    """İlk öznitelik erişiminde modülü içe aktaran vekil
+
+    pyautogui ve keyboard gibi içe aktarması pahalı modüller pencere
+    açılmadan önce değil, ilk kullanıldıklarında yüklenir.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    def load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+
+class StartupTimer:
+    """Açılış aşamalarının sürelerini kaydeder"""
+
+    def __init__(self, started=None):
+        self.started = time.perf_counter() if started is None else started
+        self.marks = []  # (aşama, bitiş zamanı)
+
+    def mark(self, phase):
+        """Bir aşamanın bittiğini kaydeder"""
+        self.marks.append((phase, time.perf_counter()))
+
+    def phases(self):
+        """Aşama başına milisaniye cinsinden süreleri döndürür"""
+        result = {}
+        previous = self.started
+        for phase, ended in self.marks:
+            result[phase] = (ended - previous) * 1000
+            previous = ended
+        return result
+
+    def total_ms(self):
+        if not self.marks:
+            return 0.0
+        return (self.marks[-1][1] - self.started) * 1000
+
+    def report(self, budget_ms=STARTUP_BUDGET_MS):
+        """Okunabilir açılış raporu ve bütçe içinde olup olmadığını döndürür"""
+        lines = ["Açılış süreleri:"]
+        for phase, elapsed in self.phases().items():
+            lines.append(f"  {phase:<12} {elapsed:8.1f} ms")
+        total = self.total_ms()
+        within = total <= budget_ms
+        lines.append(f"  {'toplam':<12} {total:8.1f} ms (bütçe {budget_ms:.0f} ms"
+                     f"{'' if within else ', AŞILDI'})")
+        return "\n".join(lines), within
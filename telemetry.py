@@ -0,0 +1,297 @@
+"""Adım başına çalışma ölçümleri ve gecikme histogramları
+
+Motor her adım için planlanan gecikmeyi (iki adımın planlanan zamanları
+arasındaki fark), gerçekleşen gecikmeyi (önceki adımın başlangıcından bu
+yana), giriş gönderme süresini ve planlanan zamandan sapmayı (overrun)
+önceden ayrılmış dizilere yazar. Halka doluysa en eski adımların üzerine
+yazılır; histogramlar ise tüm adımları set ve koordinat başına kapsar.
+
+Sonuçlar uzantıya göre CSV (adımlar), JSON (özet, histogramlar ve adımlar)
+veya Prometheus metin biçiminde (.prom, node exporter'ın textfile
+toplayıcısı için) yazılır:
+
+    python runner.py proje.json --telemetry adimlar.csv --telemetry /var/lib/node_exporter/autoclicker.prom
+"""
+import csv
+import json
+import os
+from array import array
+from bisect import bisect_left
+
+# Halkada tutulan en fazla adım sayısı (2'nin kuvveti)
+TELEMETRY_CAPACITY = 1 << 16
+# Histogram kova üst sınırları (ns); son kova sınırsızdır (+Inf)
+HISTOGRAM_BOUNDS_NS = (
+    100_000, 250_000, 500_000, 1_000_000, 2_500_000, 5_000_000, 10_000_000,
+    25_000_000, 50_000_000, 100_000_000, 250_000_000, 500_000_000, 1_000_000_000,
+    2_500_000_000,
+)
+# Set ve koordinat başına histogramı tutulan ölçümler
+HISTOGRAM_METRICS = ('overrun', 'dispatch')
+TELEMETRY_FORMATS = ('.csv', '.json', '.prom')
+PROMETHEUS_PREFIX = 'autoclicker'
+
+# StepTelemetry satırında bir ölçümün yeri: kovalar, adet, toplam, maks
+_BUCKETS = len(HISTOGRAM_BOUNDS_NS) + 1
+_METRIC_SIZE = _BUCKETS + 3
+
+_STEP_FIELDS = ('time_ns', 'set_id', 'coordinate', 'planned_ns', 'actual_ns', 'dispatch_ns',
+                'overrun_ns')
+
+
+class LatencyHistogram:
+    """Sabit kovalı gecikme histogramı"""
+    __slots__ = ('counts', 'count', 'sum_ns', 'max_ns')
+
+    def __init__(self):
+        self.counts = array('q', bytes(8 * (len(HISTOGRAM_BOUNDS_NS) + 1)))
+        self.count = 0
+        self.sum_ns = 0
+        self.max_ns = 0
+
+    def record(self, value_ns):
+        if value_ns < 0:
+            value_ns = 0
+        self.counts[bisect_left(HISTOGRAM_BOUNDS_NS, value_ns)] += 1
+        self.count += 1
+        self.sum_ns += value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+
+    def merge(self, other):
+        """other'ın sayımlarını bu histograma ekler"""
+        for bucket, count in enumerate(other.counts):
+            self.counts[bucket] += count
+        self.count += other.count
+        self.sum_ns += other.sum_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+
+    @classmethod
+    def from_row(cls, row, offset):
+        """StepTelemetry satırındaki offset'ten başlayan ölçümü histograma çevirir"""
+        histogram = cls()
+        end = offset + _BUCKETS
+        histogram.counts = array('q', row[offset:end])
+        histogram.count, histogram.sum_ns, histogram.max_ns = row[end:end + 3]
+        return histogram
+
+    def quantile(self, q):
+        """q. yüzdeliğin üst sınır tahmini (ns); son kovada gözlenen en büyük değer"""
+        if not self.count:
+            return 0
+        rank = q * self.count
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                if bucket < len(HISTOGRAM_BOUNDS_NS):
+                    return min(HISTOGRAM_BOUNDS_NS[bucket], self.max_ns)
+                break
+        return self.max_ns
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'sum_ms': self.sum_ns / 1e6,
+            'mean_ms': self.sum_ns / self.count / 1e6 if self.count else 0.0,
+            'p50_ms': self.quantile(0.5) / 1e6,
+            'p99_ms': self.quantile(0.99) / 1e6,
+            'max_ms': self.max_ns / 1e6,
+            'buckets': list(self.counts),
+        }
+
+
+class StepTelemetry:
+    """Adım ölçümlerinin önceden ayrılmış halkası ve histogramları
+
+    record motor thread'inden çağrılır; dışa aktarma çalışma bittikten
+    sonra yapılmalıdır. set_names verilirse dışa aktarmada set isimleri de
+    yazılır.
+    """
+
+    def __init__(self, capacity=TELEMETRY_CAPACITY):
+        if capacity & (capacity - 1):
+            raise ValueError("Telemetri kapasitesi 2'nin kuvveti olmalı")
+        self.capacity = capacity
+        self.mask = capacity - 1
+        self.times = array('q', bytes(8 * capacity))
+        self.set_ids = array('i', bytes(4 * capacity))
+        self.coordinates = array('i', bytes(4 * capacity))
+        self.planned = array('q', bytes(8 * capacity))
+        self.actual = array('q', bytes(8 * capacity))
+        self.dispatch = array('q', bytes(8 * capacity))
+        self.overrun = array('q', bytes(8 * capacity))
+        self.count = 0  # Kaydedilen toplam adım
+        # (set_id, koordinat) -> HISTOGRAM_METRICS sırasıyla ölçüm başına
+        # _METRIC_SIZE değerlik histogram satırı; set histogramları dışa
+        # aktarırken koordinatlarınkinden toplanır
+        self._rows = {}
+        self.set_names = {}
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    @property
+    def overwritten(self):
+        """Halkadan düşen (yalnızca histogramlarda kalan) adım sayısı"""
+        return max(0, self.count - self.capacity)
+
+    def record(self, time_ns, set_id, coordinate, planned_ns, actual_ns, dispatch_ns, overrun_ns):
+        """Bir adımın ölçümlerini kaydeder"""
+        i = self.count & self.mask
+        self.times[i] = time_ns
+        self.set_ids[i] = set_id
+        self.coordinates[i] = coordinate
+        self.planned[i] = planned_ns
+        self.actual[i] = actual_ns
+        self.dispatch[i] = dispatch_ns
+        self.overrun[i] = overrun_ns
+        self.count += 1
+
+        row = self._rows.get((set_id, coordinate))
+        if row is None:
+            row = self._rows[(set_id, coordinate)] = array('q', bytes(16 * _METRIC_SIZE))
+        if overrun_ns < 0:
+            overrun_ns = 0
+        row[bisect_left(HISTOGRAM_BOUNDS_NS, overrun_ns)] += 1
+        row[_BUCKETS] += 1
+        row[_BUCKETS + 1] += overrun_ns
+        if overrun_ns > row[_BUCKETS + 2]:
+            row[_BUCKETS + 2] = overrun_ns
+        row[_METRIC_SIZE + bisect_left(HISTOGRAM_BOUNDS_NS, dispatch_ns)] += 1
+        row[_METRIC_SIZE + _BUCKETS] += 1
+        row[_METRIC_SIZE + _BUCKETS + 1] += dispatch_ns
+        if dispatch_ns > row[_METRIC_SIZE + _BUCKETS + 2]:
+            row[_METRIC_SIZE + _BUCKETS + 2] = dispatch_ns
+
+    @property
+    def by_coordinate(self):
+        """(set_id, koordinat) -> {ölçüm: LatencyHistogram}"""
+        return {key: {metric: LatencyHistogram.from_row(row, n * _METRIC_SIZE)
+                      for n, metric in enumerate(HISTOGRAM_METRICS)}
+                for key, row in sorted(self._rows.items())}
+
+    @property
+    def by_set(self):
+        """set_id -> {ölçüm: LatencyHistogram}"""
+        result = {}
+        for (set_id, _), histograms in self.by_coordinate.items():
+            totals = result.get(set_id)
+            if totals is None:
+                result[set_id] = histograms
+            else:
+                for metric, histogram in histograms.items():
+                    totals[metric].merge(histogram)
+        return result
+
+    def steps(self):
+        """Halkadaki adımları eskiden yeniye (time_ns, set_id, koordinat, planned, actual, dispatch, overrun) olarak döndürür"""
+        mask = self.mask
+        for n in range(self.count - len(self), self.count):
+            i = n & mask
+            yield (self.times[i], self.set_ids[i], self.coordinates[i], self.planned[i],
+                   self.actual[i], self.dispatch[i], self.overrun[i])
+
+    def summary(self):
+        """Tüm adımların sapma ve gönderme süresi özeti (ms)"""
+        overrun, dispatch = LatencyHistogram(), LatencyHistogram()
+        for histograms in self.by_coordinate.values():
+            overrun.merge(histograms['overrun'])
+            dispatch.merge(histograms['dispatch'])
+        return {'steps': self.count, 'overrun': overrun.to_dict(), 'dispatch': dispatch.to_dict()}
+
+    def to_dict(self, include_steps=True):
+        data = {
+            'steps': self.count,
+            'overwritten': self.overwritten,
+            'bucket_bounds_ms': [bound / 1e6 for bound in HISTOGRAM_BOUNDS_NS],
+            'sets': {str(set_id): dict({metric: histogram.to_dict()
+                                        for metric, histogram in histograms.items()},
+                                       name=self.set_names.get(set_id, ''))
+                     for set_id, histograms in self.by_set.items()},
+            'coordinates': {f"{set_id}:{coordinate}": {metric: histogram.to_dict()
+                                                       for metric, histogram in histograms.items()}
+                            for (set_id, coordinate), histograms in self.by_coordinate.items()},
+        }
+        if include_steps:
+            data['step_fields'] = list(_STEP_FIELDS)
+            data['step_rows'] = [list(row) for row in self.steps()]
+        return data
+
+    def write_csv(self, stream):
+        writer = csv.writer(stream)
+        writer.writerow(_STEP_FIELDS)
+        writer.writerows(self.steps())
+
+    def write_json(self, stream):
+        json.dump(self.to_dict(), stream, ensure_ascii=False, indent=2)
+
+    def write_prometheus(self, stream, labels=None, prefix=PROMETHEUS_PREFIX):
+        """Histogramları Prometheus metin biçiminde yazar
+
+        labels her satıra eklenecek ek etiketlerdir (ör. {'display': ':1'});
+        aynı dizindeki birden fazla dosyanın satırları böylece çakışmaz.
+        """
+        extra = ''.join(f'{key}="{_escape(value)}",' for key, value in sorted((labels or {}).items()))
+        total_labels = f"{{{extra.rstrip(',')}}}" if extra else ''
+        lines = [f"# HELP {prefix}_steps_total Çalıştırılan adım sayısı",
+                 f"# TYPE {prefix}_steps_total counter",
+                 f"{prefix}_steps_total{total_labels} {self.count}"]
+        families = (
+            ('set', "Set başına",
+             [(f'set="{set_id}",name="{_escape(self.set_names.get(set_id, ""))}"', histograms)
+              for set_id, histograms in self.by_set.items()]),
+            ('step', "Koordinat başına",
+             [(f'set="{set_id}",coordinate="{coordinate}"', histograms)
+              for (set_id, coordinate), histograms in self.by_coordinate.items()]),
+        )
+        for scope, help_scope, series in families:
+            for metric in HISTOGRAM_METRICS:
+                name = f"{prefix}_{scope}_{metric}_seconds"
+                description = ("planlanan zamandan sapma" if metric == 'overrun'
+                               else "giriş gönderme süresi")
+                lines.append(f"# HELP {name} {help_scope} {description}")
+                lines.append(f"# TYPE {name} histogram")
+                for series_labels, histograms in series:
+                    histogram = histograms[metric]
+                    base = extra + series_labels
+                    cumulative = 0
+                    for bound, count in zip(HISTOGRAM_BOUNDS_NS, histogram.counts):
+                        cumulative += count
+                        lines.append(f'{name}_bucket{{{base},le="{bound / 1e9:g}"}} {cumulative}')
+                    lines.append(f'{name}_bucket{{{base},le="+Inf"}} {histogram.count}')
+                    lines.append(f"{name}_sum{{{base}}} {histogram.sum_ns / 1e9:.9f}")
+                    lines.append(f"{name}_count{{{base}}} {histogram.count}")
+        stream.write('\n'.join(lines) + '\n')
+
+    def export(self, path, labels=None):
+        """Uzantıya göre (TELEMETRY_FORMATS) dosyaya yazar
+
+        Dosya önce geçici adla yazılıp yerine taşınır; node exporter yarım
+        dosya okumaz.
+        """
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in TELEMETRY_FORMATS:
+            raise ValueError(f"Bilinmeyen telemetri biçimi: {extension or path}")
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8', newline='') as f:
+            if extension == '.csv':
+                self.write_csv(f)
+            elif extension == '.json':
+                self.write_json(f)
+            else:
+                self.write_prometheus(f, labels)
+        os.replace(temp_path, path)
+
+
+def _escape(value):
+    """Prometheus etiket değerindeki özel karakterleri kaçırır"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_telemetry_summary(summary):
+    """StepTelemetry.summary() özetini tek satırlık metne çevirir"""
+    overrun, dispatch = summary['overrun'], summary['dispatch']
+    return (f"Adım ölçümleri: {summary['steps']} adım, sapma p50 {overrun['p50_ms']:.2f} ms / "
+            f"p99 {overrun['p99_ms']:.2f} ms, gönderme p50 {dispatch['p50_ms']:.2f} ms / "
+            f"p99 {dispatch['p99_ms']:.2f} ms")